@@ -4,6 +4,11 @@ Graph Walk Navigator - KNN-based knowledge retrieval.
 This is Step 3.1 of Phase 3 - implements a k-Nearest Neighbor search on local
 embeddings to act as an FFN-style knowledge look-up, decoupling Attention
 from the Knowledge Store.
+
+Search backends:
+- "flat": exact brute-force cosine search over the normalized vector matrix
+- "ivf": pure-NumPy inverted-file ANN index (k-means coarse quantizer), used
+  when FAISS is not installed and the graph is too large for brute force
 """
 
 from __future__ import annotations
@@ -19,6 +24,13 @@ import numpy as np
 logger = logging.getLogger("lawnmower.graph_walk")
 
 DEFAULT_VECTOR_SIZE = 128
+INDEX_TYPES = ("flat", "ivf")
+DEFAULT_NPROBE = 8
+IVF_TRAIN_SAMPLE = 65536  # Max vectors used to train the coarse quantizer
+IVF_TRAIN_ITERATIONS = 10
+ASSIGN_BLOCK = 65536  # Rows scored per block when assigning vectors to lists
+FEATURE_HASH_SEED = 0x5EED5EED  # Default seed for the hashing-trick featurizer
+FEATURIZE_BLOCK = 4096  # Texts featurized per block to bound count-matrix memory
 
 # Optional FAISS support for >10k nodes
 try:
@@ -63,20 +75,285 @@ class RetrievalResult:
     distance: float = 0.0
 
 
+# ---------------------------------------------------------------------------
+# Deterministic hashing-trick featurizer
+# ---------------------------------------------------------------------------
+
+_U64 = np.uint64
+_SEPARATOR = 32  # Space between concatenated texts: never part of a trigram or word
+_IS_SPACE = np.zeros(0x110000, dtype=bool)  # Code point -> str.isspace() lookup table
+_IS_SPACE[[c for c in range(0x3001) if chr(c).isspace()]] = True
+
+
+def _fmix64(h: np.ndarray) -> np.ndarray:
+    """MurmurHash3 64-bit finalizer, applied element-wise in place (wraps modulo 2**64)."""
+    h ^= h >> _U64(33)
+    h *= _U64(0xFF51AFD7ED558CCD)
+    h ^= h >> _U64(33)
+    h *= _U64(0xC4CEB9FE1A85EC53)
+    h ^= h >> _U64(33)
+    return h
+
+
+def hash_featurize(texts: list[str], dim: int, seed: int = FEATURE_HASH_SEED) -> np.ndarray:
+    """
+    Featurize texts into an (n, dim) float32 matrix of hashed n-gram frequencies.
+
+    Features are lower-cased character 3-grams plus whitespace-separated words,
+    bucketed by a seeded MurmurHash3-style mix of their code points and
+    normalized by the feature count per text. Unlike the builtin ``hash()``, the
+    result is identical across processes, so saved indexes stay queryable.
+    """
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    for lo in range(0, len(texts), FEATURIZE_BLOCK):
+        block = texts[lo : lo + FEATURIZE_BLOCK]
+        matrix[lo : lo + len(block)] = _hash_featurize_block(block, dim, seed)
+    return matrix
+
+
+def _hash_featurize_block(texts: list[str], dim: int, seed: int) -> np.ndarray:
+    n = len(texts)
+    if n == 0:
+        return np.zeros((0, dim), dtype=np.float32)
+
+    # One code-point array for the whole block, texts separated by a space
+    lowered = [text.lower() for text in texts]
+    codes = np.frombuffer(
+        " ".join(lowered).encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32
+    )
+    lengths = np.fromiter((len(t) for t in lowered), dtype=np.int64, count=n)
+    doc_of = np.repeat(np.arange(n, dtype=np.int64), lengths + 1)[: len(codes)]
+    doc_of[np.cumsum(lengths + 1)[:-1] - 1] = -1  # separator positions belong to no text
+
+    seed64 = _U64(seed)
+    rows_parts, hash_parts = [], []
+
+    # Character 3-grams: code points are < 2**21, so three pack into one word
+    if len(codes) >= 3:
+        c = codes.astype(_U64)
+        packed = c[1:-1] << _U64(21)
+        packed ^= c[:-2]
+        packed ^= c[2:] << _U64(42)
+        packed ^= seed64
+        valid = doc_of[:-2] == doc_of[2:]
+        valid &= doc_of[:-2] >= 0
+        rows_parts.append(doc_of[:-2][valid])
+        hash_parts.append(_fmix64(packed[valid]))
+
+    # Words: hash each (code point, position) then XOR-reduce per word
+    is_word = ~_IS_SPACE[codes]
+    if is_word.any():
+        starts = is_word & ~np.concatenate(([False], is_word[:-1]))
+        word_idx = np.flatnonzero(is_word)
+        start_idx = np.flatnonzero(starts)
+        word_of = np.cumsum(starts)[word_idx] - 1
+        position = (word_idx - start_idx[word_of]).astype(_U64)
+        position <<= _U64(21)
+        position ^= codes[word_idx]
+        position ^= seed64
+        char_hash = _fmix64(position)
+        segment_starts = np.searchsorted(word_idx, start_idx)
+        word_hash = np.bitwise_xor.reduceat(char_hash, segment_starts)
+        word_len = np.diff(np.append(segment_starts, len(word_idx))).astype(_U64)
+        rows_parts.append(doc_of[start_idx])
+        word_len <<= _U64(48)
+        word_len ^= word_hash
+        word_len ^= ~seed64
+        hash_parts.append(_fmix64(word_len))
+
+    if not rows_parts:
+        return np.zeros((n, dim), dtype=np.float32)
+
+    rows = np.concatenate(rows_parts)
+    buckets = (np.concatenate(hash_parts) % _U64(dim)).astype(np.int64)
+    counts = np.bincount(rows * dim + buckets, minlength=n * dim).reshape(n, dim)
+    totals = counts.sum(axis=1, keepdims=True)
+    return (counts / np.maximum(totals, 1)).astype(np.float32)
+
+
+class IVFIndex:
+    """
+    Pure-NumPy inverted-file index for approximate cosine search.
+
+    A spherical k-means quantizer splits unit vectors into ``nlist`` cells. Each
+    cell keeps a posting list of row numbers into the caller's vector matrix, so
+    a query only scores the rows in its ``nprobe`` closest cells. New rows are
+    assigned to their nearest centroid without retraining.
+    """
+
+    def __init__(self, dim: int, nlist: int, nprobe: int = DEFAULT_NPROBE, seed: int = 0):
+        self.dim = dim
+        self.nlist = max(1, nlist)
+        self.nprobe = max(1, nprobe)
+        self.seed = seed
+        self.centroids = np.zeros((0, dim), dtype=np.float32)
+        self.assignments = np.zeros(0, dtype=np.int32)
+        self._lists: list[np.ndarray] = []
+        self._list_sizes = np.zeros(0, dtype=np.int64)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids.shape[0] > 0
+
+    @property
+    def ntotal(self) -> int:
+        return int(self.assignments.shape[0])
+
+    def train(self, vectors: np.ndarray) -> None:
+        """Fit the coarse quantizer on (a sample of) unit-normalized vectors."""
+        n = vectors.shape[0]
+        if n == 0:
+            raise ValueError("Cannot train IVF index on an empty matrix")
+
+        rng = np.random.default_rng(self.seed)
+        sample = vectors
+        if n > IVF_TRAIN_SAMPLE:
+            sample = vectors[rng.choice(n, IVF_TRAIN_SAMPLE, replace=False)]
+
+        nlist = min(self.nlist, sample.shape[0])
+        centroids = sample[rng.choice(sample.shape[0], nlist, replace=False)].copy()
+
+        for _ in range(IVF_TRAIN_ITERATIONS):
+            labels = self._nearest(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=nlist)
+
+            # Re-seed empty cells from random points so every list stays useful
+            empty = np.flatnonzero(counts == 0)
+            if len(empty):
+                sums[empty] = sample[rng.choice(sample.shape[0], len(empty), replace=False)]
+
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = (sums / np.maximum(norms, 1e-12)).astype(np.float32)
+
+        self.centroids = centroids
+        self.nlist = nlist
+        self.reset()
+
+    def reset(self) -> None:
+        """Empty all posting lists, keeping the trained centroids."""
+        self.assignments = np.zeros(0, dtype=np.int32)
+        self._lists = [np.zeros(16, dtype=np.int64) for _ in range(self.nlist)]
+        self._list_sizes = np.zeros(self.nlist, dtype=np.int64)
+
+    def add(self, vectors: np.ndarray, start_row: int) -> None:
+        """Assign rows ``start_row .. start_row + len(vectors)`` to their nearest cell."""
+        if not self.is_trained:
+            raise RuntimeError("IVF index must be trained before adding vectors")
+        if start_row != self.ntotal:
+            raise ValueError(f"Rows must be appended in order (expected {self.ntotal})")
+        self._append(self._nearest(vectors, self.centroids), start_row)
+
+    def _append(self, labels: np.ndarray, start_row: int) -> None:
+        rows = np.arange(start_row, start_row + len(labels), dtype=np.int64)
+        self.assignments = np.concatenate([self.assignments, labels.astype(np.int32)])
+
+        order = np.argsort(labels, kind="stable")
+        cells, starts = np.unique(labels[order], return_index=True)
+        bounds = np.append(starts, len(order))
+        for cell, lo, hi in zip(cells, bounds[:-1], bounds[1:], strict=True):
+            new_rows = rows[order[lo:hi]]
+            size = self._list_sizes[cell]
+            needed = size + len(new_rows)
+            posting = self._lists[cell]
+            if needed > len(posting):
+                grown = np.empty(max(needed, 2 * len(posting)), dtype=np.int64)
+                grown[:size] = posting[:size]
+                self._lists[cell] = posting = grown
+            posting[size:needed] = new_rows
+            self._list_sizes[cell] = needed
+
+    def search(
+        self, matrix: np.ndarray, query: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return (similarities, rows) of the top-k rows among the probed cells."""
+        if not self.is_trained or self.ntotal == 0 or k <= 0:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int64)
+
+        cell_scores = self.centroids @ query
+        nprobe = min(self.nprobe, self.nlist)
+        probe = np.argpartition(-cell_scores, nprobe - 1)[:nprobe]
+        candidates = np.concatenate(
+            [self._lists[c][: self._list_sizes[c]] for c in probe if self._list_sizes[c]]
+            or [np.zeros(0, dtype=np.int64)]
+        )
+        if len(candidates) == 0:
+            return np.zeros(0, dtype=np.float32), candidates
+
+        scores = matrix[candidates] @ query
+        if len(candidates) > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            scores, candidates = scores[keep], candidates[keep]
+        order = np.argsort(-scores, kind="stable")
+        return scores[order], candidates[order]
+
+    @staticmethod
+    def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Index of the most similar centroid per row, scored in bounded blocks."""
+        labels = np.empty(vectors.shape[0], dtype=np.int64)
+        for lo in range(0, vectors.shape[0], ASSIGN_BLOCK):
+            block = vectors[lo : lo + ASSIGN_BLOCK]
+            labels[lo : lo + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        return labels
+
+    def save(self, path: str) -> None:
+        """Persist centroids and row assignments (posting lists are rebuilt on load)."""
+        np.savez(
+            path,
+            centroids=self.centroids,
+            assignments=self.assignments,
+            config=np.array([self.dim, self.nlist, self.nprobe, self.seed], dtype=np.int64),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> IVFIndex:
+        """Load an index written by :meth:`save`."""
+        with np.load(path) as data:
+            dim, nlist, nprobe, seed = (int(v) for v in data["config"])
+            index = cls(dim, nlist, nprobe=nprobe, seed=seed)
+            index.centroids = data["centroids"].astype(np.float32)
+            index.reset()
+            index._append(data["assignments"].astype(np.int64), 0)
+        return index
+
+
 class GraphWalkKNNOps:
     """
     Implements k-Nearest Neighbor search on local knowledge embeddings.
 
     Acts as an external "FFN" (Feed-Forward Network) knowledge look-up
     that decouples retrieval from the LLM's attention mechanism.
+
+    ``index_type="ivf"`` swaps the brute-force scan for an approximate
+    :class:`IVFIndex`. Once an index is built, new nodes are appended to it
+    incrementally instead of triggering a full rebuild.
     """
 
-    def __init__(self, vector_size: int = DEFAULT_VECTOR_SIZE, index_file: str | None = None):
+    def __init__(
+        self,
+        vector_size: int = DEFAULT_VECTOR_SIZE,
+        index_file: str | None = None,
+        *,
+        index_type: str = "flat",
+        nlist: int | None = None,
+        nprobe: int = DEFAULT_NPROBE,
+        hash_seed: int = FEATURE_HASH_SEED,
+    ):
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {INDEX_TYPES}, got {index_type!r}")
         self.vector_size = vector_size
         self.index_file = index_file
+        self.index_type = index_type
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.hash_seed = hash_seed
         self.nodes: dict[str, KnowledgeNode] = {}
-        self.node_vectors: list[np.ndarray] = []
         self.node_ids: list[str] = []
+        self.vector_matrix = np.zeros((0, vector_size), dtype=np.float32)
+        self._matrix_buffer = self.vector_matrix
+        self._row_of: dict[str, int] = {}
+        self._ann: IVFIndex | None = None
         self._indexed = False
 
     def add_node(
@@ -108,8 +385,13 @@ class GraphWalkKNNOps:
             metadata=metadata or {},
         )
 
+        replaced = node_id in self.nodes
         self.nodes[node_id] = node
-        self._indexed = False
+
+        if self._indexed and not replaced and len(self.node_ids) == len(self.nodes) - 1:
+            self._append_to_index(node_id, vector)
+        else:
+            self._indexed = False
 
     def add_nodes_from_directory(
         self, directory: str, extensions: list[str] | None = None, max_nodes: int = 1000
@@ -117,7 +399,7 @@ class GraphWalkKNNOps:
         """Add knowledge nodes from all files in a directory."""
         if extensions is None:
             extensions = [".txt", ".md", ".log"]
-        count = 0
+        pending: list[dict[str, Any]] = []
 
         for root, _, files in os.walk(directory):
             for file in files:
@@ -132,27 +414,39 @@ class GraphWalkKNNOps:
                     chunks = self._chunk_text(content, chunk_size=512)
 
                     for i, chunk in enumerate(chunks):
-                        node_id = f"{file}_{i}"
-                        self.add_node(
-                            node_id=node_id,
-                            content=chunk["text"],
-                            node_type="chunk",
-                            source_file=file_path,
-                            trust_score=0.8,
-                            metadata={
-                                "chunk_index": i,
-                                "total_chunks": len(chunks),
-                            },
+                        pending.append(
+                            {
+                                "node_id": f"{file}_{i}",
+                                "content": chunk["text"],
+                                "source_file": file_path,
+                                "metadata": {"chunk_index": i, "total_chunks": len(chunks)},
+                            }
                         )
-                        count += 1
-
-                        if count >= max_nodes:
-                            logger.warning(f"Reached max_nodes limit: {max_nodes}")
-                            return
+                        if len(pending) >= max_nodes:
+                            break
 
                 except Exception as e:
                     logger.warning(f"Failed to read {file_path}: {e}")
 
+                if len(pending) >= max_nodes:
+                    logger.warning(f"Reached max_nodes limit: {max_nodes}")
+                    break
+            if len(pending) >= max_nodes:
+                break
+
+        # Featurize every chunk in one vectorized pass
+        vectors = self.texts_to_matrix([p["content"] for p in pending])
+        for p, vector in zip(pending, vectors, strict=True):
+            self.add_node(
+                node_id=p["node_id"],
+                content=p["content"],
+                vector=vector.tolist(),
+                node_type="chunk",
+                source_file=p["source_file"],
+                trust_score=0.8,
+                metadata=p["metadata"],
+            )
+
     def _chunk_text(self, text: str, chunk_size: int = 512) -> list[dict[str, Any]]:
         """Split text into chunks."""
         chunks = []
@@ -168,72 +462,77 @@ class GraphWalkKNNOps:
         return chunks
 
     def _text_to_vector(self, text: str) -> list[float]:
-        """Convert text to optimized embedding vector using n-gram features."""
+        """Convert text to a hashed n-gram embedding vector (stable across processes)."""
         if not text:
             return [0.0] * self.vector_size
+        return self.texts_to_matrix([text])[0].tolist()
 
-        # Use word + character n-grams for richer representation
-        words = text.lower().split()
-
-        # Character 3-gram counts (faster than word tokens)
-        char_ngrams = {}
-        for i in range(len(text) - 2):
-            ngram = text[i : i + 3].lower()
-            char_ngrams[ngram] = char_ngrams.get(ngram, 0) + 1
-
-        # Word unigrams
-        for w in words:
-            char_ngrams[w] = char_ngrams.get(w, 0) + 1
-
-        # Normalize to vector
-        total = sum(char_ngrams.values())
-        if total == 0:
-            return [0.0] * self.vector_size
-
-        # Create sparse vector for efficiency
-        indices = []
-        values = []
-        for idx, (hash_key, count) in enumerate(char_ngrams.items()):
-            indices.append(hash(hash_key) % self.vector_size)
-            values.append(count / total)
-            if len(indices) >= self.vector_size:
-                break
+    def texts_to_matrix(self, texts: list[str]) -> np.ndarray:
+        """Featurize many texts at once into an (n, vector_size) float32 matrix."""
+        return hash_featurize(texts, self.vector_size, seed=self.hash_seed)
 
-        # Fill vector
-        vector = [0.0] * self.vector_size
-        for i, v in zip(indices[: self.vector_size], values[: self.vector_size], strict=True):
-            vector[i % self.vector_size] += v
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """Scale rows to unit length, leaving zero rows untouched."""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms > 0, norms, 1.0)
 
-        return vector[: self.vector_size]
+    def _default_nlist(self, n: int) -> int:
+        return self.nlist or max(1, int(np.sqrt(n)))
 
     def build_index(self):
         """Build optimized index with pre-normalized vectors."""
-        self.node_ids = list(self.nodes.keys())
+        self._build_matrix()
 
-        # Pre-compute normalized vectors for faster search
-        self.node_vectors = []
-        self.node_norms = []
-
-        for nid in self.node_ids:
-            vec = np.array(self.nodes[nid].vector)
-            norm = np.linalg.norm(vec)
-            # Store normalized to avoid repeated normalization
-            if norm > 0:
-                vec = vec / norm
-            self.node_vectors.append(vec)
-            self.node_norms.append(norm)
-
-        # Convert to single matrix for batch operations
-        self.vector_matrix = (
-            np.array(self.node_vectors)
-            if self.node_vectors
-            else np.array([]).reshape(0, self.vector_size)
-        )
+        if self.index_type == "ivf" and self.node_ids:
+            self._ann = IVFIndex(
+                self.vector_size, self._default_nlist(len(self.node_ids)), nprobe=self.nprobe
+            )
+            self._ann.train(self.vector_matrix)
+            self._ann.add(self.vector_matrix, 0)
 
         self._indexed = True
         logger.info(
-            f"Built optimized index for {len(self.node_ids)} nodes ({self.vector_matrix.shape})"
+            f"Built {self.index_type} index for {len(self.node_ids)} nodes "
+            f"({self.vector_matrix.shape})"
+        )
+
+    def _build_matrix(self) -> None:
+        """Stack all node vectors into the normalized search matrix."""
+        self.node_ids = list(self.nodes.keys())
+        self._row_of = {nid: row for row, nid in enumerate(self.node_ids)}
+
+        # Pre-normalize once so search is a single matrix-vector product
+        raw = np.array([self.nodes[nid].vector for nid in self.node_ids], dtype=np.float32).reshape(
+            len(self.node_ids), self.vector_size
         )
+        self.node_norms = np.linalg.norm(raw, axis=1)
+        self._matrix_buffer = self._normalize_rows(raw)
+        self.vector_matrix = self._matrix_buffer
+        self._ann = None
+
+    def _append_to_index(self, node_id: str, vector: list[float]) -> None:
+        """Append one node to a built index without rebuilding it."""
+        if self.index_type == "ivf" and (self._ann is None or not self._ann.is_trained):
+            self._indexed = False
+            return
+
+        row = len(self.node_ids)
+        if row == self._matrix_buffer.shape[0]:
+            grown = np.zeros((max(16, 2 * row), self.vector_size), dtype=np.float32)
+            grown[:row] = self._matrix_buffer[:row]
+            self._matrix_buffer = grown
+
+        vec = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        self._matrix_buffer[row] = vec / norm if norm > 0 else vec
+        self.vector_matrix = self._matrix_buffer[: row + 1]
+        self.node_norms = np.append(self.node_norms, norm)
+        self.node_ids.append(node_id)
+        self._row_of[node_id] = row
+
+        if self._ann is not None:
+            self._ann.add(self.vector_matrix[row : row + 1], row)
 
     def knn_search(
         self, query: str, k: int = 5, min_similarity: float = 0.0
@@ -252,48 +551,46 @@ class GraphWalkKNNOps:
         if not self.nodes:
             return []
 
+        return self.knn_search_vector(
+            self._text_to_vector(query)[: self.vector_size], k=k, min_similarity=min_similarity
+        )
+
+    def knn_search_vector(
+        self, query_vector: list[float] | np.ndarray, k: int = 5, min_similarity: float = 0.0
+    ) -> list[RetrievalResult]:
+        """KNN search for a precomputed query vector (same size as the index)."""
+        if not self.nodes or k <= 0:
+            return []
+
         if not self._indexed:
             self.build_index()
 
-        # Vectorize query
-        query_vector = np.array(self._text_to_vector(query)[: self.vector_size])
-
-        # Pre-normalize query
-        query_norm = np.linalg.norm(query_vector)
+        query = np.asarray(query_vector, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
         if query_norm == 0:
             return []
+        query = query / query_norm
+
+        if self._ann is not None:
+            similarities, rows = self._ann.search(self.vector_matrix, query, k)
+        else:
+            # Batch compute all similarities at once, then partial top-k selection
+            all_sims = self.vector_matrix @ query
+            rows = np.arange(len(all_sims))
+            if len(all_sims) > k:
+                rows = np.argpartition(-all_sims, k - 1)[:k]
+            rows = rows[np.argsort(-all_sims[rows], kind="stable")]
+            similarities = all_sims[rows]
+
+        results = []
+        for sim, row in zip(similarities, rows, strict=True):
+            sim = float(sim)
+            if sim < min_similarity:
+                continue
+            node = self.nodes[self.node_ids[int(row)]]
+            results.append(RetrievalResult(node=node, similarity=sim, distance=1.0 - sim))
 
-        query_vector_norm = query_vector / query_norm
-
-        # Batch compute all similarities at once (faster than loop)
-        if self.vector_matrix.shape[0] > 0:
-            # Matrix multiplication for all vectors at once
-            similarities = np.dot(self.vector_matrix, query_vector_norm)
-
-            # Get top-k indices
-            top_k_indices = np.argsort(similarities)[-k:][::-1]
-
-            results = []
-            for idx in top_k_indices:
-                sim = float(similarities[idx])
-                if sim < min_similarity:
-                    continue
-
-                node_id = self.node_ids[idx]
-                node = self.nodes[node_id]
-                dist = 1.0 - sim
-
-                results.append(
-                    RetrievalResult(
-                        node=node,
-                        similarity=sim,
-                        distance=dist,
-                    )
-                )
-
-        results.sort(key=lambda x: x.similarity, reverse=True)
-
-        return results[:k]
+        return results
 
     def graph_walk_retrieval(
         self, query: str, k: int = 5, max_hops: int = 3, trust_threshold: float = 0.3
@@ -346,10 +643,20 @@ class GraphWalkKNNOps:
 
         return walked_results
 
+    @staticmethod
+    def _ann_path(index_path: str) -> str:
+        """Side-car file holding the IVF quantizer next to a JSON index."""
+        return f"{os.path.splitext(index_path)[0]}.ivf.npz"
+
     def save_index(self, output_path: str):
-        """Save the index to disk."""
+        """Save the index to disk (plus the IVF quantizer when one is built)."""
+        if not self._indexed:
+            self.build_index()
+
         data = {
             "vector_size": self.vector_size,
+            "index_type": self.index_type,
+            "hash_seed": self.hash_seed,
             "nodes": [
                 {
                     "id": node.id,
@@ -360,21 +667,26 @@ class GraphWalkKNNOps:
                     "trust_score": node.trust_score,
                     "metadata": node.metadata,
                 }
-                for node in self.nodes.values()
+                for node in (self.nodes[nid] for nid in self.node_ids)
             ],
         }
 
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(data, f)
 
+        if self._ann is not None:
+            self._ann.save(self._ann_path(output_path))
+
         logger.info(f"Saved index with {len(self.nodes)} nodes to {output_path}")
 
     def load_index(self, input_path: str):
-        """Load the index from disk."""
+        """Load the index from disk, reusing a saved IVF quantizer if present."""
         with open(input_path, encoding="utf-8") as f:
             data = json.load(f)
 
         self.vector_size = data.get("vector_size", DEFAULT_VECTOR_SIZE)
+        self.index_type = data.get("index_type", self.index_type)
+        self.hash_seed = data.get("hash_seed", self.hash_seed)
 
         for node_data in data.get("nodes", []):
             self.add_node(
@@ -387,7 +699,20 @@ class GraphWalkKNNOps:
                 metadata=node_data.get("metadata", {}),
             )
 
-        self.build_index()
+        ann_path = self._ann_path(input_path)
+        ann = IVFIndex.load(ann_path) if os.path.exists(ann_path) else None
+        if (
+            self.index_type == "ivf"
+            and ann is not None
+            and ann.ntotal == len(self.nodes)
+            and ann.dim == self.vector_size
+        ):
+            # Restore the trained quantizer instead of re-running k-means
+            self._build_matrix()
+            self._ann = ann
+            self._indexed = True
+        else:
+            self.build_index()
         logger.info(f"Loaded index with {len(self.nodes)} nodes from {input_path}")
 
     def get_stats(self) -> dict[str, Any]:
@@ -405,6 +730,8 @@ class GraphWalkKNNOps:
             "node_types": node_types,
             "avg_trust_score": sum(trust_scores) / len(trust_scores) if trust_scores else 0,
             "indexed": self._indexed,
+            "index_type": self.index_type,
+            "ivf_lists": self._ann.nlist if self._ann is not None else 0,
         }
 
 
@@ -549,6 +876,10 @@ if FAISS_AVAILABLE:
                 f"backend={'IVF' if self.use_ivf else 'Flat'}"
             )
 
+        def _append_to_index(self, node_id: str, vector: list[float]) -> None:
+            """FAISS indexes are rebuilt on the next search rather than appended to."""
+            self._indexed = False
+
         def knn_search(
             self, query: str, k: int = 5, min_similarity: float = 0.0
         ) -> list[RetrievalResult]:
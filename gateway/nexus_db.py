@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
+import re
 import sqlite3
 import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +21,38 @@ logger = logging.getLogger("lawnmower.nexus")
 # ---------------------------------------------------------------------------
 _DEFAULT_DATA_DIR = str(Path(__file__).resolve().parent.parent / "data")
 
+# Reader pool / writer queue tuning
+DEFAULT_POOL_SIZE = 8
+POOL_CHECKOUT_TIMEOUT = 30.0  # seconds a query waits for a free reader
+WRITE_BATCH_MAX = 256  # statements folded into one group commit
+BUSY_TIMEOUT = 5.0
+
+# High-throughput PRAGMAs applied to every connection (writer and readers)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA cache_size=-64000;",  # 64MB memory page cache
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",  # 256MB mmap space
+)
+
+# Statements SQLite refuses (or that make no sense) inside a write transaction
+_NON_TRANSACTIONAL_RE = re.compile(
+    r"^\s*(BEGIN|COMMIT|END|ROLLBACK|SAVEPOINT|RELEASE|VACUUM|ATTACH|DETACH|PRAGMA)\b",
+    re.IGNORECASE,
+)
+
+
+class _WriteRequest:
+    """One queued write waiting for a group commit."""
+
+    __slots__ = ("done", "error", "params", "sql")
+
+    def __init__(self, sql: str, params: tuple):
+        self.sql = sql
+        self.params = params
+        self.error: BaseException | None = None
+        self.done = False
+
 
 class ForensicNexus:
     """
@@ -22,32 +60,61 @@ class ForensicNexus:
     Provides a single entry point for all forensic data across laboratory,
     provenance, and analytics databases.
 
+    Reads run on a pool of WAL reader connections (each with the same ATTACH
+    set and PRAGMAs), so concurrent queries do not serialize on one handle.
+    Writes go through a single writer connection: callers enqueue statements
+    and whichever caller holds the writer lock commits every pending
+    statement in one transaction (group commit), with a savepoint per
+    statement so one failure does not discard the others.
+
     TODO: The SQLite Nexus is intended as a local-dev / single-node store.
     The postgres service in docker-compose.yaml should be promoted to the
     primary store for multi-container writes; SQLite WAL mode does not scale
     well when multiple Docker containers share the same file over a volume.
     """
 
-    def __init__(self, base_dir: str | None = None):
+    def __init__(self, base_dir: str | None = None, pool_size: int = DEFAULT_POOL_SIZE):
         # Prefer explicit arg → env var → project-relative default
         self.base_dir = base_dir or os.environ.get("SME_DATA_DIR") or _DEFAULT_DATA_DIR
         self.primary_path = os.path.normpath(os.path.join(self.base_dir, "forensic_nexus.db"))
+        self.pool_size = max(1, pool_size)
 
         # Ensure directories exist
         os.makedirs(os.path.dirname(self.primary_path), exist_ok=True)
 
-        # Connect to master DB
-        self.conn = sqlite3.connect(self.primary_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # Schemas replayed on every reader connection: {schema: abs_path}
+        self._attachments: dict[str, str] = {}
+        self._attach_generation = 0
+
+        # Reader pool
+        self._idle_readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._reader_generation: dict[int, int] = {}
+        self._pool_lock = threading.Lock()
+        self._readers_open = 0
+        self._checkouts = 0
+        self._checkout_wait_total = 0.0
+        self._checkout_wait_max = 0.0
+        self._checkout_timeouts = 0
+
+        # Writer queue
+        self._writer_lock = threading.Lock()
+        self._pending_writes: deque[_WriteRequest] = deque()
+        self._pending_lock = threading.Lock()
+        self._writes = 0
+        self._write_batches = 0
+        self._write_batch_max = 0
+        self._write_wait_total = 0.0
+
+        # Connect to master DB (the single writer connection). Transactions are
+        # managed explicitly by the group commit, hence autocommit mode.
+        self.conn = self._connect()
 
         # Enable Write-Ahead Logging & high-throughput PRAGMAs for 10GB dataset scale
         cursor = self.conn.cursor()
         try:
             cursor.execute("PRAGMA journal_mode=WAL;")
-            cursor.execute("PRAGMA synchronous=NORMAL;")
-            cursor.execute("PRAGMA cache_size=-64000;")  # 64MB memory page cache
-            cursor.execute("PRAGMA temp_store=MEMORY;")
-            cursor.execute("PRAGMA mmap_size=268435456;")  # 256MB mmap space
+            for pragma in _CONNECTION_PRAGMAS:
+                cursor.execute(pragma)
         except Exception as e:
             logger.warning(f"Nexus: Failed to set performance PRAGMAs: {e}")
         finally:
@@ -57,6 +124,16 @@ class ForensicNexus:
         self._attach_subordinates()
         self._ensure_indexes()
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.primary_path,
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=BUSY_TIMEOUT,
+        )
+        conn.row_factory = sqlite3.Row
+        return conn
+
     def _attach_subordinates(self):
         databases = {
             "lab": os.path.normpath(os.path.join(self.base_dir, "storage", "laboratory.db")),
@@ -75,19 +152,30 @@ class ForensicNexus:
                     with sqlite3.connect(abs_path):
                         pass
 
-                cursor = self.conn.cursor()
-                try:
-                    cursor.execute("PRAGMA database_list")
-                    attached = [row[1] for row in cursor.fetchall()]
-                    if schema not in attached:
-                        # Use the same cursor to ATTACH
-                        cursor.execute(f"ATTACH DATABASE '{abs_path}' AS {schema}")
-                        logger.info(f"Nexus: Attached {schema} from {abs_path}")
-                finally:
-                    cursor.close()
+                with self._writer_lock:
+                    cursor = self.conn.cursor()
+                    try:
+                        cursor.execute("PRAGMA database_list")
+                        attached = [row[1] for row in cursor.fetchall()]
+                        if schema not in attached:
+                            # Use the same cursor to ATTACH
+                            cursor.execute(f"ATTACH DATABASE '{abs_path}' AS {schema}")
+                            logger.info(f"Nexus: Attached {schema} from {abs_path}")
+                        # Readers must not block the writer on subordinate files either
+                        cursor.execute(f"PRAGMA {schema}.journal_mode=WAL")
+                    finally:
+                        cursor.close()
+                self._register_attachment(schema, abs_path)
             except Exception as e:
                 logger.warning(f"Nexus: Failed to attach {schema} ({abs_path}): {e}")
 
+    def _register_attachment(self, schema: str, abs_path: str):
+        """Record an ATTACH so pooled readers replay it on their next checkout."""
+        with self._pool_lock:
+            if self._attachments.get(schema) != abs_path:
+                self._attachments[schema] = abs_path
+                self._attach_generation += 1
+
     def _ensure_indexes(self):
         """Create indexes on attached schemas to accelerate cross-database JOINs."""
         index_queries = [
@@ -102,10 +190,23 @@ class ForensicNexus:
                 pass
 
     def close(self):
-        """Close the database connection."""
+        """Close the writer and all idle reader connections."""
         if hasattr(self, "conn") and self.conn:
+            with self._writer_lock:
+                try:
+                    self.conn.close()
+                except Exception:
+                    pass
+        while True:
+            try:
+                reader = self._idle_readers.get_nowait()
+            except queue.Empty:
+                break
+            with self._pool_lock:
+                self._readers_open -= 1
+                self._reader_generation.pop(id(reader), None)
             try:
-                self.conn.close()
+                reader.close()
             except Exception:
                 pass
 
@@ -121,46 +222,204 @@ class ForensicNexus:
             if not all(c.isalnum() or c == "_" for c in schema_name):
                 raise ValueError(f"Invalid schema name: {schema_name}")
 
-            cursor = self.conn.cursor()
-            try:
-                cursor.execute(f"ATTACH DATABASE '{abs_path}' AS {schema_name}")
-                logger.info(f"Nexus: Dynamically attached {schema_name} from {abs_path}")
-            finally:
-                cursor.close()
+            with self._writer_lock:
+                cursor = self.conn.cursor()
+                try:
+                    cursor.execute(f"ATTACH DATABASE '{abs_path}' AS {schema_name}")
+                    logger.info(f"Nexus: Dynamically attached {schema_name} from {abs_path}")
+                finally:
+                    cursor.close()
+            self._register_attachment(schema_name, abs_path)
         except Exception as e:
             if "already in use" in str(e):
                 return  # Already attached — not an error
             logger.exception(f"Nexus Attach Error: {e}")
             raise
 
+    # ------------------------------------------------------------------
+    # Reader pool
+    # ------------------------------------------------------------------
+
+    def _open_reader(self) -> sqlite3.Connection:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            for pragma in _CONNECTION_PRAGMAS:
+                cursor.execute(pragma)
+        except Exception as e:
+            logger.warning(f"Nexus: Failed to set reader PRAGMAs: {e}")
+        finally:
+            cursor.close()
+        self._reader_generation[id(conn)] = 0
+        return conn
+
+    def _sync_attachments(self, conn: sqlite3.Connection):
+        """Bring a reader's ATTACH set up to date with the writer's."""
+        with self._pool_lock:
+            generation = self._attach_generation
+            attachments = dict(self._attachments)
+        if self._reader_generation.get(id(conn)) == generation:
+            return
+
+        cursor = conn.cursor()
+        try:
+            attached = {row[1] for row in cursor.execute("PRAGMA database_list")}
+            for schema, abs_path in attachments.items():
+                if schema not in attached:
+                    try:
+                        cursor.execute(f"ATTACH DATABASE '{abs_path}' AS {schema}")
+                    except Exception as e:
+                        logger.warning(f"Nexus: Reader failed to attach {schema}: {e}")
+        finally:
+            cursor.close()
+        self._reader_generation[id(conn)] = generation
+
+    def _checkout_reader(self) -> sqlite3.Connection:
+        started = time.perf_counter()
+        try:
+            conn = self._idle_readers.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._pool_lock:
+                create = self._readers_open < self.pool_size
+                if create:
+                    self._readers_open += 1
+            if create:
+                try:
+                    conn = self._open_reader()
+                except Exception:
+                    with self._pool_lock:
+                        self._readers_open -= 1
+                    raise
+            else:
+                try:
+                    conn = self._idle_readers.get(timeout=POOL_CHECKOUT_TIMEOUT)
+                except queue.Empty:
+                    with self._pool_lock:
+                        self._checkout_timeouts += 1
+                    raise TimeoutError(
+                        f"No Nexus reader available after {POOL_CHECKOUT_TIMEOUT}s"
+                    ) from None
+
+        waited = time.perf_counter() - started
+        with self._pool_lock:
+            self._checkouts += 1
+            self._checkout_wait_total += waited
+            self._checkout_wait_max = max(self._checkout_wait_max, waited)
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read connection with the current ATTACH set."""
+        conn = self._checkout_reader()
+        try:
+            self._sync_attachments(conn)
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle_readers.put(conn)
+
     def query(self, sql: str, params: tuple = ()) -> list[dict[str, Any]]:
         """Run a cross-database query and return results as dicts."""
         try:
-            cursor = self.conn.cursor()
-            try:
-                cursor.execute(sql, params)
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
-            finally:
-                cursor.close()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(sql, params)
+                    rows = cursor.fetchall()
+                    return [dict(row) for row in rows]
+                finally:
+                    cursor.close()
         except Exception as e:
             logger.exception(f"Nexus Query Error: {e}\nSQL: {sql}")
             return []
 
+    # ------------------------------------------------------------------
+    # Writer queue
+    # ------------------------------------------------------------------
+
     def execute(self, sql: str, params: tuple = ()):
-        """Execute a write operation."""
-        cursor = None
+        """Execute a write operation (group-committed with concurrent writers)."""
+        request = _WriteRequest(sql, params)
+        queued_at = time.perf_counter()
+        with self._pending_lock:
+            self._pending_writes.append(request)
+
+        with self._writer_lock:
+            # Another writer may already have committed this request for us
+            while not request.done:
+                self._drain_writes()
+            self._write_wait_total += time.perf_counter() - queued_at
+
+        if request.error is not None:
+            logger.error(
+                f"Nexus Execution Error: {request.error}\nSQL: {sql}", exc_info=request.error
+            )
+            raise request.error
+
+    def _drain_writes(self):
+        """Commit one batch of pending writes. Caller holds the writer lock."""
+        with self._pending_lock:
+            batch = [
+                self._pending_writes.popleft()
+                for _ in range(min(WRITE_BATCH_MAX, len(self._pending_writes)))
+            ]
+        if not batch:
+            return
+
+        group: list[_WriteRequest] = []
+        for request in batch:
+            if _NON_TRANSACTIONAL_RE.match(request.sql):
+                self._commit_group(group)
+                group = []
+                self._run_write(request)
+            else:
+                group.append(request)
+        self._commit_group(group)
+
+        self._writes += len(batch)
+        self._write_batches += 1
+        self._write_batch_max = max(self._write_batch_max, len(batch))
+
+    def _run_write(self, request: _WriteRequest):
+        """Run a statement that must execute outside a transaction."""
+        cursor = self.conn.cursor()
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(sql, params)
-            self.conn.commit()
+            cursor.execute(request.sql, request.params)
         except Exception as e:
-            logger.exception(f"Nexus Execution Error: {e}\nSQL: {sql}")
-            self.conn.rollback()
-            raise
+            request.error = e
         finally:
-            if cursor is not None:
-                cursor.close()
+            cursor.close()
+            request.done = True
+
+    def _commit_group(self, group: list[_WriteRequest]):
+        """Run statements in one transaction, isolating failures with savepoints."""
+        if not group:
+            return
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            for request in group:
+                cursor.execute("SAVEPOINT nexus_write")
+                try:
+                    cursor.execute(request.sql, request.params)
+                except Exception as e:
+                    request.error = e
+                    cursor.execute("ROLLBACK TO nexus_write")
+                cursor.execute("RELEASE nexus_write")
+            cursor.execute("COMMIT")
+        except Exception as e:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            for request in group:
+                if request.error is None:
+                    request.error = e
+        finally:
+            cursor.close()
+            for request in group:
+                request.done = True
 
     def get_unified_forensic_feed(self, limit: int = 10) -> list[dict[str, Any]]:
         """
@@ -182,18 +441,47 @@ class ForensicNexus:
         """
         return self.query(sql, (limit,))
 
-    def get_status(self) -> dict[str, Any]:
-        """Return the status of attached databases."""
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("PRAGMA database_list")
-            rows = cursor.fetchall()
-            return {
-                "primary": self.primary_path,
-                "attached": [dict(row) for row in rows],
+    def get_pool_stats(self) -> dict[str, Any]:
+        """Reader pool and writer queue metrics."""
+        with self._pool_lock:
+            checkouts = self._checkouts
+            pool = {
+                "size": self.pool_size,
+                "open": self._readers_open,
+                "idle": self._idle_readers.qsize(),
+                "in_use": self._readers_open - self._idle_readers.qsize(),
+                "checkouts": checkouts,
+                "wait_avg_ms": (self._checkout_wait_total / checkouts * 1000) if checkouts else 0.0,
+                "wait_max_ms": self._checkout_wait_max * 1000,
+                "timeouts": self._checkout_timeouts,
             }
-        finally:
-            cursor.close()
+        with self._pending_lock:
+            pending = len(self._pending_writes)
+        batches = self._write_batches
+        writer = {
+            "pending": pending,
+            "writes": self._writes,
+            "group_commits": batches,
+            "avg_batch_size": (self._writes / batches) if batches else 0.0,
+            "max_batch_size": self._write_batch_max,
+            "wait_avg_ms": (self._write_wait_total / self._writes * 1000) if self._writes else 0.0,
+        }
+        return {"readers": pool, "writer": writer}
+
+    def get_status(self) -> dict[str, Any]:
+        """Return the status of attached databases and connection pool metrics."""
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("PRAGMA database_list")
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        return {
+            "primary": self.primary_path,
+            "attached": [dict(row) for row in rows],
+            "pool": self.get_pool_stats(),
+        }
 
 
 # ---------------------------------------------------------------------------
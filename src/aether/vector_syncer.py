@@ -3,6 +3,8 @@ Vector Syncer: Hybrid Local/Supabase Vector Store with Prioritized Caching
 
 Implements:
 - Local vector store using Polars IPC for scalability (1M+ signatures)
+- Columnar float32 embedding matrix, memory-mapped on load, for vectorized search
+- Append-log persistence: buffered inserts flushed as IPC segments, compacted in background
 - Supabase pgvector integration for federated sharing
 - LRU cache with priority levels for hot/cold data
 - Automatic sync with conflict resolution
@@ -15,11 +17,13 @@ Technical Targets:
 
 from __future__ import annotations
 
+import glob
 import hashlib
 import json
 import os
 import threading
 from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -36,6 +40,23 @@ EMBEDDING_DIM = 384  # Standard dimension for semantic embeddings
 CACHE_SIZE_MB = 512  # 512MB local cache
 IPC_FILE = "data/aether/signatures.ipc"
 LOCAL_DB_PATH = "data/aether/vector_store.db"
+WAL_FLUSH_ROWS = 1024  # Buffered inserts written per append segment
+WAL_COMPACT_SEGMENTS = 8  # Minimum segments accumulated before background compaction
+
+
+def _index_schema(embedding_dim: int) -> dict[str, Any]:
+    """Schema of the local IPC index; embeddings are a fixed-width float32 array column."""
+    return {
+        "id": pl.Utf8,
+        "embedding": pl.Array(pl.Float32, embedding_dim),
+        "text": pl.Utf8,
+        "signature_hash": pl.Utf8,
+        "metadata": pl.Utf8,  # JSON string, decoded only for returned rows
+        "priority": pl.Int8,
+        "last_accessed": pl.Utf8,
+        "created_at": pl.Utf8,
+        "sync_status": pl.Utf8,
+    }
 
 
 class VectorStoreType(Enum):
@@ -185,6 +206,9 @@ class VectorSyncer:
     - Priority-based caching (HOT/WARM/COLD/FROZEN)
     - Conflict resolution using vector similarity
     - Scalable to 1M+ signatures via Polars IPC
+    - Embeddings stored as a contiguous float32 matrix; search is one matrix-vector product
+    - Inserts buffered and flushed as append segments next to the IPC file; a crash loses
+      at most the unflushed buffer, and compaction folds segments back into the base file
     """
 
     def __init__(
@@ -193,10 +217,34 @@ class VectorSyncer:
         local_path: str = LOCAL_DB_PATH,
         ipc_path: str = IPC_FILE,
         cache_size_mb: float = CACHE_SIZE_MB,
+        embedding_dim: int = EMBEDDING_DIM,
+        flush_rows: int = WAL_FLUSH_ROWS,
+        compact_segments: int = WAL_COMPACT_SEGMENTS,
+        background_compaction: bool = True,
     ):
         self.store_type = store_type
         self.local_path = local_path
         self.ipc_path = ipc_path
+        self.embedding_dim = embedding_dim
+        self._schema = _index_schema(embedding_dim)
+
+        # Dense view of the embedding column, rebuilt lazily after the index changes
+        self._matrix: np.ndarray | None = None
+        self._norms: np.ndarray | None = None
+
+        # Append-log state: unflushed rows, on-disk segments, and compaction control
+        self.flush_rows = max(1, flush_rows)
+        self.compact_segments = max(1, compact_segments)
+        self.background_compaction = background_compaction
+        self.segment_dir = f"{ipc_path}.wal"
+        self._buffer: list[VectorEntry] = []
+        self._segment_paths: list[str] = []
+        self._segment_sizes: list[int] = []
+        self._base_rows = 0
+        self._next_segment = 0
+        self._index_lock = threading.RLock()
+        self._compaction_lock = threading.RLock()
+        self._compaction_thread: threading.Thread | None = None
 
         # Initialize cache
         self.cache = PriorityCache(max_memory_mb=cache_size_mb)
@@ -216,11 +264,13 @@ class VectorSyncer:
 
         # Stats
         self.stats = {
-            "total_vectors": 0,
+            "total_vectors": len(self._local_df),
             "cache_hits": 0,
             "cache_misses": 0,
             "sync_operations": 0,
             "supabase_queries": 0,
+            "segments_flushed": 0,
+            "compactions": 0,
         }
 
         print(f"[Aether.VectorSyncer] Initialized {store_type.value} mode")
@@ -228,53 +278,218 @@ class VectorSyncer:
         print(f"[Aether.VectorSyncer] IPC file: {ipc_path}")
 
     def _load_local_index(self) -> None:
-        """Load or create local Polars index."""
+        """Load or create local Polars index.
+
+        The base IPC file is memory-mapped, so the embedding matrix is paged in by the
+        OS rather than copied. Append segments left by a previous run are replayed on
+        top of it. Legacy files that stored embeddings as JSON strings are converted
+        to the columnar layout once, on load.
+        """
+        self._invalidate_matrix()
         try:
+            frames = []
             if os.path.exists(self.ipc_path):
-                # Read with explicit schema
-                self._local_df = pl.read_ipc(
-                    self.ipc_path,
-                    schema={
-                        "id": pl.Utf8,
-                        "embedding": pl.Utf8,
-                        "text": pl.Utf8,
-                        "signature_hash": pl.Utf8,
-                        "metadata": pl.Utf8,
-                        "priority": pl.Int8,
-                        "last_accessed": pl.Utf8,
-                        "created_at": pl.Utf8,
-                        "sync_status": pl.Utf8,
-                    },
+                frames.append(self._read_ipc(self.ipc_path))
+            self._base_rows = len(frames[0]) if frames else 0
+            self._segment_paths = self._list_segments()
+            segments = [self._read_ipc(path) for path in self._segment_paths]
+            self._segment_sizes = [len(segment) for segment in segments]
+            frames.extend(segments)
+
+            if frames:
+                df = pl.concat(frames) if len(frames) > 1 else frames[0]
+                if self._segment_paths:
+                    # A crash between compaction and segment cleanup leaves duplicates
+                    df = df.unique(subset="id", keep="last", maintain_order=True)
+                self._local_df = df
+                print(
+                    f"[Aether.VectorSyncer] Loaded {len(self._local_df)} vectors from IPC "
+                    f"({len(self._segment_paths)} append segments)"
                 )
-                print(f"[Aether.VectorSyncer] Loaded {len(self._local_df)} vectors from IPC")
             else:
-                # Create empty DataFrame - store embeddings as JSON strings
-                self._local_df = pl.DataFrame(
-                    schema={
-                        "id": pl.Utf8,
-                        "embedding": pl.Utf8,  # Store as JSON string
-                        "text": pl.Utf8,
-                        "signature_hash": pl.Utf8,
-                        "metadata": pl.Utf8,  # JSON string
-                        "priority": pl.Int8,
-                        "last_accessed": pl.Utf8,
-                        "created_at": pl.Utf8,
-                        "sync_status": pl.Utf8,
-                    }
-                )
+                self._local_df = pl.DataFrame(schema=self._schema)
                 print("[Aether.VectorSyncer] Created new local vector index")
         except Exception as e:
             print(f"[Aether.VectorSyncer] Error loading index: {e}")
-            self._local_df = pl.DataFrame()
+            self._local_df = pl.DataFrame(schema=self._schema)
+
+    def _read_ipc(self, path: str) -> pl.DataFrame:
+        """Memory-map one IPC file and normalize it to the index schema."""
+        df = pl.read_ipc(path, memory_map=True, rechunk=False)
+        if df.schema.get("embedding") == pl.Utf8:
+            df = df.with_columns(
+                pl.col("embedding")
+                .str.json_decode(pl.List(pl.Float32))
+                .list.to_array(self.embedding_dim)
+            )
+            print(f"[Aether.VectorSyncer] Converted legacy JSON embeddings in {path}")
+        return df.select([pl.col(name).cast(dtype) for name, dtype in self._schema.items()])
+
+    def _list_segments(self) -> list[str]:
+        """Return existing append segments in write order and advance the sequence."""
+        paths = sorted(glob.glob(os.path.join(self.segment_dir, "segment-*.ipc")))
+        if paths:
+            last = os.path.basename(paths[-1])[len("segment-") : -len(".ipc")]
+            self._next_segment = int(last) + 1
+        return paths
 
     def _save_local_index(self) -> None:
-        """Save local index to IPC file."""
-        if self._local_df is not None and len(self._local_df) > 0:
-            try:
-                self._local_df.write_ipc(self.ipc_path)
-                print(f"[Aether.VectorSyncer] Saved {len(self._local_df)} vectors to IPC")
-            except Exception as e:
-                print(f"[Aether.VectorSyncer] Error saving index: {e}")
+        """Flush buffered rows and compact base file and segments into one IPC file."""
+        try:
+            self.flush()
+            self._compact(rewrite=True)
+            print(f"[Aether.VectorSyncer] Saved {len(self._local_df)} vectors to IPC")
+        except Exception as e:
+            print(f"[Aether.VectorSyncer] Error saving index: {e}")
+
+    @staticmethod
+    def _write_ipc(df: pl.DataFrame, path: str) -> None:
+        """Write via a temp file so a memory-mapped reader is never truncated."""
+        tmp_path = f"{path}.tmp"
+        df.write_ipc(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+
+    def flush(self) -> int:
+        """
+        Write buffered rows to a new append segment.
+
+        Returns the number of rows flushed.
+        """
+        with self._index_lock:
+            if not self._buffer:
+                return 0
+
+            chunk = self._entries_to_frame(self._buffer)
+            os.makedirs(self.segment_dir, exist_ok=True)
+            path = os.path.join(self.segment_dir, f"segment-{self._next_segment:010d}.ipc")
+            self._write_ipc(chunk, path)
+
+            self._next_segment += 1
+            self._segment_paths.append(path)
+            self._segment_sizes.append(len(chunk))
+            self._buffer = []
+            self._append_rows(chunk)
+            self.stats["segments_flushed"] += 1
+            # Size-tiered trigger: rewriting the base only once the segments outgrow it
+            # keeps total compaction work linear in the number of rows ingested
+            needs_compaction = (
+                len(self._segment_paths) >= self.compact_segments
+                and sum(self._segment_sizes) >= self._base_rows
+            )
+
+        if needs_compaction:
+            self._schedule_compaction()
+        return len(chunk)
+
+    def _schedule_compaction(self) -> None:
+        """Compact on a background thread, unless one is already running."""
+        if not self.background_compaction:
+            self._compact()
+            return
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(
+            target=self._compact, name="aether-compaction", daemon=True
+        )
+        self._compaction_thread.start()
+
+    def _compact(self, rewrite: bool = False) -> None:
+        """
+        Merge the base file and all flushed segments, dropping superseded ids.
+
+        The merged frame is written atomically before segments are deleted, so a crash
+        at any point leaves a loadable index. Rows flushed while compaction runs are
+        kept in memory and on disk for the next pass.
+        """
+        with self._compaction_lock:
+            with self._index_lock:
+                snapshot = self._local_df
+                segments = list(self._segment_paths)
+            if snapshot is None or (not segments and not rewrite):
+                return
+
+            compacted = snapshot.unique(subset="id", keep="last", maintain_order=True)
+            if len(compacted) > 0:
+                self._write_ipc(compacted, self.ipc_path)
+
+            with self._index_lock:
+                tail = self._local_df.slice(len(snapshot))
+                self._local_df = pl.concat([compacted, tail]) if len(tail) else compacted
+                self._segment_paths = self._segment_paths[len(segments) :]
+                self._segment_sizes = self._segment_sizes[len(segments) :]
+                self._base_rows = len(compacted)
+                self._invalidate_matrix()
+                self.stats["compactions"] += 1
+
+            for path in segments:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f"[Aether.VectorSyncer] Could not remove segment {path}: {e}")
+
+    def _invalidate_matrix(self) -> None:
+        """Drop the cached embedding matrix after rows are added or reloaded."""
+        self._matrix = None
+        self._norms = None
+
+    def _embedding_matrix(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the (N, dim) float32 embedding matrix and its row norms."""
+        if self._matrix is None or self._norms is None:
+            if self._local_df is None or len(self._local_df) == 0:
+                matrix = np.empty((0, self.embedding_dim), dtype=np.float32)
+            else:
+                matrix = self._local_df["embedding"].to_numpy()
+            self._matrix = matrix
+            self._norms = np.linalg.norm(matrix, axis=1)
+        return self._matrix, self._norms
+
+    def _check_dimension(self, embedding: list[float]) -> None:
+        """Reject embeddings that do not fit the fixed-width embedding column."""
+        if len(embedding) != self.embedding_dim:
+            raise ValueError(
+                f"Embedding has dimension {len(embedding)}, expected {self.embedding_dim}"
+            )
+
+    def _entries_to_frame(self, entries: list[VectorEntry]) -> pl.DataFrame:
+        """Build index rows for entries."""
+        return pl.DataFrame(
+            {
+                "id": [e.id for e in entries],
+                "embedding": np.asarray([e.embedding for e in entries], dtype=np.float32),
+                "text": [e.text for e in entries],
+                "signature_hash": [e.signature_hash for e in entries],
+                "metadata": [json.dumps(e.metadata) for e in entries],
+                "priority": [e.priority for e in entries],
+                "last_accessed": [e.last_accessed.isoformat() for e in entries],
+                "created_at": [e.created_at.isoformat() for e in entries],
+                "sync_status": [e.sync_status for e in entries],
+            },
+            schema=self._schema,
+        )
+
+    def _append_rows(self, new_rows: pl.DataFrame) -> None:
+        """Append an already-persisted chunk to the in-memory index (no rechunk)."""
+        if self._local_df is None or len(self._local_df) == 0:
+            self._local_df = new_rows
+        else:
+            self._local_df = pl.concat([self._local_df, new_rows])
+        self._invalidate_matrix()
+
+    @staticmethod
+    def _row_to_entry(row: dict[str, Any], metadata: dict[str, Any] | None = None) -> VectorEntry:
+        """Materialize a VectorEntry from an index row."""
+        emb = row["embedding"]
+        return VectorEntry(
+            id=row["id"],
+            embedding=emb.tolist() if isinstance(emb, np.ndarray) else list(emb),
+            text=row["text"],
+            signature_hash=row["signature_hash"],
+            metadata=metadata if metadata is not None else json.loads(row["metadata"]),
+            priority=row["priority"],
+            last_accessed=datetime.fromisoformat(row["last_accessed"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            sync_status=row["sync_status"],
+        )
 
     def _generate_id(self, text: str, metadata: dict[str, Any]) -> str:
         """Generate unique ID for vector entry."""
@@ -312,67 +527,77 @@ class VectorSyncer:
 
         Returns the vector ID.
         """
-        metadata = metadata or {}
-        vector_id = self._generate_id(text, metadata)
-        sig_hash = self._generate_signature_hash(text)
+        entry = self._make_entry(text, embedding, metadata, priority, auto_sync)
+
+        # Add to cache (primary storage)
+        self.cache.put(entry.id, entry)
+
+        self._buffer_entries([entry], auto_sync)
+        return entry.id
 
-        entry = VectorEntry(
-            id=vector_id,
+    def add_vectors(
+        self,
+        batch: Iterable[dict[str, Any]],
+        priority: int = Priority.WARM.value,
+        auto_sync: bool = True,
+    ) -> list[str]:
+        """
+        Bulk-add vectors to the store.
+
+        Each item needs ``text`` and ``embedding`` and may carry ``metadata`` and
+        ``priority``. Rows go straight to the append buffer without warming the
+        cache, so ingestion cost is linear in the batch size.
+
+        Returns the vector IDs in input order.
+        """
+        entries = [
+            self._make_entry(
+                item["text"],
+                item["embedding"],
+                item.get("metadata"),
+                item.get("priority", priority),
+                auto_sync,
+            )
+            for item in batch
+        ]
+        self._buffer_entries(entries, auto_sync)
+        return [entry.id for entry in entries]
+
+    def _make_entry(
+        self,
+        text: str,
+        embedding: list[float],
+        metadata: dict[str, Any] | None,
+        priority: int,
+        auto_sync: bool,
+    ) -> VectorEntry:
+        """Validate and build a new entry."""
+        self._check_dimension(embedding)
+        metadata = metadata or {}
+        return VectorEntry(
+            id=self._generate_id(text, metadata),
             embedding=embedding,
             text=text,
-            signature_hash=sig_hash,
+            signature_hash=self._generate_signature_hash(text),
             metadata=metadata,
             priority=priority,
             sync_status="pending" if auto_sync else "local",
         )
 
-        # Add to cache (primary storage)
-        self.cache.put(vector_id, entry)
-
-        # Add to local DataFrame for persistence (skip filter to avoid Polars Object issue)
-        if self._local_df is None:
-            self._load_local_index()
-
-        # Simply append - duplicates handled by cache
-        new_row = pl.DataFrame(
-            [
-                {
-                    "id": entry.id,
-                    "embedding": json.dumps(entry.embedding),
-                    "text": entry.text,
-                    "signature_hash": entry.signature_hash,
-                    "metadata": json.dumps(entry.metadata),
-                    "priority": entry.priority,
-                    "last_accessed": entry.last_accessed.isoformat(),
-                    "created_at": entry.created_at.isoformat(),
-                    "sync_status": entry.sync_status,
-                }
-            ],
-            schema={
-                "id": pl.Utf8,
-                "embedding": pl.Utf8,
-                "text": pl.Utf8,
-                "signature_hash": pl.Utf8,
-                "metadata": pl.Utf8,
-                "priority": pl.Int8,
-                "last_accessed": pl.Utf8,
-                "created_at": pl.Utf8,
-                "sync_status": pl.Utf8,
-            },
-        )
-
-        if len(self._local_df) == 0:
-            self._local_df = new_row
-        else:
-            self._local_df = pl.concat([self._local_df, new_row])
+    def _buffer_entries(self, entries: list[VectorEntry], auto_sync: bool) -> None:
+        """Queue entries in the append buffer, flushing each time it fills up."""
+        for start in range(0, len(entries), self.flush_rows):
+            with self._index_lock:
+                self._buffer.extend(entries[start : start + self.flush_rows])
+                full = len(self._buffer) >= self.flush_rows
+            if full:
+                self.flush()
 
         # Mark for sync
         if auto_sync:
-            self._pending_sync.add(vector_id)
-
-        self.stats["total_vectors"] = len(self._local_df)
+            self._pending_sync.update(entry.id for entry in entries)
 
-        return vector_id
+        self.stats["total_vectors"] = len(self._local_df) + len(self._buffer)
 
     def get_vector(self, vector_id: str) -> VectorEntry | None:
         """Retrieve a vector by ID."""
@@ -385,25 +610,11 @@ class VectorSyncer:
         self.stats["cache_misses"] += 1
 
         # Load from local index
+        self.flush()
         if self._local_df is not None:
             row = self._local_df.filter(pl.col("id") == vector_id)
             if len(row) > 0:
-                row_data = row.to_dicts()[0]
-                # Parse embedding from JSON string
-                emb = row_data["embedding"]
-                if isinstance(emb, str):
-                    emb = json.loads(emb)
-                entry = VectorEntry(
-                    id=row_data["id"],
-                    embedding=emb,
-                    text=row_data["text"],
-                    signature_hash=row_data["signature_hash"],
-                    metadata=json.loads(row_data["metadata"]),
-                    priority=row_data["priority"],
-                    last_accessed=datetime.fromisoformat(row_data["last_accessed"]),
-                    created_at=datetime.fromisoformat(row_data["created_at"]),
-                    sync_status=row_data["sync_status"],
-                )
+                entry = self._row_to_entry(row.row(0, named=True))
                 # Add to cache
                 self.cache.put(vector_id, entry)
                 return entry
@@ -424,34 +635,37 @@ class VectorSyncer:
         """
         results: list[tuple[VectorEntry, float]] = []
 
-        # Search in local index
-        if self._local_df is not None:
-            for row in self._local_df.to_dicts():
-                # Apply metadata filter if provided
-                if filter_metadata:
-                    row_meta = json.loads(row["metadata"])
-                    if not all(row_meta.get(k) == v for k, v in filter_metadata.items()):
-                        continue
-
-                # Parse embedding - may be JSON string or list
-                emb = row["embedding"]
-                if isinstance(emb, str):
-                    emb = json.loads(emb)
-                similarity = self._cosine_similarity(query_embedding, emb)
-
-                if similarity >= min_similarity:
-                    entry = VectorEntry(
-                        id=row["id"],
-                        embedding=emb,
-                        text=row["text"],
-                        signature_hash=row["signature_hash"],
-                        metadata=json.loads(row["metadata"]),
-                        priority=row["priority"],
-                        last_accessed=datetime.fromisoformat(row["last_accessed"]),
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                        sync_status=row["sync_status"],
-                    )
-                    results.append((entry, similarity))
+        # Search in local index: one matrix-vector product, metadata decoded only for hits
+        self.flush()
+        with self._index_lock:
+            local_df = self._local_df
+            matrix, norms = self._embedding_matrix()
+        if matrix.shape[0] > 0 and top_k > 0:
+            query = np.asarray(query_embedding, dtype=np.float32)
+            query_norm = float(np.linalg.norm(query))
+            denom = norms * query_norm
+            scores = np.divide(
+                matrix @ query, denom, out=np.zeros(len(norms), dtype=np.float32), where=denom > 0
+            )
+
+            candidates = np.flatnonzero(scores >= min_similarity)
+            if not filter_metadata and len(candidates) > top_k:
+                keep = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+                candidates = candidates[keep]
+            ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            metadata_col = local_df["metadata"]
+            for idx in ordered:
+                if len(results) >= top_k:
+                    break
+                idx = int(idx)
+                row_meta = json.loads(metadata_col[idx])
+                if filter_metadata and not all(
+                    row_meta.get(k) == v for k, v in filter_metadata.items()
+                ):
+                    continue
+                entry = self._row_to_entry(local_df.row(idx, named=True), row_meta)
+                results.append((entry, float(scores[idx])))
 
         # Search in Supabase if hybrid mode
         if self.store_type in (VectorStoreType.HYBRID, VectorStoreType.SUPABASE):
@@ -551,12 +765,14 @@ class VectorSyncer:
                         failed.extend([e["id"] for e in batch_entries])
 
             # Clear pending
-            for vec_id in synced:
-                self._pending_sync.discard(vec_id)
-                # Update local status
-                if self._local_df is not None:
+            self._pending_sync.difference_update(synced)
+            # Update local status; hold the compaction lock so a running pass cannot
+            # swap in a frame that predates the update
+            self.flush()
+            with self._compaction_lock, self._index_lock:
+                if self._local_df is not None and synced:
                     self._local_df = self._local_df.with_columns(
-                        pl.when(pl.col("id") == vec_id)
+                        pl.when(pl.col("id").is_in(synced))
                         .then(pl.lit("synced"))
                         .otherwise(pl.col("sync_status"))
                         .alias("sync_status")
@@ -591,15 +807,13 @@ class VectorSyncer:
                 query = query.gt("created_at", since.isoformat())
 
             response = query.execute()
-            pulled = 0
+            self.flush()
+            known_hashes = set(self._local_df["signature_hash"].to_list())
+            pulled_entries: list[VectorEntry] = []
 
             for row in response.data:
                 # Check if already exists locally
-                existing = self._local_df.filter(
-                    pl.col("signature_hash") == row.get("signature_hash", "")
-                )
-
-                if len(existing) == 0:
+                if row.get("signature_hash", "") not in known_hashes:
                     entry = VectorEntry(
                         id=row["id"],
                         embedding=row["embedding"],
@@ -610,43 +824,20 @@ class VectorSyncer:
                         sync_status="synced",
                     )
 
+                    if len(entry.embedding) != self.embedding_dim:
+                        print(f"[Aether.VectorSyncer] Skipping {entry.id}: dimension mismatch")
+                        continue
+
                     # Add to cache and local index
                     self.cache.put(entry.id, entry)
+                    known_hashes.add(entry.signature_hash)
+                    pulled_entries.append(entry)
 
-                    new_row = pl.DataFrame(
-                        [
-                            {
-                                "id": entry.id,
-                                "embedding": json.dumps(entry.embedding),
-                                "text": entry.text,
-                                "signature_hash": entry.signature_hash,
-                                "metadata": json.dumps(entry.metadata),
-                                "priority": entry.priority,
-                                "last_accessed": entry.last_accessed.isoformat(),
-                                "created_at": entry.created_at.isoformat(),
-                                "sync_status": entry.sync_status,
-                            }
-                        ],
-                        schema={
-                            "id": pl.Utf8,
-                            "embedding": pl.Utf8,
-                            "text": pl.Utf8,
-                            "signature_hash": pl.Utf8,
-                            "metadata": pl.Utf8,
-                            "priority": pl.Int8,
-                            "last_accessed": pl.Utf8,
-                            "created_at": pl.Utf8,
-                            "sync_status": pl.Utf8,
-                        },
-                    )
-
-                    self._local_df = pl.concat([self._local_df, new_row])
-                    pulled += 1
-
-            if pulled > 0:
+            if pulled_entries:
+                self._buffer_entries(pulled_entries, auto_sync=False)
                 self._save_local_index()
 
-            return pulled
+            return len(pulled_entries)
 
         except Exception as e:
             print(f"[Aether.VectorSyncer] Pull error: {e}")
@@ -667,20 +858,27 @@ class VectorSyncer:
             "last_sync": self._last_sync.isoformat() if self._last_sync else None,
             "supabase_queries": self.stats["supabase_queries"],
             "sync_operations": self.stats["sync_operations"],
+            "buffered_rows": len(self._buffer),
+            "append_segments": len(self._segment_paths),
+            "segments_flushed": self.stats["segments_flushed"],
+            "compactions": self.stats["compactions"],
         }
 
     def export_to_ipc(self, output_path: str | None = None) -> str:
         """Export current index to IPC file."""
         output_path = output_path or self.ipc_path
 
+        self.flush()
         if self._local_df is not None:
-            self._local_df.write_ipc(output_path)
+            self._write_ipc(self._local_df, output_path)
             return output_path
 
         return ""
 
     def close(self):
         """Clean up resources."""
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
         self._save_local_index()
         self.cache.clear()
         print("[Aether.VectorSyncer] Closed")
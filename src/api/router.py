@@ -166,9 +166,10 @@ async def submit_batch_job(request: BatchRequest, user: User = Depends(get_curre
 
     # Define task based on operation
     if request.operation == "sentiment":
+        analyzer = ToolFactory.create_sentiment_analyzer()
 
-        async def process_item(text: str):
-            analyzer = ToolFactory.create_sentiment_analyzer()
+        # Sync processor: the batch processor runs it on its thread pool
+        def process_item(text: str):
             return analyzer.analyze_sentiment(text)
     else:
         raise HTTPException(status_code=400, detail=f"Unsupported operation: {request.operation}")
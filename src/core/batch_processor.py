@@ -6,53 +6,210 @@ Features:
 - Status tracking
 - Result aggregation
 - Error handling at item level
+- Per-job concurrency (semaphore for coroutines, thread/process pool for sync callables)
+- Chunked dispatch and cancellation
+- Bounded job store with eviction of finished jobs
+- Per-job throughput and latency statistics
 """
 
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
+import os
+import time
 import uuid
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONCURRENCY = os.cpu_count() or 4
+DEFAULT_CHUNK_SIZE = 64
+MAX_RETAINED_JOBS = 1000
+EXECUTOR_KINDS = ("thread", "process")
+FINISHED_STATUSES = ("completed", "cancelled", "failed")
+
+
+def _is_coroutine_processor(processor: Callable) -> bool:
+    """True for async functions, partials of them and objects with an async __call__."""
+    return inspect.iscoroutinefunction(processor) or (
+        callable(processor) and inspect.iscoroutinefunction(processor.__call__)
+    )
+
+
+def _run_chunk(processor: Callable, items: list[Any]) -> list[tuple[bool, Any, float]]:
+    """
+    Run a sync processor over a chunk of items inside a pool worker.
+
+    Module-level so it can be pickled for process pools. Returns one
+    (ok, result_or_error, seconds) tuple per item.
+    """
+    outcomes = []
+    for item in items:
+        start = time.perf_counter()
+        try:
+            outcomes.append((True, processor(item), time.perf_counter() - start))
+        except Exception as e:
+            outcomes.append((False, str(e), time.perf_counter() - start))
+    return outcomes
+
 
 class BatchJob:
     """Represents a batch processing job."""
 
-    def __init__(self, job_id: str, items: list[Any], processor: Callable):
+    def __init__(
+        self,
+        job_id: str,
+        items: list[Any],
+        processor: Callable,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: str | None = None,
+    ):
         self.job_id = job_id
         self.items = items
         self.processor = processor
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.executor = executor
         self.status = "pending"
         self.results = []
         self.errors = []
         self.created_at = datetime.now()
-        self.completed_at = datetime | None
+        self.started_at: datetime | None = None
+        self.completed_at: datetime | None = None
         self.progress = 0.0
+        self.processed = 0
+        self.success_count = 0
+        self.latencies: list[float] = []
+        self.task: asyncio.Task | None = None
+        self._ordered_results: dict[int, Any] = {}
+
+    def record(self, index: int, ok: bool, value: Any, seconds: float):
+        """Record the outcome of one item."""
+        if ok:
+            self._ordered_results[index] = value
+            self.success_count += 1
+        else:
+            logger.error(f"Error processing item in job {self.job_id}: {value}")
+            self.errors.append({"item_index": index, "error": str(value)})
+        self.latencies.append(seconds)
+        self.processed += 1
+        self.progress = self.processed / len(self.items)
+
+    def finalize(self, status: str):
+        """Freeze results in item order and stamp completion."""
+        self.results = [self._ordered_results[i] for i in sorted(self._ordered_results)]
+        self._ordered_results = {}
+        self.errors.sort(key=lambda e: e["item_index"])
+        self.status = status
+        self.completed_at = datetime.now()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Throughput and per-item latency statistics."""
+        if self.started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = ((self.completed_at or datetime.now()) - self.started_at).total_seconds()
+
+        stats = {
+            "elapsed_seconds": elapsed,
+            "items_per_second": self.processed / elapsed if elapsed > 0 else 0.0,
+            "concurrency": self.concurrency,
+            "chunk_size": self.chunk_size,
+            "executor": self.executor or "asyncio",
+        }
+        if self.latencies:
+            latencies_ms = np.asarray(self.latencies) * 1000
+            stats.update(
+                {
+                    "latency_avg_ms": float(latencies_ms.mean()),
+                    "latency_p50_ms": float(np.percentile(latencies_ms, 50)),
+                    "latency_p95_ms": float(np.percentile(latencies_ms, 95)),
+                    "latency_max_ms": float(latencies_ms.max()),
+                }
+            )
+        return stats
 
 
 class BatchProcessor:
     """Manager for asynchronous batch jobs."""
 
-    def __init__(self):
-        self.jobs: dict[str, BatchJob] = {}
+    def __init__(self, max_jobs: int = MAX_RETAINED_JOBS, max_workers: int | None = None):
+        self.jobs: OrderedDict[str, BatchJob] = OrderedDict()
+        self.max_jobs = max_jobs
+        self.max_workers = max_workers or DEFAULT_CONCURRENCY
         self._lock = asyncio.Lock()
+        self._executors: dict[str, Executor] = {}
+
+    async def create_job(
+        self,
+        items: list[Any],
+        processor: Callable,
+        concurrency: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: str | None = None,
+    ) -> str:
+        """
+        Create a new batch job.
+
+        Args:
+            items: Items to process
+            processor: Async callable, or sync callable run on a worker pool
+            concurrency: Max items (async) or chunks (sync) in flight for this job
+            chunk_size: Items dispatched together per scheduling step
+            executor: "thread" or "process" for sync processors (default "thread")
+
+        Returns:
+            The new job ID
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if concurrency is not None and concurrency < 1:
+            raise ValueError(f"concurrency must be positive, got {concurrency}")
+        if _is_coroutine_processor(processor):
+            if executor is not None:
+                raise ValueError("executor only applies to sync processors")
+        else:
+            executor = executor or "thread"
+            if executor not in EXECUTOR_KINDS:
+                raise ValueError(f"executor must be one of {EXECUTOR_KINDS}, got {executor!r}")
 
-    async def create_job(self, items: list[Any], processor: Callable) -> str:
-        """Create a new batch job."""
         job_id = str(uuid.uuid4())
-        job = BatchJob(job_id, items, processor)
+        job = BatchJob(
+            job_id,
+            list(items),
+            processor,
+            concurrency=concurrency or DEFAULT_CONCURRENCY,
+            chunk_size=chunk_size,
+            executor=executor,
+        )
         async with self._lock:
             self.jobs[job_id] = job
+            self._evict_finished_jobs()
 
         # Start processing in background
-        asyncio.create_task(self._process_job(job_id))
+        job.task = asyncio.create_task(self._process_job(job_id))
         return job_id
 
+    def _evict_finished_jobs(self):
+        """Drop the oldest finished jobs once the store exceeds max_jobs."""
+        overflow = len(self.jobs) - self.max_jobs
+        if overflow <= 0:
+            return
+        for job_id in [jid for jid, job in self.jobs.items() if job.status in FINISHED_STATUSES][
+            :overflow
+        ]:
+            del self.jobs[job_id]
+            logger.debug(f"Evicted finished batch job {job_id}")
+
     async def _process_job(self, job_id: str):
         """Process job items asynchronously."""
         job = self.jobs.get(job_id)
@@ -60,25 +217,102 @@ class BatchProcessor:
             return
 
         job.status = "processing"
-        total = len(job.items)
+        job.started_at = datetime.now()
 
-        for i, item in enumerate(job.items):
-            try:
-                # In a real app, this might be calling NLP tools
-                result = await job.processor(item)
-                job.results.append(result)
-            except Exception as e:
-                logger.exception(f"Error processing item in job {job_id}: {e}")
-                job.errors.append({"item_index": i, "error": str(e)})
-
-            job.progress = (i + 1) / total
+        try:
+            if job.executor is None:
+                await self._process_async(job)
+            else:
+                await self._process_sync(job)
+        except asyncio.CancelledError:
+            job.finalize("cancelled")
+            logger.info(f"Batch job {job_id} cancelled after {job.processed} items")
+            raise
+        except Exception as e:
+            logger.exception(f"Batch job {job_id} failed: {e}")
+            job.finalize("failed")
+            return
 
-        job.status = "completed"
-        job.completed_at = datetime.now()
+        if not job.items:
+            job.progress = 1.0
+        job.finalize("completed")
         logger.info(
             f"Batch job {job_id} completed with {len(job.results)} successes and {len(job.errors)} errors"
         )
 
+    async def _process_async(self, job: BatchJob):
+        """Run a coroutine processor with at most job.concurrency items in flight."""
+        semaphore = asyncio.Semaphore(job.concurrency)
+
+        async def run_one(index: int, item: Any):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    result = await job.processor(item)
+                except Exception as e:
+                    job.record(index, False, e, time.perf_counter() - start)
+                else:
+                    job.record(index, True, result, time.perf_counter() - start)
+
+        # Chunked dispatch keeps the number of live tasks bounded for large jobs
+        for chunk_start in range(0, len(job.items), job.chunk_size):
+            chunk = job.items[chunk_start : chunk_start + job.chunk_size]
+            await asyncio.gather(
+                *(run_one(chunk_start + offset, item) for offset, item in enumerate(chunk))
+            )
+
+    async def _process_sync(self, job: BatchJob):
+        """Run a sync processor on a worker pool, one chunk per pool task."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor(job.executor)
+        semaphore = asyncio.Semaphore(job.concurrency)
+
+        async def run_chunk(chunk_start: int):
+            chunk = job.items[chunk_start : chunk_start + job.chunk_size]
+            async with semaphore:
+                outcomes = await loop.run_in_executor(executor, _run_chunk, job.processor, chunk)
+            for offset, (ok, value, seconds) in enumerate(outcomes):
+                job.record(chunk_start + offset, ok, value, seconds)
+
+        await asyncio.gather(
+            *(run_chunk(start) for start in range(0, len(job.items), job.chunk_size))
+        )
+
+    def _get_executor(self, kind: str) -> Executor:
+        """Lazily create the shared thread or process pool."""
+        executor = self._executors.get(kind)
+        if executor is None:
+            if kind == "process":
+                executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="batch"
+                )
+            self._executors[kind] = executor
+        return executor
+
+    async def cancel_job(self, job_id: str) -> bool:
+        """Cancel a pending or running job. Returns False if it is unknown or finished."""
+        job = self.jobs.get(job_id)
+        if not job or job.status in FINISHED_STATUSES or job.task is None:
+            return False
+
+        job.task.cancel()
+        try:
+            await job.task
+        except asyncio.CancelledError:
+            pass
+        if job.status not in FINISHED_STATUSES:
+            # Cancelled before _process_job started running
+            job.finalize("cancelled")
+        return True
+
+    def shutdown(self, wait: bool = True):
+        """Shut down worker pools created for sync processors."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
+        self._executors.clear()
+
     def get_job_status(self, job_id: str) -> dict[str, Any] | None:
         """Get the status and progress of a job."""
         job = self.jobs.get(job_id)
@@ -90,10 +324,11 @@ class BatchProcessor:
             "status": job.status,
             "progress": job.progress,
             "item_count": len(job.items),
-            "success_count": len(job.results),
+            "success_count": job.success_count,
             "error_count": len(job.errors),
             "created_at": job.created_at.isoformat(),
             "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+            "stats": job.get_stats(),
         }
 
     def get_job_results(self, job_id: str) -> dict[str, Any] | None:
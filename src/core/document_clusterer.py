@@ -6,8 +6,9 @@ Phase 5 component for semantic document clustering and topic analysis.
 Groups similar documents and extracts common themes.
 
 Features:
-- K-Means clustering
-- Hierarchical clustering
+- K-Means clustering (k-means++ init, mini-batch mode for large corpora)
+- Hierarchical clustering (Ward linkage via nearest-neighbour chain)
+- Density-based clustering (DBSCAN over a cosine neighbour index)
 - Topic extraction
 - Document similarity measurement
 - Cluster analysis and characterization
@@ -18,10 +19,18 @@ from __future__ import annotations
 
 import logging
 import math
+import re
+import warnings
 from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+from scipy import sparse
+from sklearn.cluster import DBSCAN, KMeans, MiniBatchKMeans
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.metrics import silhouette_score
+
 try:
     from nltk.corpus import stopwords
     from nltk.tokenize import word_tokenize
@@ -32,6 +41,19 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Vectorization / engine tuning
+DEFAULT_MAX_FEATURES = 20_000  # vocabulary cap (highest document frequency wins)
+MINI_BATCH_THRESHOLD = 10_000  # corpora at least this large use mini-batch k-means
+MINI_BATCH_SIZE = 1024
+KMEANS_N_INIT = 3
+AGGLOMERATIVE_EXACT_LIMIT = 2000  # above this, Ward runs on k-means micro-clusters
+AGGLOMERATIVE_MICRO_CLUSTERS = 512
+DBSCAN_EPS = 0.6  # cosine distance
+DBSCAN_MIN_SAMPLES = 3
+SILHOUETTE_SAMPLE_SIZE = 2000
+TOP_TERMS = 10
+WORD_RE = re.compile(r"\b\w+\b")
+
 
 class ClusteringAlgorithm(Enum):
     """Clustering algorithms."""
@@ -89,9 +111,31 @@ class ClusteringResult:
 class DocumentClusterer:
     """Document clustering and topic analysis engine."""
 
-    def __init__(self):
-        """Initialize clusterer."""
+    def __init__(
+        self,
+        random_state: int | None = None,
+        max_features: int = DEFAULT_MAX_FEATURES,
+        mini_batch_threshold: int = MINI_BATCH_THRESHOLD,
+        dbscan_eps: float = DBSCAN_EPS,
+        dbscan_min_samples: int = DBSCAN_MIN_SAMPLES,
+    ):
+        """
+        Initialize clusterer.
+
+        Args:
+            random_state: Seed for k-means initialisation and sampling
+            max_features: Maximum vocabulary size of the TF-IDF matrix
+            mini_batch_threshold: Corpus size from which k-means runs in mini-batch mode
+            dbscan_eps: Neighbourhood radius (cosine distance) for density clustering
+            dbscan_min_samples: Neighbours required for a DBSCAN core document
+        """
+        self.random_state = random_state
+        self.max_features = max_features
+        self.mini_batch_threshold = mini_batch_threshold
+        self.dbscan_eps = dbscan_eps
+        self.dbscan_min_samples = dbscan_min_samples
         self.has_nltk = NLTK_AVAILABLE
+        self._punkt_available = True
         if self.has_nltk:
             try:
                 self.stop_words = set(stopwords.words("english"))
@@ -123,30 +167,30 @@ class DocumentClusterer:
 
         num_clusters = max(1, min(num_clusters, len(documents)))
 
-        # Build document vectors
-        doc_vectors = self._vectorize_documents(documents)
+        # Build the L2-normalised TF-IDF matrix (rows = documents)
+        matrix, vocabulary = self._vectorize_matrix(documents)
 
         if algorithm == ClusteringAlgorithm.KMEANS:
-            clusters = self._kmeans_cluster(doc_vectors, num_clusters)
+            labels = self._kmeans_labels(matrix, num_clusters)
         elif algorithm == ClusteringAlgorithm.HIERARCHICAL:
-            clusters = self._hierarchical_cluster(doc_vectors, num_clusters)
+            labels = self._hierarchical_labels(matrix, num_clusters)
         else:
-            clusters = self._density_cluster(doc_vectors)
+            labels = self._density_labels(matrix)
+            num_clusters = int(labels.max()) + 1 if labels.size else 0
+
+        clusters = self._build_clusters(matrix, labels, num_clusters, documents, vocabulary)
 
         # Characterize clusters
         self._characterize_clusters(clusters)
 
         # Calculate quality metrics
-        silhouette = self._calculate_silhouette_score(clusters, doc_vectors)
+        silhouette = self._calculate_silhouette_score(matrix, labels)
 
         # Generate topic labels
         topic_labels = self._generate_topic_labels(clusters)
 
-        # Build document assignments
-        doc_assignments = {v.doc_id: -1 for v in doc_vectors}
-        for cluster in clusters:
-            for member in cluster.members:
-                doc_assignments[member.doc_id] = cluster.cluster_id
+        # Build document assignments (-1 = DBSCAN noise)
+        doc_assignments = {str(i): int(label) for i, label in enumerate(labels)}
 
         return ClusteringResult(
             num_clusters=len(clusters),
@@ -282,83 +326,217 @@ class DocumentClusterer:
 
         return vector
 
-    def _kmeans_cluster(self, doc_vectors: list[DocumentVector], k: int) -> list[Cluster]:
-        """K-Means clustering algorithm."""
-        # Initialize centroids randomly
-        import random
-
-        centroid_indices = random.sample(range(len(doc_vectors)), k)
-        centroids = [doc_vectors[i].vector for i in centroid_indices]
-
-        assignments = [-1] * len(doc_vectors)
-        converged = False
-        iterations = 0
-        max_iterations = 10
-
-        while not converged and iterations < max_iterations:
-            # Assign documents to nearest centroid
-            new_assignments = []
-            for vec in doc_vectors:
-                best_centroid = 0
-                best_distance = float("inf")
-
-                for c_idx, centroid in enumerate(centroids):
-                    distance = self._vector_distance(vec.vector, centroid)
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_centroid = c_idx
+    def _vectorize_matrix(self, documents: list[str]) -> tuple[sparse.csr_matrix, list[str]]:
+        """
+        Build an L2-normalised TF-IDF CSR matrix for the corpus.
 
-                new_assignments.append(best_centroid)
+        Uses the same TF-IDF weighting as ``_vectorize_documents``, keeping
+        only the ``max_features`` terms with the highest document frequency.
+        """
+        doc_token_lists = []
+        df = Counter()
+        for doc in documents:
+            tokens = self._tokenize(doc.lower())
+            tokens = [t for t in tokens if t not in self.stop_words and len(t) > 2]
+            doc_token_lists.append(tokens)
+            df.update(set(tokens))
 
-            # Check convergence
-            if new_assignments == assignments:
-                converged = True
+        vocabulary = [term for term, _ in df.most_common(self.max_features)]
+        term_index = {term: i for i, term in enumerate(vocabulary)}
+        num_docs = len(documents)
+        idf = np.log(num_docs / np.array([df[t] for t in vocabulary], dtype=np.float64))
 
-            assignments = new_assignments
+        indptr = [0]
+        indices: list[int] = []
+        data: list[float] = []
+        for tokens in doc_token_lists:
+            tf = Counter(t for t in tokens if t in term_index)
+            length = max(len(tokens), 1)
+            indices.extend(term_index[t] for t in tf)
+            data.extend(count / length for count in tf.values())
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), indptr),
+            shape=(num_docs, len(vocabulary)),
+        )
+        matrix.data *= idf[matrix.indices]
+
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        matrix = sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+        matrix.eliminate_zeros()
+        return matrix, vocabulary
+
+    def _kmeans_labels(self, matrix: sparse.csr_matrix, k: int) -> np.ndarray:
+        """K-Means with k-means++ init; mini-batch updates for large corpora."""
+        if matrix.shape[0] >= self.mini_batch_threshold:
+            model = MiniBatchKMeans(
+                n_clusters=k,
+                init="k-means++",
+                batch_size=MINI_BATCH_SIZE,
+                n_init=KMEANS_N_INIT,
+                random_state=self.random_state,
+            )
+        else:
+            model = KMeans(
+                n_clusters=k, init="k-means++", n_init=KMEANS_N_INIT, random_state=self.random_state
+            )
 
-            # Update centroids
-            new_centroids = []
-            for c_idx in range(k):
-                cluster_vectors = [
-                    doc_vectors[i].vector
-                    for i in range(len(doc_vectors))
-                    if assignments[i] == c_idx
-                ]
+        # Corpora with fewer distinct documents than k just leave clusters empty
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ConvergenceWarning)
+            return model.fit_predict(matrix)
 
-                if cluster_vectors:
-                    centroid = self._average_vectors(cluster_vectors)
-                else:
-                    centroid = centroids[c_idx]
+    def _hierarchical_labels(self, matrix: sparse.csr_matrix, k: int) -> np.ndarray:
+        """
+        Agglomerative (Ward) clustering.
 
-                new_centroids.append(centroid)
+        Small corpora are clustered exactly. Larger ones are first reduced to
+        k-means micro-clusters, which Ward then merges using their sizes as
+        weights, keeping the cached distance matrix bounded.
+        """
+        n = matrix.shape[0]
+        if n <= AGGLOMERATIVE_EXACT_LIMIT:
+            gram = (matrix @ matrix.T).toarray()
+            return self._ward_labels(gram, np.ones(n), k)
+
+        micro = min(max(AGGLOMERATIVE_MICRO_CLUSTERS, k), n)
+        micro_labels = self._kmeans_labels(matrix, micro)
+        sizes = np.bincount(micro_labels, minlength=micro).astype(np.float64)
+        occupied = np.flatnonzero(sizes)
+
+        # Micro-cluster centroids (dense, micro x vocabulary) via one sparse product
+        assignment = sparse.csr_matrix(
+            (np.ones(n), (micro_labels, np.arange(n))), shape=(micro, n)
+        )[occupied]
+        centroids = sparse.diags(1.0 / sizes[occupied]) @ assignment @ matrix
+        gram = (centroids @ centroids.T).toarray()
+
+        node_labels = self._ward_labels(gram, sizes[occupied], min(k, occupied.size))
+        remap = np.full(micro, -1, dtype=np.int64)
+        remap[occupied] = node_labels
+        return remap[micro_labels]
+
+    @staticmethod
+    def _ward_labels(gram: np.ndarray, sizes: np.ndarray, k: int) -> np.ndarray:
+        """
+        Cut a Ward dendrogram into k clusters using the nearest-neighbour chain.
 
-            centroids = new_centroids
-            iterations += 1
+        ``gram`` holds inner products of the m weighted nodes. Linkage
+        distances are computed once and maintained with Lance-Williams
+        updates, so building the dendrogram is O(m^2) rather than O(m^3).
+        """
+        m = len(sizes)
+        if k >= m:
+            return np.arange(m)
+
+        sq_norms = np.diag(gram)
+        sq_dist = np.maximum(sq_norms[:, None] + sq_norms[None, :] - 2.0 * gram, 0.0)
+        # Ward merge cost: increase in within-cluster sum of squares
+        dist = sq_dist * np.outer(sizes, sizes) / np.add.outer(sizes, sizes)
+        np.fill_diagonal(dist, np.inf)
+        size = sizes.astype(np.float64).copy()
+
+        merges: list[tuple[float, int, int]] = []
+        chain: list[int] = []
+        active = list(range(m))
+        for _ in range(m - 1):
+            if not chain:
+                while size[active[-1]] == 0:
+                    active.pop()
+                chain.append(active[-1])
+            while True:
+                a = chain[-1]
+                b = int(np.argmin(dist[a]))
+                if len(chain) > 1 and dist[a, chain[-2]] <= dist[a, b]:
+                    b = chain[-2]
+                if len(chain) > 1 and b == chain[-2]:
+                    break
+                chain.append(b)
+
+            b, a = chain.pop(), chain.pop()
+            d = dist[a, b]
+            merges.append((d, a, b))
+
+            # Lance-Williams update: node a becomes the merged cluster, b retires
+            na, nb = size[a], size[b]
+            with np.errstate(invalid="ignore"):
+                merged = ((na + size) * dist[a] + (nb + size) * dist[b] - size * d) / (
+                    na + nb + size
+                )
+            merged[a] = np.inf
+            dist[a, :] = merged
+            dist[:, a] = merged
+            dist[b, :] = np.inf
+            dist[:, b] = np.inf
+            size[a] = na + nb
+            size[b] = 0
+
+        # Ward is reducible, so applying the cheapest m - k merges yields the k-cut
+        order = sorted(range(len(merges)), key=lambda i: merges[i][0])
+        parent = list(range(m))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for i in order[: m - k]:
+            _, a, b = merges[i]
+            parent[find(b)] = find(a)
+
+        roots = np.array([find(i) for i in range(m)])
+        return np.unique(roots, return_inverse=True)[1]
+
+    def _density_labels(self, matrix: sparse.csr_matrix) -> np.ndarray:
+        """DBSCAN over cosine distances; noise documents are labelled -1."""
+        model = DBSCAN(
+            eps=self.dbscan_eps,
+            min_samples=self.dbscan_min_samples,
+            metric="cosine",
+            algorithm="brute",
+        )
+        return model.fit_predict(matrix)
 
-        # Create cluster objects
+    def _build_clusters(
+        self,
+        matrix: sparse.csr_matrix,
+        labels: np.ndarray,
+        num_clusters: int,
+        documents: list[str],
+        vocabulary: list[str],
+    ) -> list[Cluster]:
+        """Create Cluster objects from a label vector."""
         clusters = []
-        for c_idx in range(k):
-            members = []
-            for doc_idx, assignment in enumerate(assignments):
-                if assignment == c_idx:
-                    doc_vec = doc_vectors[doc_idx]
-                    members.append(
-                        ClusterMember(
-                            doc_id=doc_vec.doc_id,
-                            text=doc_vec.text,
-                            similarity=1.0
-                            - self._vector_distance(doc_vec.vector, centroids[c_idx]),
-                        )
-                    )
-
-            top_terms = self._extract_top_terms(centroids[c_idx], 10)
+        order = np.argsort(labels, kind="stable")
+        bounds = np.searchsorted(labels[order], np.arange(num_clusters + 1))
+
+        for c_idx in range(num_clusters):
+            member_idx = order[bounds[c_idx] : bounds[c_idx + 1]]
+            if member_idx.size:
+                rows = matrix[member_idx]
+                centroid = np.asarray(rows.mean(axis=0)).ravel()
+                norm = np.linalg.norm(centroid)
+                similarities = rows @ (centroid / norm) if norm > 0 else np.zeros(member_idx.size)
+            else:
+                centroid = np.zeros(matrix.shape[1])
+                similarities = np.zeros(0)
+
+            members = [
+                ClusterMember(doc_id=str(i), text=documents[i], similarity=float(sim))
+                for i, sim in zip(member_idx.tolist(), similarities, strict=True)
+            ]
+            nonzero = np.flatnonzero(centroid)
+            top = nonzero[np.argsort(-centroid[nonzero], kind="stable")[:TOP_TERMS]]
 
             clusters.append(
                 Cluster(
                     cluster_id=c_idx,
                     members=members,
-                    top_terms=top_terms,
-                    centroid=centroids[c_idx],
+                    top_terms=[(vocabulary[j], float(centroid[j])) for j in top],
+                    centroid={vocabulary[j]: float(centroid[j]) for j in nonzero},
                     size=len(members),
                     cohesion=0.0,
                     separation=0.0,
@@ -367,55 +545,6 @@ class DocumentClusterer:
 
         return clusters
 
-    def _hierarchical_cluster(self, doc_vectors: list[DocumentVector], k: int) -> list[Cluster]:
-        """Simplified hierarchical clustering."""
-        # Start with each document as its own cluster
-        clusters = [[doc_vec] for doc_vec in doc_vectors]
-
-        # Merge until we have k clusters
-        while len(clusters) > k:
-            # Find most similar pair
-            best_i, best_j = 0, 1
-            best_distance = float("inf")
-
-            for i in range(len(clusters)):
-                for j in range(i + 1, len(clusters)):
-                    distance = self._cluster_distance(clusters[i], clusters[j])
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_i, best_j = i, j
-
-            # Merge clusters
-            clusters[best_i].extend(clusters[best_j])
-            clusters.pop(best_j)
-
-        # Create cluster objects
-        result_clusters = []
-        for c_idx, cluster_docs in enumerate(clusters):
-            centroid = self._calculate_centroid(cluster_docs)
-            members = [ClusterMember(d.doc_id, d.text, 0.8) for d in cluster_docs]
-            top_terms = self._extract_top_terms(centroid, 10)
-
-            result_clusters.append(
-                Cluster(
-                    cluster_id=c_idx,
-                    members=members,
-                    top_terms=top_terms,
-                    centroid=centroid,
-                    size=len(members),
-                    cohesion=0.0,
-                    separation=0.0,
-                )
-            )
-
-        return result_clusters
-
-    def _density_cluster(self, doc_vectors: list[DocumentVector]) -> list[Cluster]:
-        """Simplified density-based clustering."""
-        # For simplicity, fall back to k-means with auto k
-        k = self._estimate_optimal_clusters([v.text for v in doc_vectors])
-        return self._kmeans_cluster(doc_vectors, k)
-
     def _characterize_clusters(self, clusters: list[Cluster]):
         """Calculate cluster characteristics."""
         for cluster in clusters:
@@ -426,43 +555,26 @@ class DocumentClusterer:
             similarities = [m.similarity for m in cluster.members]
             cluster.cohesion = sum(similarities) / len(similarities) if similarities else 0.0
 
-    def _calculate_silhouette_score(
-        self, clusters: list[Cluster], doc_vectors: list[DocumentVector]
-    ) -> float:
-        """Calculate silhouette score for clustering quality."""
-        if len(clusters) < 2:
+    def _calculate_silhouette_score(self, matrix: sparse.csr_matrix, labels: np.ndarray) -> float:
+        """Cosine silhouette score, sampled for large corpora (noise excluded)."""
+        clustered = labels >= 0
+        labels = labels[clustered]
+        num_labels = np.unique(labels).size
+        if num_labels < 2:
             return 1.0
-
-        scores = []
-
-        for cluster in clusters:
-            for member in cluster.members:
-                doc_vec = next((v for v in doc_vectors if v.doc_id == member.doc_id), None)
-                if not doc_vec:
-                    continue
-
-                # Intra-cluster distance
-                a = 1.0 - member.similarity
-
-                # Inter-cluster distance (to nearest other cluster)
-                b = float("inf")
-                for other_cluster in clusters:
-                    if other_cluster.cluster_id == cluster.cluster_id:
-                        continue
-
-                    for other_member in other_cluster.members:
-                        if other_member.doc_id == member.doc_id:
-                            distance = 1.0 - other_member.similarity
-                            b = min(b, distance)
-
-                if b == float("inf"):
-                    b = a
-
-                # Silhouette coefficient
-                silhouette = (b - a) / max(a, b) if max(a, b) > 0 else 0
-                scores.append(silhouette)
-
-        return sum(scores) / len(scores) if scores else 0.0
+        if num_labels >= labels.size:
+            return 0.0
+
+        sample_size = SILHOUETTE_SAMPLE_SIZE if labels.size > SILHOUETTE_SAMPLE_SIZE else None
+        return float(
+            silhouette_score(
+                matrix[clustered],
+                labels,
+                metric="cosine",
+                sample_size=sample_size,
+                random_state=self.random_state,
+            )
+        )
 
     def _generate_topic_labels(self, clusters: list[Cluster]) -> dict[int, str]:
         """Generate topic labels for clusters."""
@@ -523,14 +635,6 @@ class DocumentClusterer:
         vectors = [dv.vector for dv in doc_vectors]
         return self._average_vectors(vectors)
 
-    def _cluster_distance(
-        self, cluster1: list[DocumentVector], cluster2: list[DocumentVector]
-    ) -> float:
-        """Calculate distance between two clusters."""
-        centroid1 = self._calculate_centroid(cluster1)
-        centroid2 = self._calculate_centroid(cluster2)
-        return self._vector_distance(centroid1, centroid2)
-
     def _calculate_cluster_similarity(self, cluster1: Cluster, cluster2: Cluster) -> float:
         """Calculate similarity between two clusters."""
         return 1.0 - self._vector_distance(cluster1.centroid, cluster2.centroid)
@@ -542,15 +646,14 @@ class DocumentClusterer:
 
     def _tokenize(self, text: str) -> list[str]:
         """Tokenize text."""
-        if self.has_nltk:
+        if self.has_nltk and self._punkt_available:
             try:
                 return word_tokenize(text)
             except LookupError:
-                pass
-
-        import re
+                # Don't pay for the failed resource lookup on every document
+                self._punkt_available = False
 
-        return re.findall(r"\b\w+\b", text.lower())
+        return WORD_RE.findall(text.lower())
 
     def _get_basic_stopwords(self) -> set:
         """Get basic stopwords."""
@@ -12,7 +12,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -108,70 +110,268 @@ class Event:
         return True
 
 
+# Dispatch tuning
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+DEFAULT_HANDLER_QUEUE_SIZE = 1_000
+DEFAULT_BATCH_TIMEOUT = 0.05  # seconds a batching handler waits to fill a batch
+STOP_DRAIN_TIMEOUT = 5.0
+OVERFLOW_POLICIES = ("block", "drop", "coalesce")
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUEUE_DEPTH_BUCKETS = (0, 1, 10, 100, 1000, 10_000)
+
+
+class _Histogram:
+    """Fixed-bucket histogram (cumulative counts are left to the consumer)."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        labels = [f"<={b}" for b in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.total,
+            "avg": self.sum / self.total if self.total else 0.0,
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
 class EventHandler:
     """Base class for event handlers.
 
-    Handlers can be sync or async functions that process events.
+    Handlers can be sync or async functions that process events. Batching
+    handlers (``batch_size > 1``) receive a list of events per call.
     """
 
-    def __init__(self, callback: Callable, name: str = ""):
+    def __init__(
+        self,
+        callback: Callable,
+        name: str = "",
+        max_concurrency: int = 1,
+        batch_size: int = 1,
+        batch_timeout: float = DEFAULT_BATCH_TIMEOUT,
+    ):
         """Initialize event handler.
 
         Args:
             callback: Function to call when event is triggered
             name: Optional name for the handler
+            max_concurrency: Number of invocations allowed in flight at once
+            batch_size: Deliver up to this many events per call (1 = one event per call)
+            batch_timeout: Max seconds to wait for a batch to fill
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
         self.callback = callback
         self.name = name or getattr(callback, "__name__", "handler")
         self.is_async = asyncio.iscoroutinefunction(callback)
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.latency = _Histogram(LATENCY_BUCKETS_MS)
+        self.inbox: asyncio.Queue | None = None
 
-    async def handle(self, event: Event) -> None:
+    async def handle(self, event: Event) -> bool:
         """Handle an event.
 
         Args:
             event: Event to handle
+
+        Returns:
+            True if the callback succeeded, False if it raised
+        """
+        return await self._invoke(event, event.type.value)
+
+    async def handle_batch(self, events: list[Event]) -> bool:
+        """Handle a batch of events with a single callback invocation.
+
+        Args:
+            events: Events to handle
+
+        Returns:
+            True if the callback succeeded, False if it raised
         """
+        return await self._invoke(events, f"batch of {len(events)}")
+
+    async def _invoke(self, payload: Any, label: str) -> bool:
+        started = time.perf_counter()
         try:
             if self.is_async:
-                await self.callback(event)
+                await self.callback(payload)
             else:
-                self.callback(event)
+                self.callback(payload)
+            return True
         except Exception as e:
             logger.error(
-                f"Error in handler {self.name} processing event {event.type.value}: {e}",
+                f"Error in handler {self.name} processing event {label}: {e}",
                 exc_info=True,
             )
+            return False
+        finally:
+            self.latency.observe((time.perf_counter() - started) * 1000)
 
     def __repr__(self) -> str:
         """String representation of handler."""
         return f"EventHandler(name={self.name}, async={self.is_async})"
 
 
+class _QueuedEvent:
+    """Mutable queue slot so a pending event can be coalesced in place."""
+
+    __slots__ = ("event", "key")
+
+    def __init__(self, event: Event, key: Hashable | None):
+        self.event = event
+        self.key = key
+
+
+class _FilterIndex:
+    """Filtered subscriptions for one event type, indexed by one equality criterion.
+
+    Each subscription is filed under the first hashable criterion it has
+    (a data/metadata key or ``source``). Routing an event looks up only the
+    buckets for the event's values, so cost scales with the number of
+    distinct filter keys rather than the number of subscribers. Candidates
+    are then confirmed with ``Event.matches_filter``.
+    """
+
+    def __init__(self):
+        self.by_key: dict[str, dict[Hashable, list[tuple[EventHandler, dict]]]] = {}
+        self.unindexed: list[tuple[EventHandler, dict]] = []
+
+    @staticmethod
+    def _routing_key(criteria: dict[str, Any]) -> tuple[str, Hashable] | None:
+        for key, value in criteria.items():
+            if key == "type":
+                continue
+            if isinstance(value, Hashable) and not (key == "source" and not isinstance(value, str)):
+                return key, value
+        return None
+
+    def add(self, handler: EventHandler, criteria: dict[str, Any]) -> None:
+        routing = self._routing_key(criteria)
+        if routing is None:
+            self.unindexed.append((handler, criteria))
+        else:
+            key, value = routing
+            self.by_key.setdefault(key, {}).setdefault(value, []).append((handler, criteria))
+
+    def remove(self, callback: Callable) -> EventHandler | None:
+        for entries in [self.unindexed, *(b for v in self.by_key.values() for b in v.values())]:
+            for i, (handler, _) in enumerate(entries):
+                if handler.callback == callback:
+                    entries.pop(i)
+                    return handler
+        return None
+
+    def handlers(self) -> list[EventHandler]:
+        return [h for h, _ in self.unindexed] + [
+            h
+            for buckets in self.by_key.values()
+            for entries in buckets.values()
+            for h, _ in entries
+        ]
+
+    def match(self, event: Event) -> list[EventHandler]:
+        candidates = list(self.unindexed)
+        for key, buckets in self.by_key.items():
+            if key == "source":
+                value = event.source
+            elif key in event.data:
+                value = event.data[key]
+            elif key in event.metadata:
+                value = event.metadata[key]
+            else:
+                # matches_filter ignores criteria the event does not carry
+                candidates.extend(e for entries in buckets.values() for e in entries)
+                continue
+            try:
+                candidates.extend(buckets.get(value, ()))
+            except TypeError:  # unhashable event value: fall back to checking every bucket
+                candidates.extend(e for entries in buckets.values() for e in entries)
+        return [handler for handler, criteria in candidates if event.matches_filter(criteria)]
+
+
+def _default_coalesce_key(event: Event) -> Hashable:
+    return (event.type, event.source)
+
+
 class EventBus:
     """Central event bus for pub/sub event system.
 
     Manages event publication and subscription with filtering support.
     Supports both sync and async event handlers.
 
+    Events are dispatched to every matching handler concurrently: each
+    handler has its own bounded inbox served by ``max_concurrency`` workers,
+    so a slow subscriber only delays itself until its inbox fills up. The
+    bus queue is bounded too; when it is full, ``overflow_policy`` decides
+    whether publishers wait (``block``, via ``publish_async``), the event is
+    dropped (``drop``), or it replaces a pending event with the same
+    coalesce key (``coalesce``, falling back to evicting the oldest event).
+
     Attributes:
-        _subscribers: Dictionary mapping event types to handler lists
-        _event_queue: Queue of pending events to process
+        _subscribers: Dictionary mapping event types to unfiltered handler lists
+        _filtered: Dictionary mapping event types to indexed filtered handlers
+        _event_queue: Bounded queue of pending events
         _running: Flag indicating if bus is active
         _stats: Event statistics
     """
 
-    def __init__(self):
-        """Initialize the event bus."""
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow_policy: str = "block",
+        coalesce_key: Callable[[Event], Hashable] | None = None,
+        handler_queue_size: int = DEFAULT_HANDLER_QUEUE_SIZE,
+    ):
+        """Initialize the event bus.
+
+        Args:
+            max_queue_size: Capacity of the bus queue (0 = unbounded)
+            overflow_policy: "block", "drop" or "coalesce" when the queue is full
+            coalesce_key: Key identifying events that may replace each other
+                (defaults to event type and source)
+            handler_queue_size: Capacity of each handler's inbox
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}")
+
         self._subscribers: dict[EventType, list[EventHandler]] = {}
-        self._global_handlers: list[tuple] = []  # (handler, filter_criteria)
-        self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._filtered: dict[EventType, _FilterIndex] = {}
+        self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._pending_by_key: dict[Hashable, _QueuedEvent] = {}
+        self.overflow_policy = overflow_policy
+        self._coalesce_key = coalesce_key or _default_coalesce_key
+        self._handler_queue_size = handler_queue_size
+        self._workers: dict[EventHandler, list[asyncio.Task]] = {}
         self._running: bool = False
-        self._stats = {
+        self._queue_depth = _Histogram(QUEUE_DEPTH_BUCKETS)
+        self._stats = self._new_stats()
+        logger.debug("EventBus initialized")
+
+    @staticmethod
+    def _new_stats() -> dict[str, int]:
+        return {
             "published": 0,
             "processed": 0,
             "errors": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "blocked": 0,
         }
-        logger.debug("EventBus initialized")
 
     def subscribe(
         self,
@@ -179,6 +379,9 @@ class EventBus:
         handler: Callable,
         filter_criteria: dict[str, Any] | None = None,
         name: str = "",
+        max_concurrency: int = 1,
+        batch_size: int = 1,
+        batch_timeout: float = DEFAULT_BATCH_TIMEOUT,
     ) -> None:
         """Subscribe to events of a specific type.
 
@@ -187,14 +390,23 @@ class EventBus:
             handler: Callback function (sync or async)
             filter_criteria: Optional criteria to filter events
             name: Optional name for the handler
+            max_concurrency: Concurrent invocations allowed for this handler
+            batch_size: Opt into batched delivery (callback receives a list of events)
+            batch_timeout: Max seconds to wait for a batch to fill
         """
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
 
-        handler_obj = EventHandler(handler, name or f"handler_{len(self._subscribers[event_type])}")
+        handler_obj = EventHandler(
+            handler,
+            name or f"handler_{len(self._subscribers[event_type])}",
+            max_concurrency=max_concurrency,
+            batch_size=batch_size,
+            batch_timeout=batch_timeout,
+        )
 
         if filter_criteria:
-            self._global_handlers.append((handler_obj, filter_criteria))
+            self._filtered.setdefault(event_type, _FilterIndex()).add(handler_obj, filter_criteria)
         else:
             self._subscribers[event_type].append(handler_obj)
 
@@ -210,34 +422,143 @@ class EventBus:
         Returns:
             True if handler was removed, False if not found
         """
-        if event_type not in self._subscribers:
+        removed = None
+        for i, h in enumerate(self._subscribers.get(event_type, [])):
+            if h.callback == handler:
+                removed = self._subscribers[event_type].pop(i)
+                break
+        if removed is None and event_type in self._filtered:
+            removed = self._filtered[event_type].remove(handler)
+        if removed is None:
             return False
 
-        for i, h in enumerate(self._subscribers[event_type]):
-            if h.callback == handler:
-                self._subscribers[event_type].pop(i)
-                logger.debug(f"Handler unsubscribed from {event_type.value}")
-                return True
-        return False
+        for task in self._workers.pop(removed, []):
+            task.cancel()
+        logger.debug(f"Handler unsubscribed from {event_type.value}")
+        return True
 
     def publish(self, event: Event) -> None:
-        """Publish an event to the bus.
+        """Publish an event to the bus without waiting.
+
+        When the queue is full the overflow policy applies; under ``block``
+        a synchronous publisher cannot wait, so the event is dropped (use
+        ``publish_async`` to wait for space instead).
 
         Args:
             event: Event to publish
         """
-        if not isinstance(event, Event):
-            raise TypeError("Published object must be an Event instance")
-
+        self._validate(event)
         self._stats["published"] += 1
         logger.debug(f"Event published: {event.type.value} from {event.source}")
 
         # Queue event for async processing
-        try:
-            self._event_queue.put_nowait(event)
-        except asyncio.QueueFull:
+        if not self._enqueue_nowait(event):
+            self._stats["dropped"] += 1
             logger.warning(f"Event queue full, dropping event {event.id}")
 
+    async def publish_async(self, event: Event) -> None:
+        """Publish an event, waiting for queue space under the ``block`` policy.
+
+        Args:
+            event: Event to publish
+        """
+        self._validate(event)
+        self._stats["published"] += 1
+
+        if self._enqueue_nowait(event):
+            return
+        if self.overflow_policy == "block":
+            self._stats["blocked"] += 1
+            await self._event_queue.put(_QueuedEvent(event, None))
+            self._queue_depth.observe(self._event_queue.qsize())
+            return
+
+        self._stats["dropped"] += 1
+        logger.warning(f"Event queue full, dropping event {event.id}")
+
+    @staticmethod
+    def _validate(event: Event) -> None:
+        if not isinstance(event, Event):
+            raise TypeError("Published object must be an Event instance")
+
+    def _enqueue_nowait(self, event: Event) -> bool:
+        """Queue an event or apply the overflow policy. Returns False if it was dropped."""
+        coalescing = self.overflow_policy == "coalesce"
+        key = self._coalesce_key(event) if coalescing else None
+
+        if self._event_queue.full():
+            if not coalescing:
+                return False
+            pending = self._pending_by_key.get(key)
+            if pending is not None:
+                pending.event = event  # newest state wins, queue position is kept
+                self._stats["coalesced"] += 1
+                return True
+            # Nothing to merge with: make room by evicting the oldest event
+            oldest = self._event_queue.get_nowait()
+            self._forget(oldest)
+            self._stats["dropped"] += 1
+
+        slot = _QueuedEvent(event, key)
+        self._event_queue.put_nowait(slot)
+        if coalescing:
+            self._pending_by_key[key] = slot
+        self._queue_depth.observe(self._event_queue.qsize())
+        return True
+
+    def _forget(self, slot: _QueuedEvent) -> None:
+        if slot.key is not None and self._pending_by_key.get(slot.key) is slot:
+            del self._pending_by_key[slot.key]
+
+    def _route(self, event: Event) -> list[EventHandler]:
+        """Handlers for an event: unfiltered ones plus indexed filter matches."""
+        handlers = list(self._subscribers.get(event.type, ()))
+        index = self._filtered.get(event.type)
+        if index is not None:
+            handlers.extend(index.match(event))
+        return handlers
+
+    def _ensure_workers(self, handler: EventHandler) -> None:
+        if handler in self._workers:
+            return
+        handler.inbox = asyncio.Queue(maxsize=self._handler_queue_size)
+        self._workers[handler] = [
+            asyncio.create_task(self._handler_worker(handler), name=f"event-{handler.name}-{i}")
+            for i in range(handler.max_concurrency)
+        ]
+
+    async def _handler_worker(self, handler: EventHandler) -> None:
+        """Serve one handler's inbox, batching events if the handler opted in."""
+        inbox = handler.inbox
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await inbox.get()]
+            try:
+                if handler.batch_size > 1:
+                    deadline = loop.time() + handler.batch_timeout
+                    while len(batch) < handler.batch_size:
+                        if not inbox.empty():
+                            batch.append(inbox.get_nowait())
+                            continue
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(inbox.get(), remaining))
+                        except TimeoutError:
+                            break
+                    ok = await handler.handle_batch(batch)
+                else:
+                    ok = await handler.handle(batch[0])
+
+                if ok:
+                    self._stats["processed"] += len(batch)
+                else:
+                    self._stats["errors"] += 1
+            finally:
+                for _ in batch:
+                    inbox.task_done()
+
     async def _process_events(self) -> None:
         """Process events from the queue (internal).
 
@@ -246,30 +567,20 @@ class EventBus:
         while self._running:
             try:
                 # Get event with timeout to allow checking _running flag
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=0.1)
-
-                # Get type-specific handlers
-                handlers = self._subscribers.get(event.type, [])
+                slot = await asyncio.wait_for(self._event_queue.get(), timeout=0.1)
+                self._forget(slot)
+                event = slot.event
 
-                # Get global handlers matching filter criteria
-                matching_global = [
-                    h for h, criteria in self._global_handlers if event.matches_filter(criteria)
-                ]
+                handlers = self._route(event)
 
-                all_handlers = handlers + matching_global
-
-                if not all_handlers:
+                if not handlers:
                     logger.debug(f"No handlers for event {event.type.value}")
                     continue
 
-                # Execute all handlers
-                for handler in all_handlers:
-                    try:
-                        await handler.handle(event)
-                        self._stats["processed"] += 1
-                    except Exception as e:
-                        self._stats["errors"] += 1
-                        logger.error(f"Error processing event: {e}", exc_info=True)
+                # Hand off to each handler's inbox; a full inbox applies backpressure
+                for handler in handlers:
+                    self._ensure_workers(handler)
+                    await handler.inbox.put(event)
 
             except TimeoutError:
                 continue
@@ -277,6 +588,22 @@ class EventBus:
                 self._stats["errors"] += 1
                 logger.error(f"Error in event processing loop: {e}", exc_info=True)
 
+    async def _shutdown_workers(self, drain: bool) -> None:
+        """Optionally let handlers finish their inboxes, then stop the workers."""
+        if drain and self._workers:
+            inboxes = [h.inbox.join() for h in self._workers if h.inbox is not None]
+            try:
+                await asyncio.wait_for(asyncio.gather(*inboxes), STOP_DRAIN_TIMEOUT)
+            except TimeoutError:
+                logger.warning("EventBus stopped with undelivered handler events")
+
+        tasks = [task for tasks in self._workers.values() for task in tasks]
+        self._workers.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def start(self) -> None:
         """Start processing events asynchronously."""
         if self._running:
@@ -287,28 +614,58 @@ class EventBus:
         logger.info("EventBus started")
 
         # Start event processing loop
-        await self._process_events()
+        drain = False
+        try:
+            await self._process_events()
+            drain = True
+        finally:
+            await self._shutdown_workers(drain)
 
     def stop(self) -> None:
         """Stop processing events."""
         self._running = False
         logger.info("EventBus stopped")
 
-    def get_stats(self) -> dict[str, int]:
+    def get_stats(self) -> dict[str, Any]:
         """Get event bus statistics.
 
         Returns:
-            Dictionary with published, processed, and error counts
+            Dictionary with published, processed, error, dropped and coalesced
+            counts, current queue depth, a queue depth histogram and a
+            latency histogram (ms) per handler
         """
-        return self._stats.copy()
+        stats: dict[str, Any] = self._stats.copy()
+        stats["queue_depth"] = self._event_queue.qsize()
+        stats["queue_capacity"] = self._event_queue.maxsize
+        stats["queue_depth_histogram"] = self._queue_depth.snapshot()
+        stats["handler_latency_ms"] = {
+            f"{event_type.value}/{handler.name}": handler.latency.snapshot()
+            for event_type in {*self._subscribers, *self._filtered}
+            for handler in self._type_handlers(event_type)
+            if handler.latency.total
+        }
+        return stats
 
     def reset_stats(self) -> None:
         """Reset event statistics."""
-        self._stats = {
-            "published": 0,
-            "processed": 0,
-            "errors": 0,
-        }
+        self._stats = self._new_stats()
+        self._queue_depth = _Histogram(QUEUE_DEPTH_BUCKETS)
+        for handler in self._all_handlers():
+            handler.latency = _Histogram(LATENCY_BUCKETS_MS)
+
+    def _type_handlers(self, event_type: EventType) -> list[EventHandler]:
+        handlers = list(self._subscribers.get(event_type, ()))
+        index = self._filtered.get(event_type)
+        if index is not None:
+            handlers.extend(index.handlers())
+        return handlers
+
+    def _all_handlers(self) -> list[EventHandler]:
+        return [
+            h
+            for event_type in {*self._subscribers, *self._filtered}
+            for h in self._type_handlers(event_type)
+        ]
 
     def get_subscriber_count(self, event_type: EventType | None = None) -> int:
         """Get number of subscribers.
@@ -320,10 +677,8 @@ class EventBus:
             Number of subscribers
         """
         if event_type:
-            return len(self._subscribers.get(event_type, []))
-        return sum(len(handlers) for handlers in self._subscribers.values()) + len(
-            self._global_handlers
-        )
+            return len(self._type_handlers(event_type))
+        return len(self._all_handlers())
 
     def __repr__(self) -> str:
         """String representation of EventBus."""
@@ -11,14 +11,21 @@ Features:
 - Subjectivity scoring
 - Sentiment trend analysis for longer texts
 - Confidence scoring
+- Single-pass keyword matching against a precompiled emotion lexicon
+- Streaming batch analysis on a process pool (analyze_many)
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 
 try:
     from textblob import TextBlob
@@ -36,6 +43,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+WORD_RE = re.compile(r"\b\w+\b")
+ANALYZE_CHUNK_SIZE = 64  # texts per process-pool task in analyze_many
+
 
 class SentimentPolarity(Enum):
     """Sentiment classification categories."""
@@ -202,34 +212,80 @@ class SentimentAnalyzer:
         self.has_vader = VADER_AVAILABLE
 
         if self.has_vader:
-            self.vader = SentimentIntensityAnalyzer()
+            try:
+                self.vader = SentimentIntensityAnalyzer()
+            except LookupError:
+                logger.warning("VADER lexicon not installed; run nltk.download('vader_lexicon')")
+                self.has_vader = False
 
         if not (self.has_textblob or self.has_vader):
             logger.warning(
                 "No sentiment analysis backends available. Install textblob or nltk[vader]"
             )
 
+        # Compile the keyword tables once instead of rescanning them per text
+        self._lexicon = self._compile_lexicon(self.EMOTION_KEYWORDS)
+        self._sarcasm_patterns = [re.compile(p, re.IGNORECASE) for p in self.SARCASM_PATTERNS]
+
+    @staticmethod
+    def _compile_lexicon(
+        emotion_keywords: dict[EmotionType, dict[str, list[str]]],
+    ) -> dict[str, list[tuple[EmotionType, bool]]]:
+        """Map each keyword to the (emotion, is_positive) entries it contributes to."""
+        lexicon: dict[str, list[tuple[EmotionType, bool]]] = {}
+        for emotion_type, keywords_dict in emotion_keywords.items():
+            for side in ("positive", "negative"):
+                for word in keywords_dict[side]:
+                    lexicon.setdefault(word.lower(), []).append((emotion_type, side == "positive"))
+        return lexicon
+
+    def _match_keywords(self, text_lower: str) -> dict[EmotionType, tuple[list[str], list[str]]]:
+        """
+        Find lexicon keywords in one pass over the text's words.
+
+        Keywords match whole words only. Returns positive and negative
+        matches per emotion, each in order of first appearance.
+        """
+        matches: dict[EmotionType, tuple[list[str], list[str]]] = {
+            emotion_type: ([], []) for emotion_type in self.EMOTION_KEYWORDS
+        }
+        seen = set()
+        for word in WORD_RE.findall(text_lower):
+            if word in seen:
+                continue
+            seen.add(word)
+            for emotion_type, is_positive in self._lexicon.get(word, ()):
+                matches[emotion_type][0 if is_positive else 1].append(word)
+        return matches
+
     def analyze(self, text: str) -> SentimentAnalysis:
         """Perform complete sentiment analysis on text."""
         if not text or not text.strip():
             return self._create_neutral_analysis(text)
 
+        # Tokenize once and share the result across all sub-scores
+        text_lower = text.lower()
+        words = text_lower.split()
+        keyword_matches = self._match_keywords(text_lower)
+
         # Polarity scoring
         polarity_score = self._calculate_polarity(text)
         polarity = self._score_to_polarity(polarity_score)
 
         # Subjectivity
-        subjectivity = self._calculate_subjectivity(text)
+        subjectivity = self._calculate_subjectivity(text, words)
 
         # Emotion detection
-        emotions = self._detect_emotions(text)
+        emotions = self._detect_emotions(text, keyword_matches)
         dominant_emotion = max(emotions.items(), key=lambda x: x[1].score)[0]
 
         # Extract keywords
-        sentiment_keywords = self._extract_sentiment_keywords(text)
+        sentiment_keywords = self._extract_sentiment_keywords(text, keyword_matches)
 
         # Calculate metrics
-        intensity = self._calculate_intensity(text, polarity_score, emotions)
+        intensity = self._calculate_intensity(
+            text, polarity_score, emotions, sentiment_keywords, len(words)
+        )
         confidence = self._calculate_confidence(polarity_score, subjectivity)
 
         # Sarcasm detection
@@ -239,7 +295,7 @@ class SentimentAnalyzer:
         is_mixed = self._detect_mixed_sentiment(emotions)
 
         # Comparative (sentiment per word)
-        comparative = polarity_score / max(len(text.split()), 1)
+        comparative = polarity_score / max(len(words), 1)
 
         return SentimentAnalysis(
             text=text,
@@ -256,6 +312,49 @@ class SentimentAnalyzer:
             comparative=comparative,
         )
 
+    def analyze_many(
+        self,
+        texts: Iterable[str],
+        max_workers: int | None = None,
+        chunk_size: int = ANALYZE_CHUNK_SIZE,
+    ) -> Iterator[SentimentAnalysis]:
+        """
+        Analyze many texts on a process pool, streaming results in input order.
+
+        Texts are sent to workers in chunks, and only a few chunks per worker
+        are in flight at once, so arbitrarily long iterables are consumed
+        lazily. Each worker builds its own analyzer of this class once.
+
+        Args:
+            texts: Texts to analyze
+            max_workers: Worker processes (defaults to the CPU count; 1 runs inline)
+            chunk_size: Texts per worker task
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        workers = max_workers or os.cpu_count() or 1
+        iterator = iter(texts)
+        chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+
+        if workers == 1:
+            for chunk in chunks:
+                yield from (self.analyze(text) for text in chunk)
+            return
+
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(type(self),)
+        )
+        try:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_analyze_chunk, chunk))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def analyze_trend(self, text: str, segment_size: int = 50) -> SentimentTrend:
         """Analyze sentiment progression through text segments."""
         sentences = [s.strip() for s in text.split(".") if s.strip()]
@@ -314,11 +413,11 @@ class SentimentAnalyzer:
 
         return 0.0
 
-    def _calculate_subjectivity(self, text: str) -> float:
+    def _calculate_subjectivity(self, text: str, words: list[str] | None = None) -> float:
         """Calculate subjectivity score."""
         if not self.has_textblob or not text.strip():
             # Simple heuristic: count subjective words
-            subjective_words = [
+            subjective_words = {
                 "think",
                 "feel",
                 "believe",
@@ -329,22 +428,26 @@ class SentimentAnalyzer:
                 "appears",
                 "looks",
                 "sounds",
-            ]
-            count = sum(1 for word in text.lower().split() if word in subjective_words)
-            return min(count / max(len(text.split()), 1), 1.0)
+            }
+            if words is None:
+                words = text.lower().split()
+            count = sum(1 for word in words if word in subjective_words)
+            return min(count / max(len(words), 1), 1.0)
 
         blob = TextBlob(text)
         return blob.sentiment.subjectivity
 
-    def _detect_emotions(self, text: str) -> dict[EmotionType, EmotionScore]:
+    def _detect_emotions(
+        self,
+        text: str,
+        keyword_matches: dict[EmotionType, tuple[list[str], list[str]]] | None = None,
+    ) -> dict[EmotionType, EmotionScore]:
         """Detect emotions in text."""
-        text_lower = text.lower()
+        if keyword_matches is None:
+            keyword_matches = self._match_keywords(text.lower())
         emotions = {}
 
-        for emotion_type, keywords_dict in self.EMOTION_KEYWORDS.items():
-            positive_matches = [w for w in keywords_dict["positive"] if w in text_lower]
-            negative_matches = [w for w in keywords_dict["negative"] if w in text_lower]
-
+        for emotion_type, (positive_matches, negative_matches) in keyword_matches.items():
             score = (len(positive_matches) - len(negative_matches)) / max(
                 len(positive_matches) + len(negative_matches), 1
             )
@@ -362,19 +465,24 @@ class SentimentAnalyzer:
 
         return emotions
 
-    def _extract_sentiment_keywords(self, text: str) -> list[str]:
+    def _extract_sentiment_keywords(
+        self,
+        text: str,
+        keyword_matches: dict[EmotionType, tuple[list[str], list[str]]] | None = None,
+    ) -> list[str]:
         """Extract sentiment-bearing keywords."""
-        all_keywords = []
-        for emotion_keywords in self.EMOTION_KEYWORDS.values():
-            all_keywords.extend(emotion_keywords["positive"])
-            all_keywords.extend(emotion_keywords["negative"])
-
-        text_lower = text.lower()
-        found = [word for word in all_keywords if word in text_lower]
-        return list(set(found))
+        if keyword_matches is None:
+            keyword_matches = self._match_keywords(text.lower())
+        found = [w for positive, negative in keyword_matches.values() for w in positive + negative]
+        return list(dict.fromkeys(found))
 
     def _calculate_intensity(
-        self, text: str, polarity: float, emotions: dict[EmotionType, EmotionScore]
+        self,
+        text: str,
+        polarity: float,
+        emotions: dict[EmotionType, EmotionScore],
+        keywords: list[str] | None = None,
+        word_count: int | None = None,
     ) -> float:
         """Calculate overall sentiment intensity."""
         # Factor 1: Polarity magnitude
@@ -384,8 +492,11 @@ class SentimentAnalyzer:
         emotion_intensity = sum(e.confidence for e in emotions.values()) / len(emotions)
 
         # Factor 3: Keyword density
-        keywords = self._extract_sentiment_keywords(text)
-        keyword_density = len(keywords) / max(len(text.split()), 1)
+        if keywords is None:
+            keywords = self._extract_sentiment_keywords(text)
+        if word_count is None:
+            word_count = len(text.split())
+        keyword_density = len(keywords) / max(word_count, 1)
 
         # Combined intensity
         intensity = polarity_intensity * 0.5 + emotion_intensity * 0.3 + keyword_density * 0.2
@@ -402,10 +513,7 @@ class SentimentAnalyzer:
     def _detect_sarcasm(self, text: str) -> bool:
         """Detect potential sarcasm in text."""
         text_lower = text.lower()
-        for pattern in self.SARCASM_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return True
-        return False
+        return any(pattern.search(text_lower) for pattern in self._sarcasm_patterns)
 
     def _detect_mixed_sentiment(self, emotions: dict[EmotionType, EmotionScore]) -> bool:
         """Detect if text contains conflicting sentiments."""
@@ -442,3 +550,29 @@ class SentimentAnalyzer:
             is_mixed=False,
             comparative=0.0,
         )
+
+
+# Per-process analyzer used by analyze_many workers and analyze_text
+_worker_analyzer: SentimentAnalyzer | None = None
+
+
+def _init_worker(analyzer_cls: type[SentimentAnalyzer]) -> None:
+    global _worker_analyzer
+    _worker_analyzer = analyzer_cls()
+
+
+def _analyze_chunk(texts: list[str]) -> list[SentimentAnalysis]:
+    return [analyze_text(text) for text in texts]
+
+
+def analyze_text(text: str) -> SentimentAnalysis:
+    """
+    Analyze text with an analyzer cached per process.
+
+    Picklable entry point for process pools (e.g. the batch processor's
+    process executor), so each worker builds its analyzer only once.
+    """
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = SentimentAnalyzer()
+    return _worker_analyzer.analyze(text)
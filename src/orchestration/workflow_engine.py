@@ -9,14 +9,24 @@ Usage:
     engine = WorkflowEngine()
     workflow = engine.create_workflow("research_topic", steps=[...])
     result = engine.execute(workflow, {"topic": "AI ethics"})
+
+Parallel workflows are scheduled eagerly: each step starts as soon as its
+dependencies complete, bounded by a global and a per-step-type concurrency
+limit. Every finished step is checkpointed, so ``engine.resume(run_id)``
+continues a crashed run from its last completed steps.
 """
 
 import asyncio
+import functools
+import inspect
 import json
 import logging
+import os
 import sqlite3
 import uuid
+from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -29,6 +39,8 @@ logger = logging.getLogger("WorkflowEngine")
 
 DB_PATH = Config().get_path("storage.db_path")
 
+DEFAULT_MAX_CONCURRENCY = 16  # Steps running at once across a workflow run
+
 
 class StepStatus(Enum):
     PENDING = "pending"
@@ -58,6 +70,8 @@ class WorkflowStep:
         depends_on: list[str] | None = None,
         retry: int = 0,
         timeout: int = 300,
+        step_type: str | None = None,
+        cpu_bound: bool = False,
     ):
         self.step_id = step_id
         self.name = name
@@ -66,6 +80,8 @@ class WorkflowStep:
         self.depends_on = depends_on or []
         self.retry = retry
         self.timeout = timeout
+        self.step_type = step_type or name
+        self.cpu_bound = cpu_bound
         self.status = StepStatus.PENDING
         self.result = None
         self.error = None
@@ -94,10 +110,22 @@ class Workflow:
 class WorkflowEngine:
     """Core workflow execution engine."""
 
-    def __init__(self, db_path: str | None = None):
+    def __init__(
+        self,
+        db_path: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        step_type_limits: dict[str, int] | None = None,
+        cpu_executor: Executor | None = None,
+    ):
         self.db_path = db_path or DB_PATH
         self._init_db()
         self._step_registry: dict[str, Callable] = {}
+        self._cpu_bound_steps: set[str] = set()
+        self.max_concurrency = max_concurrency
+        self.step_type_limits: dict[str, int] = dict(step_type_limits or {})
+        self._cpu_executor = cpu_executor
+        self._owns_cpu_executor = cpu_executor is None
+        self._limiters: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore, dict] | None = None
 
     def _init_db(self):
         """Initialize workflow database tables."""
@@ -148,9 +176,27 @@ class WorkflowEngine:
         conn.commit()
         conn.close()
 
-    def register_step(self, step_name: str, handler: Callable):
-        """Register a step handler."""
+    def register_step(self, step_name: str, handler: Callable, cpu_bound: bool = False):
+        """
+        Register a step handler.
+
+        Sync handlers run in a worker thread; pass ``cpu_bound=True`` to run
+        them on the CPU executor (a process pool unless one was supplied).
+        Coroutine handlers are awaited on the event loop.
+        """
         self._step_registry[step_name] = handler
+        if cpu_bound:
+            self._cpu_bound_steps.add(step_name)
+        else:
+            self._cpu_bound_steps.discard(step_name)
+
+    def set_step_type_limit(self, step_type: str, limit: int | None):
+        """Cap how many steps of one type (handler name) run at once. None removes the cap."""
+        if limit is None:
+            self.step_type_limits.pop(step_type, None)
+        else:
+            self.step_type_limits[step_type] = limit
+        self._limiters = None
 
     def create_workflow(
         self,
@@ -161,32 +207,37 @@ class WorkflowEngine:
     ) -> Workflow:
         """Create a new workflow definition."""
         workflow_id = f"wf_{uuid.uuid4().hex[:8]}"
-        workflow_steps = []
-
-        if steps:
-            for step_def in steps:
-                step = WorkflowStep(
-                    step_id=step_def.get("id", f"step_{len(workflow_steps)}"),
-                    name=step_def["name"],
-                    handler=self._step_registry.get(step_def["handler"]),
-                    params=step_def.get("params", {}),
-                    depends_on=step_def.get("depends_on", []),
-                    retry=step_def.get("retry", 0),
-                    timeout=step_def.get("timeout", 300),
-                )
-                workflow_steps.append(step)
 
         workflow = Workflow(
             workflow_id=workflow_id,
             name=name,
             description=description,
-            steps=workflow_steps,
+            steps=self._build_steps(steps or []),
             parallel=parallel,
         )
 
         self._save_workflow(workflow)
         return workflow
 
+    def _build_steps(self, step_defs: list[dict[str, Any]]) -> list[WorkflowStep]:
+        """Instantiate steps from definitions, binding handlers from the registry."""
+        workflow_steps = []
+        for step_def in step_defs:
+            handler_name = step_def["handler"]
+            step = WorkflowStep(
+                step_id=step_def.get("id", f"step_{len(workflow_steps)}"),
+                name=step_def["name"],
+                handler=self._step_registry.get(handler_name),
+                params=step_def.get("params", {}),
+                depends_on=step_def.get("depends_on", []),
+                retry=step_def.get("retry", 0),
+                timeout=step_def.get("timeout", 300),
+                step_type=handler_name,
+                cpu_bound=step_def.get("cpu_bound", handler_name in self._cpu_bound_steps),
+            )
+            workflow_steps.append(step)
+        return workflow_steps
+
     def _save_workflow(self, workflow: Workflow):
         """Save workflow to database."""
         conn = sqlite3.connect(self.db_path)
@@ -197,11 +248,12 @@ class WorkflowEngine:
                 {
                     "id": s.step_id,
                     "name": s.name,
-                    "handler": s.name,
+                    "handler": s.step_type,
                     "params": s.params,
                     "depends_on": s.depends_on,
                     "retry": s.retry,
                     "timeout": s.timeout,
+                    "cpu_bound": s.cpu_bound,
                 }
                 for s in workflow.steps
             ],
@@ -228,18 +280,56 @@ class WorkflowEngine:
     async def execute(self, workflow: Workflow, input_data: dict[str, Any]) -> dict[str, Any]:
         """Execute a workflow with input data."""
         run_id = f"run_{uuid.uuid4().hex[:12]}"
-        workflow.context = {"input": input_data, "steps": {}}
+        self._save_run(run_id, workflow, input_data)
+        return await self._run(workflow, run_id, input_data, {})
+
+    async def resume(self, run_id: str, workflow: Workflow | None = None) -> dict[str, Any]:
+        """
+        Resume a failed or interrupted run from its checkpointed steps.
+
+        Completed steps are restored from workflow_steps and not re-executed.
+        When ``workflow`` is omitted it is rebuilt from the stored definition,
+        so the step handlers must already be registered.
+        """
+        run = self._load_run(run_id)
+        if run is None:
+            raise ValueError(f"Unknown workflow run: {run_id}")
+
+        if run["status"] == "completed":
+            return {"run_id": run_id, "status": "completed", "result": run["output"]}
+
+        if workflow is None:
+            workflow = self._load_workflow(run["workflow_id"])
+            if workflow is None:
+                raise ValueError(f"Workflow {run['workflow_id']} for run {run_id} not found")
+
+        checkpoints = self._load_checkpoints(run_id)
+        logger.info(f"Resuming {run_id} with {len(checkpoints)} checkpointed steps")
+        self._update_run(run_id, "running")
+        return await self._run(workflow, run_id, run["input"], checkpoints)
+
+    async def _run(
+        self,
+        workflow: Workflow,
+        run_id: str,
+        input_data: dict[str, Any],
+        checkpoints: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Drive one run of a workflow, skipping steps restored from checkpoints."""
+        workflow.context = {"input": input_data, "steps": dict(checkpoints)}
+        for step in workflow.steps:
+            if step.step_id in checkpoints:
+                step.status = StepStatus.COMPLETED
+                step.result = checkpoints[step.step_id]
 
         logger.info(f"Starting workflow execution: {workflow.name} ({run_id})")
         workflow.status = WorkflowStatus.RUNNING
 
-        self._save_run(run_id, workflow, input_data)
-
         try:
             if workflow.parallel:
-                result = await self._execute_parallel(workflow)
+                result = await self._execute_parallel(workflow, run_id)
             else:
-                result = await self._execute_sequential(workflow)
+                result = await self._execute_sequential(workflow, run_id)
 
             workflow.status = WorkflowStatus.COMPLETED
             self._update_run(run_id, "completed", result)
@@ -261,14 +351,17 @@ class WorkflowEngine:
                 "error": str(e),
             }
 
-    async def _execute_sequential(self, workflow: Workflow) -> dict[str, Any]:
+    async def _execute_sequential(self, workflow: Workflow, run_id: str) -> dict[str, Any]:
         """Execute steps sequentially."""
-        for step in workflow.steps:
+        for order, step in enumerate(workflow.steps):
+            if step.step_id in workflow.context["steps"]:
+                continue  # Restored from checkpoint
+
             if not self._can_execute(step, workflow.context):
                 step.status = StepStatus.SKIPPED
                 continue
 
-            result = await self._execute_step(step, workflow.context)
+            result = await self._execute_step(step, workflow.context, run_id, order)
             workflow.context["steps"][step.step_id] = result
 
             if step.status == StepStatus.FAILED:
@@ -276,33 +369,73 @@ class WorkflowEngine:
 
         return workflow.context.get("steps", {})
 
-    async def _execute_parallel(self, workflow: Workflow) -> dict[str, Any]:
-        """Execute independent steps in parallel."""
-        completed = {}
-        pending = workflow.steps.copy()
-
-        while pending:
-            ready = [s for s in pending if self._can_execute(s, workflow.context)]
+    async def _execute_parallel(self, workflow: Workflow, run_id: str) -> dict[str, Any]:
+        """
+        Execute steps as a DAG, launching each one as soon as its dependencies finish.
 
-            if not ready:
-                if pending:
-                    raise Exception("Circular dependency or blocked steps")
-                break
+        The first failing step cancels the steps still running and fails the run.
+        """
+        context = workflow.context
+        order = {step.step_id: i for i, step in enumerate(workflow.steps)}
+        pending = {s.step_id: s for s in workflow.steps if s.step_id not in context["steps"]}
 
-            tasks = [self._execute_step(s, workflow.context) for s in ready]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        dependents: dict[str, list[WorkflowStep]] = defaultdict(list)
+        for step in pending.values():
+            for dep in step.depends_on:
+                dependents[dep].append(step)
 
-            for step, result in zip(ready, results, strict=True):
-                if isinstance(result, Exception):
-                    step.status = StepStatus.FAILED
-                    step.error = str(result)
-                    raise result
+        running: dict[asyncio.Task, WorkflowStep] = {}
 
-                workflow.context["steps"][step.step_id] = result
-                completed[step.step_id] = result
-                pending.remove(step)
+        def launch(candidates):
+            for step in candidates:
+                if step.step_id in pending and self._can_execute(step, context):
+                    del pending[step.step_id]
+                    task = asyncio.create_task(
+                        self._execute_limited(step, context, run_id, order[step.step_id])
+                    )
+                    running[task] = step
 
-        return completed
+        try:
+            launch(list(pending.values()))
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    context["steps"][step.step_id] = task.result()
+                    launch(dependents.get(step.step_id, ()))
+
+            if pending:
+                raise Exception("Circular dependency or blocked steps")
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return context["steps"]
+
+    def _get_limiters(self) -> tuple[asyncio.Semaphore, dict[str, asyncio.Semaphore]]:
+        """Global and per-step-type semaphores bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._limiters is None or self._limiters[0] is not loop:
+            type_limits = {
+                step_type: asyncio.Semaphore(limit)
+                for step_type, limit in self.step_type_limits.items()
+            }
+            self._limiters = (loop, asyncio.Semaphore(self.max_concurrency), type_limits)
+        return self._limiters[1], self._limiters[2]
+
+    async def _execute_limited(
+        self, step: WorkflowStep, context: dict[str, Any], run_id: str, order: int
+    ) -> dict[str, Any]:
+        """Run a step once both the global and its step-type limits allow it."""
+        global_limit, type_limits = self._get_limiters()
+        type_limit = type_limits.get(step.step_type)
+        async with global_limit:
+            if type_limit is None:
+                return await self._execute_step(step, context, run_id, order)
+            async with type_limit:
+                return await self._execute_step(step, context, run_id, order)
 
     def _can_execute(self, step: WorkflowStep, context: dict[str, Any]) -> bool:
         """Check if step dependencies are satisfied."""
@@ -310,49 +443,76 @@ class WorkflowEngine:
             if dep not in context.get("steps", {}):
                 return False
             dep_result = context.get("steps", {}).get(dep)
-            if dep_result and dep_result.get("status") == "failed":
+            if isinstance(dep_result, dict) and dep_result.get("status") == "failed":
                 return False
         return True
 
-    async def _execute_step(self, step: WorkflowStep, context: dict[str, Any]) -> dict[str, Any]:
-        """Execute a single step."""
+    def _get_cpu_executor(self) -> Executor:
+        if self._cpu_executor is None:
+            self._cpu_executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return self._cpu_executor
+
+    def shutdown(self):
+        """Release the CPU executor if the engine created it."""
+        if self._owns_cpu_executor and self._cpu_executor is not None:
+            self._cpu_executor.shutdown(wait=True)
+            self._cpu_executor = None
+
+    async def _invoke_handler(self, step: WorkflowStep, params: dict[str, Any]) -> Any:
+        """Await coroutine handlers; offload sync ones to a thread or the CPU executor."""
+        if inspect.iscoroutinefunction(step.handler):
+            return await step.handler(**params)
+        if step.cpu_bound:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_cpu_executor(), functools.partial(step.handler, **params)
+            )
+        return await asyncio.to_thread(step.handler, **params)
+
+    async def _execute_step(
+        self, step: WorkflowStep, context: dict[str, Any], run_id: str, order: int = 0
+    ) -> dict[str, Any]:
+        """Execute a single step, checkpointing its outcome."""
         logger.info(f"Executing step: {step.name}")
         step.status = StepStatus.RUNNING
-
-        self._save_step(step, context.get("input", {}), "running")
-
-        try:
-            if step.handler:
-                resolved_params = self._resolve_params(step.params, context)
-                result = await asyncio.wait_for(
-                    asyncio.to_thread(step.handler, **resolved_params),
-                    timeout=step.timeout,
-                )
-            else:
-                result = {"status": "no_handler", "message": "Step has no handler"}
-
-            step.status = StepStatus.COMPLETED
-            step.result = result
-            self._save_step(step, context.get("input", {}), "completed", result)
-
-            return result
-
-        except TimeoutError:
-            step.status = StepStatus.FAILED
-            step.error = f"Timeout after {step.timeout}s"
-            self._save_step(step, context.get("input", {}), "failed", None, step.error)
-            raise Exception(step.error)
-
-        except Exception as e:
-            if step.retry > 0:
-                logger.warning(f"Step failed, retrying ({step.retry} left): {e}")
-                step.retry -= 0
-                return await self._execute_step(step, context)
-
-            step.status = StepStatus.FAILED
-            step.error = str(e)
-            self._save_step(step, context.get("input", {}), "failed", None, str(e))
-            raise
+        input_data = context.get("input", {})
+
+        self._save_step(run_id, step, order, input_data, "running")
+
+        attempts_left = step.retry
+        while True:
+            try:
+                if step.handler:
+                    resolved_params = self._resolve_params(step.params, context)
+                    result = await asyncio.wait_for(
+                        self._invoke_handler(step, resolved_params),
+                        timeout=step.timeout,
+                    )
+                else:
+                    result = {"status": "no_handler", "message": "Step has no handler"}
+
+                step.status = StepStatus.COMPLETED
+                step.result = result
+                self._save_step(run_id, step, order, input_data, "completed", result)
+
+                return result
+
+            except TimeoutError:
+                step.status = StepStatus.FAILED
+                step.error = f"Timeout after {step.timeout}s"
+                self._save_step(run_id, step, order, input_data, "failed", None, step.error)
+                raise Exception(step.error)
+
+            except Exception as e:
+                if attempts_left > 0:
+                    logger.warning(f"Step failed, retrying ({attempts_left} left): {e}")
+                    attempts_left -= 1
+                    continue
+
+                step.status = StepStatus.FAILED
+                step.error = str(e)
+                self._save_step(run_id, step, order, input_data, "failed", None, str(e))
+                raise
 
     def _resolve_params(self, params: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
         """Resolve parameter references in context."""
@@ -400,7 +560,13 @@ class WorkflowEngine:
             SET status = ?, output_data = ?, error_message = ?, completed_at = ?
             WHERE run_id = ?
             """,
-            (status, json.dumps(output) if output else None, error, datetime.now(), run_id),
+            (
+                status,
+                json.dumps(output, default=str) if output else None,
+                error,
+                datetime.now() if status != "running" else None,
+                run_id,
+            ),
         )
 
         conn.commit()
@@ -408,37 +574,103 @@ class WorkflowEngine:
 
     def _save_step(
         self,
+        run_id: str,
         step: WorkflowStep,
+        order: int,
         input_data: dict,
         status: str,
-        output: dict | None = None,
+        output: Any = None,
         error: str | None = None,
     ):
-        """Save step execution to database."""
+        """Checkpoint a step's state for this run (one row per run and step)."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
+        now = datetime.now()
 
         cursor.execute(
             """
-            INSERT OR REPLACE INTO workflow_steps (step_id, run_id, name, status, input_data, output_data, error_message, started_at, completed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO workflow_steps (step_id, run_id, step_order, name, status, input_data, output_data, error_message, started_at, completed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(step_id) DO UPDATE SET
+                status = excluded.status,
+                output_data = excluded.output_data,
+                error_message = excluded.error_message,
+                started_at = CASE WHEN excluded.status = 'running'
+                                  THEN excluded.started_at ELSE workflow_steps.started_at END,
+                completed_at = excluded.completed_at
             """,
             (
-                step.step_id,
-                f"run_{step.step_id.split('_')[-1]}",
+                f"{run_id}:{step.step_id}",
+                run_id,
+                order,
                 step.name,
                 status,
-                json.dumps(input_data),
-                json.dumps(output) if output else None,
+                json.dumps(input_data, default=str),
+                json.dumps(output, default=str) if output is not None else None,
                 error,
-                datetime.now(),
-                datetime.now(),
+                now,
+                now if status in ("completed", "failed") else None,
             ),
         )
 
         conn.commit()
         conn.close()
 
+    def _load_run(self, run_id: str) -> dict[str, Any] | None:
+        """Fetch a run's workflow, status, input and output."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT workflow_id, status, input_data, output_data FROM workflow_runs WHERE run_id = ?",
+            (run_id,),
+        )
+
+        result = cursor.fetchone()
+        conn.close()
+
+        if not result:
+            return None
+        return {
+            "workflow_id": result[0],
+            "status": result[1],
+            "input": json.loads(result[2]) if result[2] else {},
+            "output": json.loads(result[3]) if result[3] else None,
+        }
+
+    def _load_checkpoints(self, run_id: str) -> dict[str, Any]:
+        """Results of the steps a run already completed, keyed by step id."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT step_id, output_data FROM workflow_steps WHERE run_id = ? AND status = 'completed'",
+            (run_id,),
+        )
+
+        results = cursor.fetchall()
+        conn.close()
+
+        prefix = f"{run_id}:"
+        return {
+            row[0].removeprefix(prefix): json.loads(row[1]) if row[1] else None for row in results
+        }
+
+    def _load_workflow(self, workflow_id: str) -> Workflow | None:
+        """Rebuild a saved workflow definition with handlers from the registry."""
+        stored = self.get_workflow(workflow_id)
+        if not stored:
+            return None
+
+        definition = stored["definition"]
+        return Workflow(
+            workflow_id=stored["workflow_id"],
+            name=stored["name"],
+            description=stored["description"] or "",
+            steps=self._build_steps(definition.get("steps", [])),
+            parallel=definition.get("parallel", False),
+        )
+
     def list_workflows(self) -> list[dict[str, Any]]:
         """List all saved workflows."""
         conn = sqlite3.connect(self.db_path)
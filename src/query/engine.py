@@ -9,6 +9,7 @@ import json
 import os
 import re
 import sqlite3
+import threading
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
@@ -17,13 +18,119 @@ mcp = FastMCP("RetrievalQuery")
 
 DB_PATH = os.path.normpath("D:/mcp_servers/storage/laboratory.db")
 
+# FTS5 shadow index over sentiment_logs.source_file, kept in sync by triggers so
+# every writer (centrifuge, watchers, imports) updates it without knowing about it.
+_FTS_TABLE = "sentiment_logs_fts"
+_FTS_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {_FTS_TABLE} USING fts5(
+        source_file,
+        content='sentiment_logs',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {_FTS_TABLE}_ai AFTER INSERT ON sentiment_logs BEGIN
+        INSERT INTO {_FTS_TABLE}(rowid, source_file) VALUES (new.id, new.source_file);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {_FTS_TABLE}_ad AFTER DELETE ON sentiment_logs BEGIN
+        INSERT INTO {_FTS_TABLE}({_FTS_TABLE}, rowid, source_file)
+        VALUES ('delete', old.id, old.source_file);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {_FTS_TABLE}_au AFTER UPDATE OF source_file ON sentiment_logs
+    BEGIN
+        INSERT INTO {_FTS_TABLE}({_FTS_TABLE}, rowid, source_file)
+        VALUES ('delete', old.id, old.source_file);
+        INSERT INTO {_FTS_TABLE}(rowid, source_file) VALUES (new.id, new.source_file);
+    END
+    """,
+]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# One connection per (thread, database), reused across calls and engine instances
+_pool = threading.local()
+_fts_lock = threading.Lock()
+_fts_ready: dict[str, bool] = {}
+
+
+def _get_connection(db_path: str) -> sqlite3.Connection:
+    """Return this thread's pooled connection to db_path, opening it on first use."""
+    connections = getattr(_pool, "connections", None)
+    if connections is None:
+        connections = _pool.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        connections[db_path] = conn
+    return conn
+
+
+def close_pooled_connections() -> None:
+    """Close the calling thread's pooled connections."""
+    for conn in getattr(_pool, "connections", {}).values():
+        conn.close()
+    _pool.connections = {}
+
+
+def _ensure_fts_index(conn: sqlite3.Connection, db_path: str) -> bool:
+    """Create the FTS5 shadow table and triggers once per database; False if unsupported."""
+    if db_path in _fts_ready:
+        return _fts_ready[db_path]
+
+    with _fts_lock:
+        if db_path in _fts_ready:
+            return _fts_ready[db_path]
+        if not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sentiment_logs'"
+        ).fetchone():
+            return False  # Not initialized yet; check again on the next call
+        try:
+            existed = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (_FTS_TABLE,)
+            ).fetchone()
+            with conn:
+                for statement in _FTS_SCHEMA:
+                    conn.execute(statement)
+                if not existed:
+                    # Backfill the index from the existing history
+                    conn.execute(f"INSERT INTO {_FTS_TABLE}({_FTS_TABLE}) VALUES ('rebuild')")
+            _fts_ready[db_path] = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: use the scan fallback
+            _fts_ready[db_path] = False
+        return _fts_ready[db_path]
+
+
+def _fts_terms(text: str) -> list[str]:
+    """Tokenize free text into quoted FTS5 terms (neutralizes query syntax)."""
+    return [f'"{token}"' for token in _TOKEN_RE.findall(text.lower())]
+
 
 class SemanticSearchEngine:
-    """Provides semantic search capabilities."""
+    """
+    Provides semantic search capabilities.
+
+    Searches run against an FTS5 index of ``sentiment_logs`` ranked with BM25,
+    over the full history, through a pooled per-thread connection. Databases
+    whose SQLite lacks FTS5 fall back to Jaccard scoring of recent rows.
+    """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
 
+    def _connection(self) -> tuple[sqlite3.Connection, bool]:
+        """Pooled connection plus whether the FTS5 index is usable."""
+        conn = _get_connection(self.db_path)
+        return conn, _ensure_fts_index(conn, self.db_path)
+
     def _calculate_similarity(self, query: str, text: str) -> float:
         """Calculates Jaccard similarity between query and text."""
         query_words = set(query.lower().split())
@@ -37,66 +144,122 @@ class SemanticSearchEngine:
 
         return intersection / union if union > 0 else 0.0
 
-    def semantic_search(self, query: str, top_k: int = 10) -> list[dict[str, Any]]:
-        """Searches for semantically similar content."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT source_file, timestamp, neg, neu, pos, compound
-                FROM sentiment_logs
-                ORDER BY timestamp DESC
-                LIMIT 100
-            """)
-
-            results = cursor.fetchall()
-            conn.close()
+    @staticmethod
+    def _format_result(row: tuple, similarity: float) -> dict[str, Any]:
+        return {
+            "source": row[0],
+            "timestamp": row[1],
+            "sentiment": {
+                "neg": row[2],
+                "neu": row[3],
+                "pos": row[4],
+                "compound": row[5],
+            },
+            "similarity_score": similarity,
+        }
 
-            # Score results by semantic similarity
-            scored_results = []
-            for row in results:
-                similarity = self._calculate_similarity(query, row[0])
-                scored_results.append(
-                    {
-                        "source": row[0],
-                        "timestamp": row[1],
-                        "sentiment": {
-                            "neg": row[2],
-                            "neu": row[3],
-                            "pos": row[4],
-                            "compound": row[5],
-                        },
-                        "similarity_score": similarity,
-                    }
-                )
+    def semantic_search(self, query: str, top_k: int = 10) -> list[dict[str, Any]]:
+        """
+        Searches for semantically similar content.
 
-            # Sort by similarity and return top k
-            scored_results.sort(key=lambda x: x["similarity_score"], reverse=True)
-            return scored_results[:top_k]
+        Results are BM25-ranked matches of any query term; ``similarity_score`` is
+        the BM25 relevance scaled so the best hit scores 1.0. Queries without
+        searchable terms return the most recent entries with a score of 0.
+        """
+        try:
+            conn, fts = self._connection()
+            terms = _fts_terms(query)
+
+            if not fts:
+                return self._scan_search(conn, query, top_k)
+
+            if not terms:
+                rows = conn.execute(
+                    """
+                    SELECT source_file, timestamp, neg, neu, pos, compound
+                    FROM sentiment_logs
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                    """,
+                    (top_k,),
+                ).fetchall()
+                return [self._format_result(row, 0.0) for row in rows]
+
+            rows = conn.execute(
+                f"""
+                SELECT l.source_file, l.timestamp, l.neg, l.neu, l.pos, l.compound,
+                       bm25({_FTS_TABLE}) AS rank
+                FROM {_FTS_TABLE}
+                JOIN sentiment_logs l ON l.id = {_FTS_TABLE}.rowid
+                WHERE {_FTS_TABLE} MATCH ?
+                ORDER BY rank
+                LIMIT ?
+                """,
+                (" OR ".join(terms), top_k),
+            ).fetchall()
+
+            # bm25() is negative, lower is better
+            best = -rows[0][6] if rows and rows[0][6] < 0 else 1.0
+            return [self._format_result(row, round(-row[6] / best, 4)) for row in rows]
 
         except Exception:
             return []
 
-    def entity_search(self, entity_name: str) -> dict[str, Any]:
-        """Searches for all mentions of an entity."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+    def _scan_search(
+        self, conn: sqlite3.Connection, query: str, top_k: int
+    ) -> list[dict[str, Any]]:
+        """Fallback without FTS5: Jaccard-score the 100 most recent entries."""
+        rows = conn.execute("""
+            SELECT source_file, timestamp, neg, neu, pos, compound
+            FROM sentiment_logs
+            ORDER BY timestamp DESC
+            LIMIT 100
+        """).fetchall()
+
+        scored_results = [
+            self._format_result(row, self._calculate_similarity(query, row[0])) for row in rows
+        ]
+        scored_results.sort(key=lambda x: x["similarity_score"], reverse=True)
+        return scored_results[:top_k]
 
-            cursor.execute(
-                """
-                SELECT source_file, timestamp, compound, COUNT(*) as mentions
-                FROM sentiment_logs
-                WHERE source_file LIKE ?
-                GROUP BY source_file
-                ORDER BY mentions DESC, timestamp DESC
-            """,
-                (f"%{entity_name}%",),
-            )
+    def entity_search(self, entity_name: str) -> dict[str, Any]:
+        """
+        Searches for all mentions of an entity.
 
-            results = cursor.fetchall()
-            conn.close()
+        Multi-word names match as a phrase and the last word matches as a prefix,
+        so "acme corp" finds "acme_corporation_q3.txt".
+        """
+        try:
+            conn, fts = self._connection()
+            terms = _fts_terms(entity_name)
+
+            if fts and terms:
+                phrase = '"' + " ".join(term.strip('"') for term in terms) + '"*'
+                results = conn.execute(
+                    f"""
+                    SELECT l.source_file, MAX(l.timestamp) AS timestamp, l.compound,
+                           COUNT(*) AS mentions
+                    FROM {_FTS_TABLE}
+                    JOIN sentiment_logs l ON l.id = {_FTS_TABLE}.rowid
+                    WHERE {_FTS_TABLE} MATCH ?
+                    GROUP BY l.source_file
+                    ORDER BY mentions DESC, timestamp DESC
+                    """,
+                    (phrase,),
+                ).fetchall()
+            elif fts:
+                results = []
+            else:
+                results = conn.execute(
+                    """
+                    SELECT source_file, timestamp, compound, COUNT(*) as mentions
+                    FROM sentiment_logs
+                    WHERE source_file LIKE ?
+                    GROUP BY source_file
+                    ORDER BY mentions DESC, timestamp DESC
+                """,
+                    (f"%{entity_name}%",),
+                ).fetchall()
 
             entity_profile = {
                 "entity": entity_name,
@@ -25,7 +25,9 @@ import logging
 import math
 import re
 import sqlite3
+import threading
 from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -78,6 +80,15 @@ ANOMALY_THRESHOLDS = {
     "punctuation_variation": 0.35,  # 35% change = anomaly
 }
 
+# Metrics compared by _compare_linguistic_metrics, in profile-matrix column order
+PROFILE_METRICS = (
+    "avg_sentence_length",
+    "avg_word_length",
+    "type_token_ratio",
+    "passive_voice_ratio",
+)
+COMPARE_BLOCK = 256  # Unknown fingerprints scored per matrix multiply
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -140,6 +151,17 @@ class AnomalyReport:
     analysis_timestamp: str
 
 
+@dataclass
+class _ProfileMatrix:
+    """Stacked author profiles used by compare_many."""
+
+    version: tuple
+    author_ids: list[str]
+    author_names: list[str]
+    signals: np.ndarray  # (M, D) float32, rows scaled to unit length
+    metrics: np.ndarray  # (M, len(PROFILE_METRICS)) float64
+
+
 # ============================================================================
 # SCRIBE ENGINE - CORE CLASS
 # ============================================================================
@@ -157,6 +179,8 @@ class ScribeEngine:
         self.db_path = db_path
         self.centrifuge_path = centrifuge_path
         self.browser_config = None  # Placeholder for potential expansion
+        self._profile_matrix: _ProfileMatrix | None = None
+        self._profile_matrix_lock = threading.Lock()
 
         # Initialize databases
         self._ensure_scribe_tables()
@@ -273,60 +297,114 @@ class ScribeEngine:
         Returns:
             List of AuthorshipMatch results, sorted by confidence descending
         """
-        logger.info("🔍 Comparing unknown fingerprint against known profiles...")
+        return self.compare_many([unknown_fingerprint], min_confidence)[0]
+
+    def compare_many(
+        self,
+        fingerprints: Sequence[LinguisticFingerprint],
+        min_confidence: float = 50.0,
+        top_k: int | None = None,
+    ) -> list[list[AuthorshipMatch]]:
+        """
+        Score N unknown fingerprints against every known author profile at once.
 
-        try:
-            known_profiles = self._get_all_author_profiles()
+        Profiles are served from an in-memory matrix that is rebuilt only when
+        the author_profiles table changes. Signal similarity for a block of
+        unknowns is a single matrix multiply; linguistic metrics are compared
+        with the same rules as _compare_linguistic_metrics, broadcast over
+        the whole block.
 
-            if not known_profiles:
-                logger.warning("⚠️ No known profiles in database")
-                return []
+        Args:
+            fingerprints: Fingerprints to identify
+            min_confidence: Minimum confidence threshold (0-100)
+            top_k: Keep at most this many matches per fingerprint (None = all)
 
-            matches = []
+        Returns:
+            One list of AuthorshipMatch per fingerprint, sorted by confidence descending
+        """
+        logger.info(f"🔍 Comparing {len(fingerprints)} fingerprint(s) against known profiles...")
 
-            for profile in known_profiles:
-                # Calculate composite similarity score
-                signal_similarity = self._calculate_signal_similarity(
-                    unknown_fingerprint.signal_vector, profile["signal_vector"]
-                )
+        try:
+            profiles = self._get_profile_matrix()
 
-                # Weighted metrics comparison
-                metrics_similarity = self._compare_linguistic_metrics(
-                    unknown_fingerprint, LinguisticFingerprint(**profile)
+            if not profiles.author_ids:
+                logger.warning("⚠️ No known profiles in database")
+                return [[] for _ in fingerprints]
+
+            results: list[list[AuthorshipMatch]] = []
+            for start in range(0, len(fingerprints), COMPARE_BLOCK):
+                block = fingerprints[start : start + COMPARE_BLOCK]
+                signal_sim = self._signal_similarity_block(block, profiles.signals)
+                unknown_metrics = np.array(
+                    [[getattr(fp, name) for name in PROFILE_METRICS] for fp in block],
+                    dtype=np.float64,
                 )
+                metrics_sim = self._metrics_similarity_block(unknown_metrics, profiles.metrics)
 
                 # Composite score (70% signal + 30% metrics)
-                composite_score = (signal_similarity * 0.7) + (metrics_similarity * 0.3)
-                confidence = min(100.0, composite_score * 100)
-
-                # Build reasoning
-                reasoning = (
-                    f"Signal alignment: {signal_similarity:.2%} | "
-                    f"Metric similarity: {metrics_similarity:.2%} | "
-                    f"Sentence length match: "
-                    f"{abs(unknown_fingerprint.avg_sentence_length - profile['avg_sentence_length']):.1f} word diff"
-                )
-
-                if confidence >= min_confidence:
-                    match = AuthorshipMatch(
-                        author_id=profile["author_id"],
-                        author_name=profile.get("author_name", "Unknown"),
-                        confidence_score=confidence,
-                        fingerprint_similarity=signal_similarity,
-                        reasoning=reasoning,
-                        match_strength=self._classify_match_strength(confidence),
+                confidence = np.minimum(100.0, (signal_sim * 0.7 + metrics_sim * 0.3) * 100)
+
+                for row, fp in enumerate(block):
+                    results.append(
+                        self._select_matches(
+                            fp,
+                            profiles,
+                            confidence[row],
+                            signal_sim[row],
+                            metrics_sim[row],
+                            min_confidence,
+                            top_k,
+                        )
                     )
-                    matches.append(match)
 
-            # Sort by confidence descending
-            matches = sorted(matches, key=lambda x: x.confidence_score, reverse=True)
-            logger.info(f"✅ Found {len(matches)} potential matches")
-            return matches
+            logger.info(f"✅ Found {sum(len(r) for r in results)} potential matches")
+            return results
 
         except Exception as e:
             logger.exception(f"❌ Profile comparison failed: {e!s}")
             raise
 
+    def _select_matches(
+        self,
+        fingerprint: LinguisticFingerprint,
+        profiles: _ProfileMatrix,
+        confidence: np.ndarray,
+        signal_sim: np.ndarray,
+        metrics_sim: np.ndarray,
+        min_confidence: float,
+        top_k: int | None,
+    ) -> list[AuthorshipMatch]:
+        """Turn one row of scores into sorted AuthorshipMatch results."""
+        candidates = np.flatnonzero(confidence >= min_confidence)
+        if top_k is not None and len(candidates) > top_k:
+            if top_k <= 0:
+                return []
+            keep = np.argpartition(-confidence[candidates], top_k - 1)[:top_k]
+            candidates = np.sort(candidates[keep])
+        order = candidates[np.argsort(-confidence[candidates], kind="stable")]
+
+        matches = []
+        for idx in order:
+            score = float(confidence[idx])
+            similarity = float(signal_sim[idx])
+            reasoning = (
+                f"Signal alignment: {similarity:.2%} | "
+                f"Metric similarity: {float(metrics_sim[idx]):.2%} | "
+                f"Sentence length match: "
+                f"{abs(fingerprint.avg_sentence_length - profiles.metrics[idx, 0]):.1f} word diff"
+            )
+            matches.append(
+                AuthorshipMatch(
+                    author_id=profiles.author_ids[idx],
+                    author_name=profiles.author_names[idx],
+                    confidence_score=score,
+                    fingerprint_similarity=similarity,
+                    reasoning=reasoning,
+                    match_strength=self._classify_match_strength(score),
+                )
+            )
+        return matches
+
     def get_stylo_attribution(self, text: str, corpus_path: str | None = None) -> dict[str, Any]:
         """
         Performs secondary attribution using the R stylo package.
@@ -770,6 +848,42 @@ class ScribeEngine:
         # Cosine similarity (1 = identical, 0 = orthogonal)
         return 1 - cosine(v1, v2)
 
+    def _signal_similarity_block(
+        self, fingerprints: Sequence[LinguisticFingerprint], signals: np.ndarray
+    ) -> np.ndarray:
+        """Cosine similarity of each fingerprint against every unit-length profile row."""
+        width = signals.shape[1]
+        unknown = np.zeros((len(fingerprints), width), dtype=np.float32)
+        norms = np.zeros(len(fingerprints), dtype=np.float32)
+        for row, fp in enumerate(fingerprints):
+            if not fp.signal_vector:
+                continue
+            vector = np.asarray(fp.signal_vector, dtype=np.float32)
+            # Dimensions past the profile width pad to zero on the profile side,
+            # so they only contribute to the unknown vector's norm.
+            norms[row] = np.linalg.norm(vector)
+            unknown[row, : min(width, len(vector))] = vector[:width]
+
+        similarity = unknown @ signals.T
+        nonzero = norms > 0
+        similarity[nonzero] /= norms[nonzero, None]
+        return similarity.astype(np.float64)
+
+    def _metrics_similarity_block(self, unknown: np.ndarray, known: np.ndarray) -> np.ndarray:
+        """Vectorized _compare_linguistic_metrics for an (N, K) x (M, K) pair of metric arrays."""
+        a = unknown[:, None, :]
+        b = known[None, :, :]
+        a_zero = a == 0
+        b_zero = b == 0
+
+        denom = np.maximum(np.abs(a), np.abs(b))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rel_diff = np.abs(a - b) / denom
+        scores = 1.0 - np.minimum(rel_diff, 1.0)
+        scores = np.where(a_zero | b_zero, 0.0, scores)  # No match if one is zero
+        scores = np.where(a_zero & b_zero, 1.0, scores)  # Perfect match when both zero
+        return scores.mean(axis=2)
+
     def _compare_linguistic_metrics(
         self, fp1: LinguisticFingerprint, fp2: LinguisticFingerprint
     ) -> float:
@@ -1045,6 +1159,7 @@ class ScribeEngine:
             )
 
             conn.commit()
+            self._invalidate_profile_matrix()
             logger.info(f"✅ Profile saved for {author_name}")
 
         finally:
@@ -1113,6 +1228,59 @@ class ScribeEngine:
         finally:
             conn.close()
 
+    def _profile_version(self) -> tuple:
+        """Cheap change marker for author_profiles (also catches writes from other processes)."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT COUNT(*), MAX(updated_at) FROM author_profiles").fetchone()
+        finally:
+            conn.close()
+
+    def _invalidate_profile_matrix(self):
+        """Drop the cached profile matrix so the next comparison reloads it."""
+        with self._profile_matrix_lock:
+            self._profile_matrix = None
+
+    def _get_profile_matrix(self) -> _ProfileMatrix:
+        """Return the stacked profile matrix, rebuilding it if author_profiles changed."""
+        version = self._profile_version()
+        with self._profile_matrix_lock:
+            cached = self._profile_matrix
+            if cached is not None and cached.version == version:
+                return cached
+
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = conn.execute(
+                    f"SELECT author_id, author_name, {', '.join(PROFILE_METRICS)}, signal_vector "
+                    "FROM author_profiles"
+                ).fetchall()
+            finally:
+                conn.close()
+
+            vectors = [json.loads(row[-1] or "[]") or [] for row in rows]
+            width = max((len(v) for v in vectors), default=0)
+            signals = np.zeros((len(rows), width), dtype=np.float32)
+            for i, vector in enumerate(vectors):
+                signals[i, : len(vector)] = vector
+            norms = np.linalg.norm(signals, axis=1)
+            nonzero = norms > 0
+            signals[nonzero] /= norms[nonzero, None]
+
+            metrics = np.array(
+                [[value or 0.0 for value in row[2:-1]] for row in rows], dtype=np.float64
+            ).reshape(len(rows), len(PROFILE_METRICS))
+
+            self._profile_matrix = _ProfileMatrix(
+                version=version,
+                author_ids=[row[0] for row in rows],
+                author_names=[row[1] or "Unknown" for row in rows],
+                signals=signals,
+                metrics=metrics,
+            )
+            logger.info(f"✅ Profile matrix built: {len(rows)} profiles x {width} signals")
+            return self._profile_matrix
+
     def save_attribution_result(
         self, unknown_text_hash: str, result: AuthorshipMatch, breakdown: dict
     ):
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
-import random
 import sqlite3
+import zlib
 from collections import Counter
+from collections.abc import Sequence
 from typing import Any
 
 import numpy as np
@@ -12,6 +13,8 @@ from src.core.config import Config
 
 logger = logging.getLogger(__name__)
 
+BOOTSTRAP_BLOCK = 256  # Bootstrap iterations evaluated per batched distance computation
+
 
 class ImpostorsChecker:
     """
@@ -20,10 +23,11 @@ class ImpostorsChecker:
     using iterative bootstrapping with Most Frequent Words (MFWs).
     """
 
-    def __init__(self, db_path: str | None = None):
+    def __init__(self, db_path: str | None = None, seed: int | None = None):
         config = Config()
         base_dir = config.get_path("storage.base_dir")
         self.db_path = db_path or str(base_dir / "storage" / "scribe_profiles.sqlite")
+        self._rng = np.random.default_rng(seed)
 
     def _get_author_vocabulary(self, author_id: str) -> Counter:
         """
@@ -31,30 +35,37 @@ class ImpostorsChecker:
         In production, this would aggregate from stored text samples.
         """
         # Placeholder - in production would fetch actual text samples
-        # For now, return dummy vocab
-        return Counter({f"word_{author_id}_{i}": random.randint(10, 100) for i in range(100)})
-
-    def _load_impostor_pool(self, exclude_author: str, pool_size: int = 20) -> list[str]:
+        # For now, return dummy vocab (stable per author so runs are reproducible)
+        rng = np.random.default_rng(zlib.crc32(author_id.encode("utf-8")))
+        counts = rng.integers(10, 101, size=100)
+        return Counter({f"word_{author_id}_{i}": int(c) for i, c in enumerate(counts)})
+
+    def _load_impostor_pool(
+        self, exclude_author: str | Sequence[str], pool_size: int = 20
+    ) -> list[str]:
         """
         Loads a lazy reference group from existing profiles.
 
         Args:
-            exclude_author: Author ID to exclude from pool
+            exclude_author: Author ID (or IDs) to exclude from pool
             pool_size: Number of random impostors to load
 
         Returns:
             List of author IDs
         """
+        excluded = [exclude_author] if isinstance(exclude_author, str) else list(exclude_author)
+        placeholders = ", ".join("?" for _ in excluded) or "NULL"
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute(
-            """
+            f"""
             SELECT DISTINCT author_id FROM author_profiles
-            WHERE author_id != ?
+            WHERE author_id NOT IN ({placeholders})
             LIMIT ?
         """,
-            (exclude_author, pool_size),
+            (*excluded, pool_size),
         )
 
         impostors = [row[0] for row in cursor.fetchall()]
@@ -66,24 +77,96 @@ class ImpostorsChecker:
 
         return impostors
 
-    def _calculate_distance(self, vocab_a: Counter, vocab_b: Counter, mfws: list[str]) -> float:
+    def _frequency_matrix(self, vocabs: Sequence[Counter]) -> np.ndarray:
         """
-        Calculates distance between two vocabularies using selected MFWs.
-        Uses simple Euclidean distance on normalized frequencies.
+        Projects vocabularies onto their combined word list once.
+
+        Returns:
+            (len(vocabs), V) matrix of relative word frequencies
         """
-        # Extract frequencies for selected MFWs
-        vec_a = np.array([vocab_a.get(word, 0) for word in mfws], dtype=float)
-        vec_b = np.array([vocab_b.get(word, 0) for word in mfws], dtype=float)
+        word_index: dict[str, int] = {}
+        for vocab in vocabs:
+            for word in vocab:
+                word_index.setdefault(word, len(word_index))
+
+        matrix = np.zeros((len(vocabs), len(word_index)), dtype=np.float64)
+        for row, vocab in enumerate(vocabs):
+            if not vocab:
+                continue
+            cols = np.fromiter((word_index[w] for w in vocab), dtype=np.intp, count=len(vocab))
+            counts = np.fromiter(vocab.values(), dtype=np.float64, count=len(vocab))
+            # Normalize by total word count to get relative frequencies
+            matrix[row, cols] = counts / (counts.sum() or 1)
+        return matrix
+
+    def _bootstrap_wins(
+        self,
+        freqs: np.ndarray,
+        n_suspects: int,
+        iterations: int,
+        mfw_size: int,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """
+        Runs every bootstrap iteration as one batched masked-distance computation.
 
-        # Normalize by total word count to get relative frequencies
-        total_a = sum(vocab_a.values()) or 1
-        total_b = sum(vocab_b.values()) or 1
+        Row 0 of ``freqs`` is the target, the next ``n_suspects`` rows are
+        suspects and the remaining rows are impostors. Each iteration samples
+        ``mfw_size`` words without replacement and compares Euclidean distances
+        from the target over those words only.
+
+        Returns:
+            Number of iterations each suspect was closer than every impostor
+        """
+        n_words = freqs.shape[1]
+        mfw_size = min(mfw_size, n_words)
+        wins = np.zeros(n_suspects, dtype=np.int64)
+        if mfw_size == 0:
+            return wins
+
+        # Squared per-word differences from the target: (V, candidates)
+        sq_diff = ((freqs[1:] - freqs[0]) ** 2).T
+
+        for start in range(0, iterations, BOOTSTRAP_BLOCK):
+            block = min(BOOTSTRAP_BLOCK, iterations - start)
+            # Random MFW subset per iteration: first mfw_size of a random ordering
+            keys = rng.random((block, n_words))
+            selected = np.argpartition(keys, mfw_size - 1, axis=1)[:, :mfw_size]
+
+            # (block, candidates) squared Euclidean distances
+            distances = sq_diff[selected].sum(axis=1)
+            closest_impostor = distances[:, n_suspects:].min(axis=1)
+            wins += (distances[:, :n_suspects] < closest_impostor[:, None]).sum(axis=0)
+
+        return wins
+
+    def _verdict(
+        self, suspect_author_id: str, suspect_wins: int, iterations: int, impostor_count: int
+    ) -> dict[str, Any]:
+        """Builds the verification result for one suspect."""
+        # Calculate confidence
+        suspect_wins = int(suspect_wins)
+        confidence = suspect_wins / iterations
+
+        # Determine verdict
+        verified = confidence >= 0.5
+
+        result = {
+            "verified": verified,
+            "confidence": float(confidence),
+            "suspect_author": suspect_author_id,
+            "iterations": iterations,
+            "suspect_wins": suspect_wins,
+            "impostor_count": impostor_count,
+            "verdict": "Verified" if verified else "External Author Likely",
+        }
 
-        vec_a = vec_a / total_a
-        vec_b = vec_b / total_b
+        if verified:
+            logger.info(f"✅ Authorship VERIFIED: {confidence:.2%} confidence")
+        else:
+            logger.warning(f"⚠️ Authorship REJECTED: {confidence:.2%} confidence (threshold: 50%)")
 
-        # Euclidean distance
-        return float(np.linalg.norm(vec_a - vec_b))
+        return result
 
     def verify_authorship(
         self,
@@ -92,6 +175,7 @@ class ImpostorsChecker:
         iterations: int = 100,
         mfw_size: int = 50,
         impostor_count: int = 10,
+        seed: int | None = None,
     ) -> dict[str, Any]:
         """
         Performs authorship verification using the Impostors Method.
@@ -102,72 +186,79 @@ class ImpostorsChecker:
             iterations: Number of bootstrap iterations
             mfw_size: Number of Most Frequent Words to sample per iteration
             impostor_count: Number of random impostors to use
+            seed: Seed for the bootstrap sampler (defaults to the checker's RNG)
 
         Returns:
             Dict with verification results including confidence score
         """
         logger.info(f"🔍 Impostors verification: '{suspect_author_id}' suspect")
 
-        # 1. Get vocabularies
-        target_vocab = Counter(target_text.lower().split())
-        suspect_vocab = self._get_author_vocabulary(suspect_author_id)
-
-        # 2. Load impostor pool
-        impostors = self._load_impostor_pool(suspect_author_id, impostor_count)
-
-        if not impostors:
-            return {"verified": False, "confidence": 0.0, "reason": "No impostor pool available"}
+        results = self.verify_authorship_batch(
+            target_text,
+            [suspect_author_id],
+            iterations=iterations,
+            mfw_size=mfw_size,
+            impostor_count=impostor_count,
+            seed=seed,
+        )
+        return results[suspect_author_id]
 
-        impostor_vocabs = {imp_id: self._get_author_vocabulary(imp_id) for imp_id in impostors}
+    def verify_authorship_batch(
+        self,
+        target_text: str,
+        suspect_author_ids: Sequence[str],
+        iterations: int = 100,
+        mfw_size: int = 50,
+        impostor_count: int = 10,
+        seed: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Verifies several suspects for the same text against one shared impostor pool.
 
-        # 3. Build combined MFW vocabulary
-        all_words = set(target_vocab.keys()) | set(suspect_vocab.keys())
-        for vocab in impostor_vocabs.values():
-            all_words |= set(vocab.keys())
+        All suspects are scored on the same bootstrap MFW samples, so their
+        confidences are directly comparable.
 
-        all_words = list(all_words)
+        Args:
+            target_text: The text to verify
+            suspect_author_ids: Claimed authors to verify
+            iterations: Number of bootstrap iterations
+            mfw_size: Number of Most Frequent Words to sample per iteration
+            impostor_count: Number of random impostors to use
+            seed: Seed for the bootstrap sampler (defaults to the checker's RNG)
 
-        mfw_size = min(mfw_size, len(all_words))
+        Returns:
+            Dict mapping each suspect ID to its verification result
+        """
+        if iterations < 1:
+            raise ValueError(f"iterations must be positive, got {iterations}")
 
-        # 4. Iterative bootstrapping
-        suspect_wins = 0
+        suspects = list(dict.fromkeys(suspect_author_ids))
+        if not suspects:
+            return {}
 
-        for _iteration in range(iterations):
-            # Randomly sample MFWs
-            selected_mfws = random.sample(all_words, mfw_size)
+        # 1. Get vocabularies
+        target_vocab = Counter(target_text.lower().split())
+        suspect_vocabs = [self._get_author_vocabulary(s) for s in suspects]
 
-            # Calculate distance from target to suspect
-            suspect_distance = self._calculate_distance(target_vocab, suspect_vocab, selected_mfws)
+        # 2. Load impostor pool
+        impostors = self._load_impostor_pool(suspects, impostor_count)
 
-            # Calculate distances from target to each impostor
-            impostor_distances = [
-                self._calculate_distance(target_vocab, imp_vocab, selected_mfws)
-                for imp_vocab in impostor_vocabs.values()
-            ]
+        if not impostors:
+            return {
+                s: {"verified": False, "confidence": 0.0, "reason": "No impostor pool available"}
+                for s in suspects
+            }
 
-            # Check if suspect is the closest
-            if suspect_distance < min(impostor_distances):
-                suspect_wins += 1
+        impostor_vocabs = [self._get_author_vocabulary(imp_id) for imp_id in impostors]
 
-        # 5. Calculate confidence
-        confidence = suspect_wins / iterations
+        # 3. Project every vocabulary onto the combined word list once
+        freqs = self._frequency_matrix([target_vocab, *suspect_vocabs, *impostor_vocabs])
 
-        # 6. Determine verdict
-        verified = confidence >= 0.5
+        # 4. Batched bootstrapping
+        rng = self._rng if seed is None else np.random.default_rng(seed)
+        wins = self._bootstrap_wins(freqs, len(suspects), iterations, mfw_size, rng)
 
-        result = {
-            "verified": verified,
-            "confidence": float(confidence),
-            "suspect_author": suspect_author_id,
-            "iterations": iterations,
-            "suspect_wins": suspect_wins,
-            "impostor_count": len(impostors),
-            "verdict": "Verified" if verified else "External Author Likely",
+        return {
+            suspect: self._verdict(suspect, wins[i], iterations, len(impostors))
+            for i, suspect in enumerate(suspects)
         }
-
-        if verified:
-            logger.info(f"✅ Authorship VERIFIED: {confidence:.2%} confidence")
-        else:
-            logger.warning(f"⚠️ Authorship REJECTED: {confidence:.2%} confidence (threshold: 50%)")
-
-        return result
@@ -1,12 +1,16 @@
 import logging
 import re
-from collections.abc import Generator
+from collections import Counter
+from collections.abc import Generator, Iterable
 from typing import Any
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+WORD_RE = re.compile(r"\b\w+\b")
+CHI_SQUARED_EPSILON = 1e-10  # Same guard PyStylWrapper.compare_texts uses
+
 
 class RollingDelta:
     """
@@ -60,16 +64,27 @@ class RollingDelta:
             current_idx += step
 
     def analyze_rolling_delta(
-        self, target_text: str, candidates: dict[str, str], window_size: int = 5000, step: int = 500
+        self,
+        target_text: str,
+        candidates: dict[str, str],
+        window_size: int = 5000,
+        step: int = 500,
+        top_n: int = 100,
     ) -> dict[str, Any]:
         """
         Analyzes the target text in windows against candidate profiles.
 
+        Each candidate is tokenized and profiled once. Window word counts are
+        maintained incrementally (tokens entering the window are added, tokens
+        leaving are subtracted) and scored against every cached candidate
+        vector with the symmetric Chi-squared distance used by PyStyl.
+
         Args:
             target_text: The document to analyze.
             candidates: Dictionary of {AuthorName: ReferenceText}.
             window_size: Tokens per window.
             step: Tokens to advance.
+            top_n: Most frequent words (target + candidates) used as features.
 
         Returns:
             JSON-compatible dict with 'series', 'volatility', and 'windows'.
@@ -80,21 +95,42 @@ class RollingDelta:
         if not candidates:
             return {"error": "No candidates provided"}
 
-        results = {"series": {author: [] for author in candidates}, "windows": [], "volatility": {}}
+        if step < 1:
+            raise ValueError(f"step must be a positive token count, got {step}")
 
-        # Cache candidate vectors calculation could be optimized inside PyStyl,
-        # but for now we call compare_texts directly which recalculates.
-        # Given strict memory limits, recalculation per window is actually safer than caching huge matrices if windows are many.
+        results = {"series": {author: [] for author in candidates}, "windows": [], "volatility": {}}
 
         logger.info(f"🔄 Starting Rolling Delta (Window: {window_size}, Step: {step})")
 
-        for start_idx, window_text in self.generate_windows(target_text, window_size, step):
-            f"{start_idx}-{start_idx + window_size}"
+        tokens = self._tokenize(target_text)
+        reference_tokens = {author: self._tokenize(text) for author, text in candidates.items()}
+
+        vocab = self._feature_vocabulary([tokens, *reference_tokens.values()], top_n)
+        feature_index = {word: i for i, word in enumerate(vocab)}
+        reference_freqs, reference_empty = self._profile_candidates(
+            reference_tokens.values(), feature_index
+        )
+
+        # Out-of-vocabulary tokens land in a spill bin at index len(vocab)
+        feature_ids = np.fromiter(
+            (feature_index.get(token, len(vocab)) for token in tokens),
+            dtype=np.intp,
+            count=len(tokens),
+        )
+
+        authors = list(candidates)
+        for start_idx, counts, length in self._sliding_counts(
+            feature_ids, len(vocab), window_size, step
+        ):
             results["windows"].append(start_idx)  # Use integer index for x-axis charting
 
-            for author, ref_text in candidates.items():
-                # Using Chi-squared as a proxy for Delta distance in this lightweight version
-                distance = self.pystyl.compare_texts(window_text, ref_text, top_n=100)
+            if length == 0:
+                distances = np.full(len(authors), np.inf)
+            else:
+                distances = self._chi_squared(counts / length, reference_freqs)
+                distances[reference_empty] = np.inf
+
+            for author, distance in zip(authors, distances.tolist(), strict=True):
                 results["series"][author].append(distance)
 
         # Calculate Volatility (Std Dev of distance)
@@ -105,3 +141,74 @@ class RollingDelta:
                 results["volatility"][author] = 0.0
 
         return results
+
+    def _tokenize(self, text: str) -> list[str]:
+        """Lower-cased word tokens, matching PyStylWrapper._tokenize."""
+        return [word.lower() for word in WORD_RE.findall(text)] if text else []
+
+    def _feature_vocabulary(self, token_lists: Iterable[list[str]], top_n: int) -> list[str]:
+        """Most frequent words across the target and all candidates."""
+        counts: Counter = Counter()
+        for tokens in token_lists:
+            counts.update(tokens)
+        return [word for word, _ in counts.most_common(top_n)]
+
+    def _profile_candidates(
+        self, reference_tokens: Iterable[list[str]], feature_index: dict[str, int]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Relative feature frequencies for each candidate, computed once per analysis."""
+        profiles = []
+        empty = []
+        for tokens in reference_tokens:
+            row = np.zeros(len(feature_index), dtype=np.float64)
+            for word, count in Counter(tokens).items():
+                idx = feature_index.get(word)
+                if idx is not None:
+                    row[idx] = count
+            if tokens:
+                row /= len(tokens)
+            profiles.append(row)
+            empty.append(not tokens)
+        return np.vstack(profiles), np.array(empty, dtype=bool)
+
+    def _sliding_counts(
+        self, feature_ids: np.ndarray, n_features: int, window_size: int, step: int
+    ) -> Generator[tuple[int, np.ndarray, int]]:
+        """
+        Yields (start_token_index, feature_counts, window_length) per window.
+
+        Windows follow generate_windows: a text shorter than window_size is
+        treated as a single window.
+        """
+        total_tokens = len(feature_ids)
+        bins = n_features + 1  # Trailing spill bin for out-of-vocabulary tokens
+
+        if total_tokens < window_size:
+            logger.warning(
+                f"Text length ({total_tokens}) shorter than window size ({window_size}). Returning single window."
+            )
+            yield (0, np.bincount(feature_ids, minlength=bins)[:n_features], total_tokens)
+            return
+
+        counts = np.bincount(feature_ids[:window_size], minlength=bins)
+        current_idx = 0
+        while True:
+            yield (current_idx, counts[:n_features], window_size)
+
+            next_idx = current_idx + step
+            if next_idx + window_size > total_tokens:
+                return
+            if step >= window_size:
+                counts = np.bincount(feature_ids[next_idx : next_idx + window_size], minlength=bins)
+            else:
+                end_idx = current_idx + window_size
+                counts += np.bincount(feature_ids[end_idx : end_idx + step], minlength=bins)
+                counts -= np.bincount(feature_ids[current_idx:next_idx], minlength=bins)
+            current_idx = next_idx
+
+    @staticmethod
+    def _chi_squared(window_freqs: np.ndarray, reference_freqs: np.ndarray) -> np.ndarray:
+        """Symmetric Chi-squared distance of one window against every candidate row."""
+        numerator = (reference_freqs - window_freqs) ** 2
+        denominator = reference_freqs + window_freqs + CHI_SQUARED_EPSILON
+        return (numerator / denominator).sum(axis=1)
@@ -105,6 +105,124 @@ def test_vector_syncer():
         shutil.rmtree(test_dir, ignore_errors=True)
 
 
+def test_vector_syncer_columnar_search_and_reload():
+    """Embeddings persist as float32 columns and search ranks via the matrix path."""
+    import json
+
+    import polars as pl
+
+    test_dir = tempfile.mkdtemp()
+    ipc_path = os.path.join(test_dir, "vectors.ipc")
+
+    try:
+        syncer = VectorSyncer(
+            store_type=VectorStoreType.LOCAL,
+            local_path=os.path.join(test_dir, "vector.db"),
+            ipc_path=ipc_path,
+            embedding_dim=4,
+        )
+        syncer.add_vector("north", [1.0, 0.0, 0.0, 0.0], metadata={"kind": "a"})
+        syncer.add_vector("north-east", [1.0, 1.0, 0.0, 0.0], metadata={"kind": "b"})
+        syncer.add_vector("south", [-1.0, 0.0, 0.0, 0.0], metadata={"kind": "a"})
+        syncer.add_vector("zero", [0.0, 0.0, 0.0, 0.0], metadata={"kind": "a"})
+
+        with pytest.raises(ValueError):
+            syncer.add_vector("bad", [1.0, 2.0])
+
+        results = syncer.search([1.0, 0.0, 0.0, 0.0], top_k=2)
+        assert [entry.text for entry, _ in results] == ["north", "north-east"]
+        assert results[0][1] == pytest.approx(1.0)
+
+        filtered = syncer.search([1.0, 0.0, 0.0, 0.0], top_k=2, filter_metadata={"kind": "a"})
+        assert [entry.text for entry, _ in filtered] == ["north", "zero"]
+        syncer.close()
+
+        reloaded = VectorSyncer(
+            store_type=VectorStoreType.LOCAL,
+            local_path=os.path.join(test_dir, "vector.db"),
+            ipc_path=ipc_path,
+            embedding_dim=4,
+        )
+        assert reloaded._local_df.schema["embedding"] == pl.Array(pl.Float32, 4)
+        top = reloaded.search([0.0, 1.0, 0.0, 0.0], top_k=1)
+        assert top[0][0].text == "north-east"
+        assert top[0][0].metadata == {"kind": "b"}
+        reloaded.close()
+
+        # Legacy indexes stored embeddings as JSON strings
+        legacy = reloaded._local_df.with_columns(
+            pl.Series("embedding", [json.dumps([1.0, 0.0, 0.0, 0.0])] * 4, dtype=pl.Utf8)
+        )
+        legacy.write_ipc(ipc_path)
+        migrated = VectorSyncer(
+            store_type=VectorStoreType.LOCAL,
+            local_path=os.path.join(test_dir, "vector.db"),
+            ipc_path=ipc_path,
+            embedding_dim=4,
+        )
+        assert len(migrated._local_df) == 4
+        assert migrated.search([1.0, 0.0, 0.0, 0.0], top_k=1)[0][1] == pytest.approx(1.0)
+        migrated.close()
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def test_vector_syncer_append_segments_and_compaction():
+    """Bulk inserts land in append segments; compaction merges them and drops duplicates."""
+    test_dir = tempfile.mkdtemp()
+    ipc_path = os.path.join(test_dir, "vectors.ipc")
+
+    def open_syncer():
+        return VectorSyncer(
+            store_type=VectorStoreType.LOCAL,
+            local_path=os.path.join(test_dir, "vector.db"),
+            ipc_path=ipc_path,
+            embedding_dim=3,
+            flush_rows=4,
+            compact_segments=3,
+            background_compaction=False,
+        )
+
+    try:
+        syncer = open_syncer()
+        batch = [
+            {"text": f"doc-{i}", "embedding": [float(i), 1.0, 0.0], "metadata": {"n": i}}
+            for i in range(10)
+        ]
+        ids = syncer.add_vectors(batch)
+        assert len(ids) == 10
+
+        stats = syncer.get_statistics()
+        assert stats["segments_flushed"] == 2
+        assert stats["buffered_rows"] == 2
+        assert stats["total_vectors"] == 10
+
+        # Simulated crash: only flushed segments survive, the buffer is lost
+        recovered = open_syncer()
+        assert len(recovered._local_df) == 8
+        assert recovered.get_statistics()["append_segments"] == 2
+
+        # Re-ingesting the same ids supersedes rows; the third segment triggers compaction
+        recovered.add_vectors(batch[:4])
+        stats = recovered.get_statistics()
+        assert stats["compactions"] == 1
+        assert stats["append_segments"] == 0
+        assert len(recovered._local_df) == 8
+        assert os.listdir(recovered.segment_dir) == []
+
+        recovered.add_vectors(batch[8:])
+        hits = recovered.search([9.0, 1.0, 0.0], top_k=1)
+        assert hits[0][0].text == "doc-9"
+        recovered.close()
+
+        reopened = open_syncer()
+        assert len(reopened._local_df) == 10
+        assert reopened._local_df["id"].n_unique() == 10
+        reopened.close()
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
 # Test SignatureLibrary
 print("\n" + "=" * 60)
 print("Testing SignatureLibrary...")
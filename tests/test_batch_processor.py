@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.core.batch_processor import BatchProcessor
+
+
+async def _wait_finished(processor, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while processor.get_job_status(job_id)["status"] in ("pending", "processing"):
+        assert time.monotonic() < deadline, "batch job did not finish"
+        await asyncio.sleep(0.01)
+    return processor.get_job_status(job_id)
+
+
+def _square_or_fail(x):
+    if x == 3:
+        raise ValueError("bad item")
+    return x * x
+
+
+@pytest.mark.asyncio
+async def test_async_processor_runs_concurrently_and_keeps_item_order():
+    processor = BatchProcessor()
+    in_flight = 0
+    peak = 0
+
+    async def work(x):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (x % 3))
+        in_flight -= 1
+        if x == 5:
+            raise RuntimeError("boom")
+        return x
+
+    job_id = await processor.create_job(list(range(40)), work, concurrency=8, chunk_size=16)
+    status = await _wait_finished(processor, job_id)
+
+    assert status["status"] == "completed"
+    assert status["progress"] == 1.0
+    assert status["success_count"] == 39
+    assert status["stats"]["items_per_second"] > 0
+    assert status["stats"]["latency_p95_ms"] >= status["stats"]["latency_p50_ms"]
+    assert 1 < peak <= 8
+
+    results = processor.get_job_results(job_id)
+    assert results["results"] == [x for x in range(40) if x != 5]
+    assert results["errors"] == [{"item_index": 5, "error": "boom"}]
+
+
+@pytest.mark.asyncio
+async def test_sync_processor_runs_on_pool_without_blocking_loop():
+    processor = BatchProcessor(max_workers=4)
+    threads = set()
+
+    def work(x):
+        threads.add(threading.get_ident())
+        time.sleep(0.005)
+        return _square_or_fail(x)
+
+    job_id = await processor.create_job(list(range(20)), work, chunk_size=4)
+    status = await _wait_finished(processor, job_id)
+    processor.shutdown()
+
+    assert status["status"] == "completed"
+    assert status["stats"]["executor"] == "thread"
+    assert threading.get_ident() not in threads
+    results = processor.get_job_results(job_id)
+    assert results["results"] == [x * x for x in range(20) if x != 3]
+    assert results["errors"] == [{"item_index": 3, "error": "bad item"}]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_executor():
+    processor = BatchProcessor(max_workers=2)
+
+    job_id = await processor.create_job([1, 2, 3, 4], _square_or_fail, executor="process")
+    status = await _wait_finished(processor, job_id, timeout=30.0)
+    processor.shutdown()
+
+    assert status["status"] == "completed"
+    assert processor.get_job_results(job_id)["results"] == [1, 4, 16]
+
+
+@pytest.mark.asyncio
+async def test_cancel_job_stops_processing():
+    processor = BatchProcessor()
+
+    async def slow(x):
+        await asyncio.sleep(0.05)
+        return x
+
+    job_id = await processor.create_job(list(range(100)), slow, concurrency=2)
+    await asyncio.sleep(0.12)
+
+    assert await processor.cancel_job(job_id) is True
+    status = processor.get_job_status(job_id)
+    assert status["status"] == "cancelled"
+    assert 0 < status["success_count"] < 100
+    assert processor.get_job_results(job_id) is None
+    assert await processor.cancel_job(job_id) is False
+
+
+@pytest.mark.asyncio
+async def test_job_store_evicts_oldest_finished_jobs():
+    processor = BatchProcessor(max_jobs=3)
+
+    async def echo(x):
+        return x
+
+    job_ids = []
+    for i in range(5):
+        job_ids.append(await processor.create_job([i], echo))
+        await _wait_finished(processor, job_ids[-1])
+
+    assert list(processor.jobs) == job_ids[-3:]
+    assert processor.get_job_status(job_ids[0]) is None
+
+
+@pytest.mark.asyncio
+async def test_create_job_rejects_invalid_options():
+    processor = BatchProcessor()
+
+    async def echo(x):
+        return x
+
+    with pytest.raises(ValueError):
+        await processor.create_job([1], echo, executor="thread")
+    with pytest.raises(ValueError):
+        await processor.create_job([1], _square_or_fail, executor="gpu")
+    with pytest.raises(ValueError):
+        await processor.create_job([1], echo, chunk_size=0)
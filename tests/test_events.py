@@ -574,3 +574,168 @@ class TestEventBusIntegration:
             await task
         except asyncio.CancelledError:
             pass  # Expected
+
+
+# ============================================================================
+# DISPATCH TESTS (concurrency, backpressure, batching, indexed routing)
+# ============================================================================
+
+
+async def _run_bus(bus: EventBus, settle: float = 0.3):
+    task = asyncio.create_task(bus.start())
+    await asyncio.sleep(settle)
+    bus.stop()
+    await task
+
+
+class TestEventDispatch:
+    """Test concurrent dispatch, overflow policies and routing."""
+
+    @pytest.mark.asyncio
+    async def test_slow_handler_does_not_block_others(self):
+        """A slow subscriber runs concurrently with fast ones."""
+        fast = []
+
+        async def slow_handler(event: Event):
+            await asyncio.sleep(0.2)
+
+        def fast_handler(event: Event):
+            fast.append(event)
+
+        bus = EventBus()
+        bus.subscribe(EventType.DOCUMENTS_CLUSTERED, slow_handler, name="slow", max_concurrency=5)
+        bus.subscribe(EventType.DOCUMENTS_CLUSTERED, fast_handler)
+        for i in range(5):
+            bus.publish(Event(type=EventType.DOCUMENTS_CLUSTERED, source="test", data={"i": i}))
+
+        task = asyncio.create_task(bus.start())
+        await asyncio.sleep(0.1)
+        assert len(fast) == 5
+
+        # Five slow invocations overlap instead of taking a second in sequence
+        await asyncio.sleep(0.25)
+        bus.stop()
+        await task
+        stats = bus.get_stats()
+        assert stats["processed"] == 10
+        assert stats["handler_latency_ms"]["documents_clustered/slow"]["count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_counts_overflow(self):
+        """Events beyond capacity are dropped and counted."""
+        bus = EventBus(max_queue_size=2, overflow_policy="drop")
+        for _ in range(5):
+            bus.publish(Event(type=EventType.CACHE_HIT, source="test", data={}))
+
+        stats = bus.get_stats()
+        assert stats["published"] == 5
+        assert stats["dropped"] == 3
+        assert stats["queue_depth"] == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy_keeps_latest_per_key(self):
+        """Pending events with the same key are replaced by newer ones."""
+        received = []
+        bus = EventBus(
+            max_queue_size=2,
+            overflow_policy="coalesce",
+            coalesce_key=lambda e: e.data["sensor"],
+        )
+        bus.subscribe(EventType.CACHE_HIT, received.append)
+
+        for sensor, value in [("a", 1), ("b", 1), ("a", 2), ("a", 3), ("b", 2)]:
+            bus.publish(
+                Event(type=EventType.CACHE_HIT, source="test", data={"sensor": sensor, "v": value})
+            )
+        assert bus.get_stats()["coalesced"] == 3
+
+        await _run_bus(bus, settle=0.2)
+        assert [(e.data["sensor"], e.data["v"]) for e in received] == [("a", 3), ("b", 2)]
+
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_space(self):
+        """publish_async waits for the dispatcher instead of dropping."""
+        received = []
+        bus = EventBus(max_queue_size=1, overflow_policy="block")
+        bus.subscribe(EventType.CACHE_HIT, received.append)
+        task = asyncio.create_task(bus.start())
+
+        for i in range(20):
+            await bus.publish_async(Event(type=EventType.CACHE_HIT, source="test", data={"i": i}))
+        await asyncio.sleep(0.1)
+        bus.stop()
+        await task
+
+        assert [e.data["i"] for e in received] == list(range(20))
+        assert bus.get_stats()["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_batched_delivery(self):
+        """Handlers opting into batching receive lists of events."""
+        batches = []
+        bus = EventBus()
+        bus.subscribe(EventType.ENTITY_LINKED, batches.append, batch_size=4)
+        for i in range(10):
+            bus.publish(Event(type=EventType.ENTITY_LINKED, source="test", data={"i": i}))
+
+        await _run_bus(bus)
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert [e.data["i"] for b in batches for e in b] == list(range(10))
+        assert bus.get_stats()["processed"] == 10
+
+    @pytest.mark.asyncio
+    async def test_indexed_filters_route_by_value(self):
+        """Filtered subscriptions only see events matching their criteria."""
+        seen: dict[str, list[Event]] = {"pos": [], "neg": [], "src": [], "any": []}
+        bus = EventBus()
+        bus.subscribe(EventType.SENTIMENT_ANALYZED, seen["pos"].append, {"sentiment": "positive"})
+        bus.subscribe(EventType.SENTIMENT_ANALYZED, seen["neg"].append, {"sentiment": "negative"})
+        bus.subscribe(EventType.SENTIMENT_ANALYZED, seen["src"].append, {"source": "api"})
+        bus.subscribe(EventType.SENTIMENT_ANALYZED, seen["any"].append, {"tags": ["a"]})
+        assert bus.get_subscriber_count(EventType.SENTIMENT_ANALYZED) == 4
+
+        bus.publish(Event(EventType.SENTIMENT_ANALYZED, "api", {"sentiment": "positive"}))
+        bus.publish(Event(EventType.SENTIMENT_ANALYZED, "cli", {"sentiment": "negative"}))
+        bus.publish(
+            Event(EventType.SENTIMENT_ANALYZED, "cli", {"sentiment": "positive", "tags": ["a"]})
+        )
+        bus.publish(Event(EventType.DOCUMENTS_CLUSTERED, "api", {"sentiment": "positive"}))
+        await _run_bus(bus)
+
+        assert len(seen["pos"]) == 2
+        assert len(seen["neg"]) == 1
+        assert [e.source for e in seen["src"]] == ["api"]
+        # Unindexable criteria are still honoured; events without the key match
+        assert len(seen["any"]) == 3
+
+        assert bus.unsubscribe(EventType.SENTIMENT_ANALYZED, seen["neg"].append)
+        assert bus.get_subscriber_count(EventType.SENTIMENT_ANALYZED) == 3
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_counted_and_histograms_reset(self):
+        """Failed invocations count as errors; reset clears histograms."""
+
+        def failing_handler(event: Event):
+            raise RuntimeError("boom")
+
+        bus = EventBus()
+        bus.subscribe(EventType.ERROR_OCCURRED, failing_handler)
+        bus.publish(Event(type=EventType.ERROR_OCCURRED, source="test", data={}))
+        await _run_bus(bus, settle=0.2)
+
+        stats = bus.get_stats()
+        assert stats["errors"] == 1
+        assert stats["processed"] == 0
+        assert stats["queue_depth_histogram"]["count"] == 1
+
+        bus.reset_stats()
+        stats = bus.get_stats()
+        assert stats["queue_depth_histogram"]["count"] == 0
+        assert stats["handler_latency_ms"] == {}
+
+    def test_invalid_configuration(self):
+        """Unknown policies and bad handler limits are rejected."""
+        with pytest.raises(ValueError):
+            EventBus(overflow_policy="spill")
+        with pytest.raises(ValueError):
+            EventHandler(lambda e: None, max_concurrency=0)
@@ -19,6 +19,7 @@ from gateway.graph_walk import (
     GraphWalkFAISS,
     GraphWalkKNNOps,
     GraphWalkProvider,
+    IVFIndex,
     KnowledgeEdge,
     KnowledgeNode,
     RetrievalResult,
@@ -225,6 +226,84 @@ def test_save_and_load_index(tmp_path):
     assert results[0].node.id == "a"
 
 
+# ============================================================================
+# GraphWalkKNNOps - IVF ANN backend
+# ============================================================================
+
+
+def _clustered_vectors(n: int, dim: int, centers: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    means = rng.normal(size=(centers, dim))
+    return (means[rng.integers(0, centers, n)] + 0.1 * rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def test_invalid_index_type_rejected():
+    with pytest.raises(ValueError):
+        GraphWalkKNNOps(index_type="hnsw")
+
+
+def test_ivf_search_matches_brute_force_on_clustered_data():
+    vectors = _clustered_vectors(2000, 16, centers=20)
+    flat = GraphWalkKNNOps(vector_size=16)
+    ivf = GraphWalkKNNOps(vector_size=16, index_type="ivf", nlist=20, nprobe=4)
+    for i, vec in enumerate(vectors):
+        flat.add_node(f"n{i}", content="", vector=vec.tolist())
+        ivf.add_node(f"n{i}", content="", vector=vec.tolist())
+
+    hits = 0
+    for q in vectors[:50]:
+        truth = {r.node.id for r in flat.knn_search_vector(q, k=10)}
+        approx = ivf.knn_search_vector(q, k=10)
+        assert [r.similarity for r in approx] == sorted(
+            (r.similarity for r in approx), reverse=True
+        )
+        hits += len(truth & {r.node.id for r in approx})
+    assert hits / 500 >= 0.9
+    assert ivf.get_stats()["ivf_lists"] == 20
+
+
+def test_incremental_insert_skips_rebuild():
+    vectors = _clustered_vectors(200, 8, centers=4)
+    knn = GraphWalkKNNOps(vector_size=8, index_type="ivf", nlist=4, nprobe=4)
+    for i, vec in enumerate(vectors):
+        knn.add_node(f"n{i}", content="", vector=vec.tolist())
+    knn.build_index()
+    centroids = knn._ann.centroids.copy()
+
+    knn.add_node("late", content="", vector=[5.0] * 8)
+    assert knn._indexed
+    assert knn.vector_matrix.shape[0] == 201
+    assert knn._ann.ntotal == 201
+    np.testing.assert_array_equal(knn._ann.centroids, centroids)
+    assert knn.knn_search_vector([5.0] * 8, k=1)[0].node.id == "late"
+
+    # Replacing an existing node falls back to a rebuild
+    knn.add_node("late", content="", vector=[-5.0] * 8)
+    assert not knn._indexed
+
+
+def test_ivf_save_and_load_reuses_quantizer(tmp_path):
+    vectors = _clustered_vectors(300, 8, centers=5)
+    knn = GraphWalkKNNOps(vector_size=8, index_type="ivf", nlist=5)
+    for i, vec in enumerate(vectors):
+        knn.add_node(f"n{i}", content=f"chunk {i}", vector=vec.tolist())
+    knn.build_index()
+
+    out = tmp_path / "idx.json"
+    knn.save_index(str(out))
+    assert (tmp_path / "idx.ivf.npz").exists()
+
+    with patch.object(IVFIndex, "train", side_effect=AssertionError("retrained")):
+        knn2 = GraphWalkKNNOps(vector_size=8, index_type="ivf")
+        knn2.load_index(str(out))
+
+    np.testing.assert_array_equal(knn2._ann.centroids, knn._ann.centroids)
+    query = vectors[7]
+    assert [r.node.id for r in knn2.knn_search_vector(query, k=5)] == [
+        r.node.id for r in knn.knn_search_vector(query, k=5)
+    ]
+
+
 # ============================================================================
 # GraphWalkKNNOps - stats and helpers
 # ============================================================================
@@ -258,6 +337,50 @@ def test_text_to_vector():
     assert all(isinstance(x, float) for x in vec)
 
 
+def test_texts_to_matrix_matches_single_text_featurization():
+    knn = GraphWalkKNNOps(vector_size=32)
+    texts = ["Forensic analysis", "", "naïve café 日本語", "  spaced\tout  words "]
+    matrix = knn.texts_to_matrix(texts)
+    assert matrix.shape == (4, 32)
+    assert matrix.dtype == np.float32
+    for text, row in zip(texts, matrix, strict=True):
+        np.testing.assert_allclose(row, knn._text_to_vector(text), rtol=1e-6)
+    np.testing.assert_allclose(matrix[0].sum(), 1.0, rtol=1e-5)
+    assert not matrix[1].any()
+
+
+def test_text_to_vector_is_stable_across_processes():
+    """Vectors must not depend on PYTHONHASHSEED, or saved indexes break on restart."""
+    import os
+    import subprocess
+
+    code = (
+        "from gateway.graph_walk import GraphWalkKNNOps;"
+        "print(GraphWalkKNNOps(vector_size=16)._text_to_vector('forensic analysis'))"
+    )
+    root = str(Path(__file__).parent.parent.absolute())
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=root,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            check=True,
+        )
+        .stdout.strip()
+        .splitlines()[-1]
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
+
+
+def test_hash_seed_changes_buckets():
+    a = GraphWalkKNNOps(vector_size=64)._text_to_vector("forensic analysis")
+    b = GraphWalkKNNOps(vector_size=64, hash_seed=7)._text_to_vector("forensic analysis")
+    assert a != b
+
+
 # ============================================================================
 # GraphWalkProvider wrapper
 # ============================================================================
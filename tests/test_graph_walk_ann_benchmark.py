@@ -0,0 +1,71 @@
+"""
+Graph Walk ANN Benchmark
+========================
+Compares recall@k and query latency of the pure-NumPy IVF backend against the
+brute-force flat backend of GraphWalkKNNOps on synthetic clustered embeddings.
+
+Runs at 100k nodes by default; set SME_ANN_BENCH_NODES (comma separated) to
+sweep larger graphs, e.g. SME_ANN_BENCH_NODES=100000,1000000.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from gateway.graph_walk import GraphWalkKNNOps
+
+BENCH_SIZES = [int(n) for n in os.environ.get("SME_ANN_BENCH_NODES", "100000").split(",")]
+VECTOR_SIZE = 128
+NUM_QUERIES = 100
+K = 10
+
+
+def _build(index_type: str, vectors: np.ndarray) -> tuple[GraphWalkKNNOps, float]:
+    knn = GraphWalkKNNOps(vector_size=VECTOR_SIZE, index_type=index_type)
+    for i, vec in enumerate(vectors):
+        knn.add_node(f"n{i}", content="", vector=vec.tolist())
+    t0 = time.perf_counter()
+    knn.build_index()
+    return knn, time.perf_counter() - t0
+
+
+def _timed_queries(knn: GraphWalkKNNOps, queries: np.ndarray) -> tuple[list[set[str]], float]:
+    ids = []
+    t0 = time.perf_counter()
+    for q in queries:
+        ids.append({r.node.id for r in knn.knn_search_vector(q, k=K)})
+    return ids, (time.perf_counter() - t0) / len(queries)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("num_nodes", BENCH_SIZES)
+def test_ivf_recall_and_latency_vs_brute_force(num_nodes: int):
+    rng = np.random.default_rng(42)
+    centers = rng.normal(size=(max(64, num_nodes // 1000), VECTOR_SIZE))
+    labels = rng.integers(0, len(centers), num_nodes)
+    vectors = (centers[labels] + 0.3 * rng.normal(size=(num_nodes, VECTOR_SIZE))).astype(np.float32)
+    queries = vectors[rng.choice(num_nodes, NUM_QUERIES, replace=False)] + 0.05 * rng.normal(
+        size=(NUM_QUERIES, VECTOR_SIZE)
+    ).astype(np.float32)
+
+    flat, flat_build = _build("flat", vectors)
+    ivf, ivf_build = _build("ivf", vectors)
+
+    truth, flat_latency = _timed_queries(flat, queries)
+    approx, ivf_latency = _timed_queries(ivf, queries)
+    recall = sum(len(t & a) for t, a in zip(truth, approx, strict=True)) / (NUM_QUERIES * K)
+
+    print(f"\n--- Graph Walk ANN Benchmark ({num_nodes} nodes, d={VECTOR_SIZE}) ---")
+    print(f"Build -> flat: {flat_build:.2f}s | ivf: {ivf_build:.2f}s (nlist={ivf._ann.nlist})")
+    print(
+        f"Query -> flat: {flat_latency * 1000:.2f}ms | ivf: {ivf_latency * 1000:.2f}ms "
+        f"(nprobe={ivf._ann.nprobe})"
+    )
+    print(f"Recall@{K}: {recall:.3f} | Speedup: {flat_latency / ivf_latency:.1f}x")
+
+    assert recall >= 0.9
+    assert ivf_latency < flat_latency
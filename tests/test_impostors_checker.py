@@ -0,0 +1,66 @@
+import sqlite3
+from collections import Counter
+
+import pytest
+
+from src.scribe.impostors_checker import ImpostorsChecker
+
+
+def _checker(tmp_path, authors, seed=None):
+    db_path = tmp_path / "scribe.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE author_profiles (author_id TEXT PRIMARY KEY)")
+        conn.executemany("INSERT INTO author_profiles VALUES (?)", [(a,) for a in authors])
+    return ImpostorsChecker(db_path=str(db_path), seed=seed)
+
+
+def _text_for(checker, author_id):
+    vocab = checker._get_author_vocabulary(author_id)
+    return " ".join(Counter(vocab).elements())
+
+
+def test_verify_authorship_is_reproducible_with_seed(tmp_path):
+    checker = _checker(tmp_path, [f"author_{i}" for i in range(12)])
+    text = _text_for(checker, "author_0") + " " + _text_for(checker, "author_5")
+
+    first = checker.verify_authorship(text, "author_0", iterations=300, mfw_size=40, seed=11)
+    second = checker.verify_authorship(text, "author_0", iterations=300, mfw_size=40, seed=11)
+
+    assert first == second
+    assert first["iterations"] == 300
+    assert first["impostor_count"] == 10
+    assert 0 < first["suspect_wins"] < 300
+
+
+def test_verify_authorship_separates_true_author_from_impostor(tmp_path):
+    checker = _checker(tmp_path, [f"author_{i}" for i in range(60)], seed=3)
+    text = _text_for(checker, "author_7")
+
+    genuine = checker.verify_authorship(text, "author_7", iterations=1000, impostor_count=50)
+    assert genuine["verified"] is True
+    assert genuine["confidence"] > 0.5
+
+    # author_7 sits in the impostor pool, so a wrong suspect never wins
+    wrong = checker.verify_authorship(text, "author_59", iterations=1000, impostor_count=50)
+    assert wrong["verified"] is False
+    assert wrong["confidence"] == 0.0
+
+
+def test_verify_authorship_batch_scores_each_suspect(tmp_path):
+    checker = _checker(tmp_path, [f"author_{i}" for i in range(20)])
+    text = _text_for(checker, "author_2")
+
+    results = checker.verify_authorship_batch(
+        text, ["author_2", "author_3", "author_2"], iterations=200, seed=5
+    )
+
+    assert list(results) == ["author_2", "author_3"]
+    assert results["author_2"]["verdict"] == "Verified"
+    assert results["author_3"]["verdict"] == "External Author Likely"
+    assert all(r["impostor_count"] == 10 for r in results.values())
+    assert results == checker.verify_authorship_batch(
+        text, ["author_2", "author_3"], iterations=200, seed=5
+    )
+
+    with pytest.raises(ValueError):
+        checker.verify_authorship_batch(text, ["author_2"], iterations=0)
@@ -101,3 +101,80 @@ def test_nexus_singleton():
     a = get_nexus()
     b = get_nexus()
     assert a is b
+
+
+def test_nexus_concurrent_writes_are_group_committed(tmp_path):
+    import threading
+
+    nexus = ForensicNexus(base_dir=str(tmp_path), pool_size=4)
+    nexus.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, worker INTEGER)")
+
+    errors = []
+
+    def writer(worker):
+        for i in range(50):
+            try:
+                nexus.execute("INSERT INTO events VALUES (?, ?)", (worker * 1000 + i, worker))
+            except Exception as e:  # pragma: no cover - surfaced by the assert below
+                errors.append(e)
+        # A failing statement only affects its own caller
+        with pytest.raises(sqlite3.IntegrityError):
+            nexus.execute("INSERT INTO events VALUES (?, ?)", (worker * 1000, worker))
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert nexus.query("SELECT COUNT(*) AS n FROM events")[0]["n"] == 400
+    writer_stats = nexus.get_status()["pool"]["writer"]
+    assert writer_stats["writes"] == 1 + 400 + 8 + 3  # DDL + inserts + failures + indexes
+    assert writer_stats["group_commits"] <= writer_stats["writes"]
+    assert writer_stats["pending"] == 0
+
+
+def test_nexus_readers_run_in_parallel_and_report_pool_metrics(tmp_path):
+    import threading
+
+    nexus = ForensicNexus(base_dir=str(tmp_path), pool_size=3)
+    barrier = threading.Barrier(3, timeout=5)
+    held = []
+    rows = []
+
+    def reader():
+        with nexus._reader() as conn:
+            barrier.wait()  # all three readers hold a connection at once
+            held.append(id(conn))
+        rows.extend(nexus.query("SELECT 1 AS n"))
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(set(held)) == 3
+    assert rows == [{"n": 1}] * 3
+    pool = nexus.get_status()["pool"]["readers"]
+    assert pool["size"] == 3
+    assert pool["open"] == 3
+    assert pool["in_use"] == 0
+    assert pool["checkouts"] >= 6
+    assert pool["wait_max_ms"] >= 0.0
+
+
+def test_nexus_attach_db_is_visible_to_pooled_readers(tmp_path):
+    nexus = ForensicNexus(base_dir=str(tmp_path), pool_size=2)
+    assert nexus.query("SELECT 1 AS ok")[0]["ok"] == 1  # warm a reader first
+
+    extra = tmp_path / "extra.db"
+    with sqlite3.connect(extra) as conn:
+        conn.execute("CREATE TABLE notes (body TEXT)")
+        conn.execute("INSERT INTO notes VALUES ('attached later')")
+    nexus.attach_db(str(extra), "extra")
+
+    assert nexus.query("SELECT body FROM extra.notes") == [{"body": "attached later"}]
+    attached_names = [row["name"] for row in nexus.get_status()["attached"]]
+    assert "extra" in attached_names
@@ -12,6 +12,7 @@ Test Coverage:
 - Integration (5+ test cases)
 """
 
+import numpy as np
 import pytest
 
 from src.core.document_clusterer import (
@@ -520,6 +521,102 @@ class TestDocumentClustererSimilarity:
         assert all(isinstance(item, tuple) for item in similar)
 
 
+def _topic_corpus(per_topic: int = 12) -> tuple[list[str], list[int]]:
+    """Documents drawn from three disjoint vocabularies."""
+    topics = [
+        ["galaxy", "planet", "orbit", "telescope", "comet", "nebula"],
+        ["recipe", "flour", "oven", "butter", "dough", "sugar"],
+        ["striker", "goalkeeper", "penalty", "referee", "stadium", "league"],
+    ]
+    docs, truth = [], []
+    for i in range(per_topic):
+        for t, words in enumerate(topics):
+            picked = [words[(i + j) % len(words)] for j in range(4)]
+            docs.append(" ".join(picked))
+            truth.append(t)
+    return docs, truth
+
+
+def _same_partition(assignments: dict[str, int], truth: list[int]) -> bool:
+    pairs = {(assignments[str(i)], t) for i, t in enumerate(truth)}
+    return len(pairs) == len(set(truth)) == len({a for a, _ in pairs})
+
+
+class TestDocumentClustererEngines:
+    """Sparse-matrix clustering engines."""
+
+    def test_vectorize_matrix_is_normalised_csr(self):
+        """TF-IDF rows are unit length and capped at max_features."""
+        clusterer = DocumentClusterer(max_features=5)
+        docs, _ = _topic_corpus(2)
+        matrix, vocabulary = clusterer._vectorize_matrix(docs)
+
+        assert matrix.shape == (len(docs), 5)
+        assert len(vocabulary) == 5
+        norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A.ravel()
+        assert np.all((np.abs(norms - 1.0) < 1e-9) | (norms == 0))
+
+    @pytest.mark.parametrize(
+        "algorithm", [ClusteringAlgorithm.KMEANS, ClusteringAlgorithm.HIERARCHICAL]
+    )
+    def test_engines_recover_topics(self, algorithm):
+        """K-means++ and Ward both separate disjoint topics."""
+        clusterer = DocumentClusterer(random_state=0)
+        docs, truth = _topic_corpus()
+        result = clusterer.cluster(docs, num_clusters=3, algorithm=algorithm)
+
+        assert _same_partition(result.document_assignments, truth)
+        assert result.silhouette_score > 0.5
+        assert all(0.0 < m.similarity <= 1.0 + 1e-9 for c in result.clusters for m in c.members)
+
+    def test_mini_batch_kmeans_is_seeded(self):
+        """Mini-batch mode is deterministic for a fixed random_state."""
+        docs, truth = _topic_corpus()
+        runs = [
+            DocumentClusterer(random_state=7, mini_batch_threshold=1).cluster(docs, 3)
+            for _ in range(2)
+        ]
+
+        assert runs[0].document_assignments == runs[1].document_assignments
+        assert _same_partition(runs[0].document_assignments, truth)
+
+    def test_ward_matches_scipy_linkage(self):
+        """Nearest-neighbour-chain Ward cut matches scipy's Ward dendrogram."""
+        from scipy.cluster.hierarchy import fcluster, linkage
+
+        points = np.random.default_rng(3).normal(size=(60, 4))
+        ours = DocumentClusterer._ward_labels(points @ points.T, np.ones(60), 5)
+        reference = fcluster(linkage(points, "ward"), 5, "maxclust")
+
+        assert len(set(zip(ours, reference, strict=True))) == 5
+
+    def test_hierarchical_uses_micro_clusters_for_large_corpora(self, monkeypatch):
+        """Above the exact limit Ward merges weighted k-means micro-clusters."""
+        import src.core.document_clusterer as module
+
+        monkeypatch.setattr(module, "AGGLOMERATIVE_EXACT_LIMIT", 10)
+        monkeypatch.setattr(module, "AGGLOMERATIVE_MICRO_CLUSTERS", 9)
+        docs, truth = _topic_corpus()
+        result = DocumentClusterer(random_state=0).cluster(
+            docs, num_clusters=3, algorithm=ClusteringAlgorithm.HIERARCHICAL
+        )
+
+        assert _same_partition(result.document_assignments, truth)
+
+    def test_density_clustering_marks_noise(self):
+        """DBSCAN finds the dense topics and leaves outliers unassigned."""
+        docs, truth = _topic_corpus()
+        docs.append("quantum entanglement superposition")
+        result = DocumentClusterer(dbscan_eps=0.8).cluster(
+            docs, algorithm=ClusteringAlgorithm.DENSITY_BASED
+        )
+
+        assert result.num_clusters == 3
+        assert result.document_assignments[str(len(docs) - 1)] == -1
+        del result.document_assignments[str(len(docs) - 1)]
+        assert _same_partition(result.document_assignments, truth)
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
@@ -0,0 +1,98 @@
+"""
+Tests for src/query/engine.py - FTS5-backed SemanticSearchEngine.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from src.query import engine as engine_module
+from src.query.engine import SemanticSearchEngine
+
+
+@pytest.fixture
+def sentiment_db(tmp_path):
+    db_path = str(tmp_path / "laboratory.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE sentiment_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            source_file TEXT,
+            neg REAL,
+            neu REAL,
+            pos REAL,
+            compound REAL
+        )
+    """)
+    rows = [(f"filler_report_{i}.txt", 0.1, 0.8, 0.1, 0.0) for i in range(500)]
+    rows += [
+        ("acme_corporation_q3_earnings.txt", 0.0, 0.5, 0.5, 0.6),
+        ("acme_corporation_q4_earnings.txt", 0.2, 0.6, 0.2, -0.1),
+        ("globex_merger_speech.txt", 0.1, 0.7, 0.2, 0.3),
+    ]
+    conn.executemany(
+        "INSERT INTO sentiment_logs (source_file, neg, neu, pos, compound) VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+    yield db_path
+    engine_module.close_pooled_connections()
+
+
+def test_semantic_search_ranks_full_history_with_bm25(sentiment_db):
+    engine = SemanticSearchEngine(sentiment_db)
+    # The acme rows are older than the 100 most recent rows the old scan looked at
+    results = engine.semantic_search("acme earnings q3", top_k=5)
+    assert [r["source"] for r in results[:2]] == [
+        "acme_corporation_q3_earnings.txt",
+        "acme_corporation_q4_earnings.txt",
+    ]
+    assert results[0]["similarity_score"] == 1.0
+    assert 0 < results[1]["similarity_score"] < 1.0
+    assert results[0]["sentiment"]["compound"] == 0.6
+
+
+def test_semantic_search_handles_fts_syntax_in_query(sentiment_db):
+    engine = SemanticSearchEngine(sentiment_db)
+    assert engine.semantic_search('globex" OR NEAR(', top_k=3)[0]["source"] == (
+        "globex_merger_speech.txt"
+    )
+    assert len(engine.semantic_search("!!!", top_k=3)) == 3
+
+
+def test_entity_search_phrase_and_prefix(sentiment_db):
+    engine = SemanticSearchEngine(sentiment_db)
+    profile = engine.entity_search("acme corp")
+    assert profile["unique_sources"] == 2
+    assert profile["total_mentions"] == 2
+    assert engine.entity_search("corporation acme")["unique_sources"] == 0
+
+
+def test_index_tracks_inserts_and_deletes(sentiment_db):
+    engine = SemanticSearchEngine(sentiment_db)
+    assert engine.entity_search("initech")["unique_sources"] == 0
+
+    conn = sqlite3.connect(sentiment_db)
+    conn.execute(
+        "INSERT INTO sentiment_logs (source_file, neg, neu, pos, compound) "
+        "VALUES ('initech_tps_memo.txt', 0.5, 0.5, 0.0, -0.7)"
+    )
+    conn.commit()
+    assert engine.entity_search("initech")["unique_sources"] == 1
+
+    conn.execute("DELETE FROM sentiment_logs WHERE source_file LIKE 'initech%'")
+    conn.commit()
+    conn.close()
+    assert engine.entity_search("initech")["unique_sources"] == 0
+
+
+def test_connection_is_reused_across_calls(sentiment_db):
+    first = SemanticSearchEngine(sentiment_db)._connection()[0]
+    second = SemanticSearchEngine(sentiment_db)._connection()[0]
+    assert first is second
@@ -1,3 +1,7 @@
+import numpy as np
+import pytest
+
+from src.scribe.pystyl_wrapper import PyStylWrapper
 from src.scribe.rolling_delta import RollingDelta
 
 
@@ -16,21 +20,58 @@ def test_generate_windows_yields_token_windows():
     assert windows[0][1] == "one two three four five"
 
 
-def test_analyze_rolling_delta_uses_injected_pystyl():
+def test_analyze_rolling_delta_matches_pystyl_chi_squared():
+    analyzer = RollingDelta.__new__(RollingDelta)
+    analyzer.pystyl = FakePyStyl()
+    text = "One two three two one four five one two"
+    candidates = {"alpha": "one two two alpha", "bravo": "five four bravo bravo"}
+
+    result = analyzer.analyze_rolling_delta(text, candidates, window_size=3, step=1)
+
+    # With fewer words than top_n the fixed feature set covers every pair
+    # vocabulary, so distances equal PyStyl's pairwise Chi-squared.
+    reference = PyStylWrapper()
+    tokens = text.split()
+    assert result["windows"] == list(range(len(tokens) - 2))
+    for author, ref_text in candidates.items():
+        expected = [
+            reference.compare_texts(" ".join(tokens[i : i + 3]), ref_text)
+            for i in result["windows"]
+        ]
+        assert result["series"][author] == pytest.approx(expected)
+        assert result["volatility"][author] == pytest.approx(np.std(expected))
+
+
+def test_sliding_counts_match_recounted_windows():
+    analyzer = RollingDelta.__new__(RollingDelta)
+    rng = np.random.default_rng(0)
+    feature_ids = rng.integers(0, 6, size=103)  # 5 features + spill bin
+
+    for window_size, step in [(10, 3), (10, 10), (10, 17), (200, 5)]:
+        windows = [
+            (start, counts.copy(), length)
+            for start, counts, length in analyzer._sliding_counts(feature_ids, 5, window_size, step)
+        ]
+        starts = [start for start, _, _ in windows]
+        expected_starts = list(range(0, len(feature_ids) - window_size + 1, step)) or [0]
+        assert starts == expected_starts
+        for start, counts, length in windows:
+            window = feature_ids[start : start + length]
+            assert length == len(window)
+            assert counts.tolist() == np.bincount(window, minlength=6)[:5].tolist()
+
+
+def test_analyze_rolling_delta_marks_empty_reference_as_infinite():
     analyzer = RollingDelta.__new__(RollingDelta)
     analyzer.pystyl = FakePyStyl()
 
     result = analyzer.analyze_rolling_delta(
-        "one two three four five six seven",
-        {"alpha": "alpha beta", "bravo": "bravo"},
-        window_size=3,
-        step=1,
+        "alpha beta gamma", {"blank": "...", "alpha": "alpha"}, window_size=5
     )
 
-    assert result["windows"] == [0, 1, 2, 3, 4]
-    assert result["series"]["alpha"] == [5, 5, 5, 5, 5]
-    assert result["series"]["bravo"] == [4, 4, 4, 4, 4]
-    assert result["volatility"]["alpha"] == 0.0
+    assert result["windows"] == [0]
+    assert result["series"]["blank"] == [float("inf")]
+    assert result["series"]["alpha"][0] < float("inf")
 
 
 def test_analyze_rolling_delta_returns_errors_for_missing_inputs():
@@ -1,8 +1,9 @@
 import sqlite3
 
+import numpy as np
 import pytest
 
-from src.scribe.engine import ScribeEngine
+from src.scribe.engine import LinguisticFingerprint, ScribeEngine
 
 
 def test_extract_linguistic_fingerprint_counts_core_features(tmp_path):
@@ -54,3 +55,73 @@ def test_save_author_profile_uses_temporary_database(tmp_path):
     with sqlite3.connect(db_path) as conn:
         count = conn.execute("SELECT COUNT(*) FROM author_profiles").fetchone()[0]
     assert count == 1
+
+
+def _random_fingerprint(rng, author_id=None, dim=100):
+    vector = rng.random(dim)
+    return LinguisticFingerprint(
+        author_id=author_id,
+        avg_sentence_length=float(rng.uniform(5, 30)),
+        avg_word_length=float(rng.uniform(3, 7)),
+        type_token_ratio=float(rng.uniform(0.3, 0.9)),
+        passive_voice_ratio=float(rng.choice([0.0, rng.uniform(0, 0.3)])),
+        signal_vector=(vector / np.linalg.norm(vector)).tolist(),
+    )
+
+
+def test_compare_many_matches_pairwise_scores(tmp_path):
+    engine = ScribeEngine(
+        db_path=str(tmp_path / "scribe.sqlite"),
+        centrifuge_path=str(tmp_path / "centrifuge.sqlite"),
+    )
+    rng = np.random.default_rng(7)
+    profiles = [_random_fingerprint(rng, f"author_{i}", dim=80 + i) for i in range(40)]
+    for fp in profiles:
+        engine.save_author_profile(fp, fp.author_id.title())
+    unknowns = [_random_fingerprint(rng) for _ in range(5)] + [profiles[3]]
+
+    results = engine.compare_many(unknowns, min_confidence=0.0, top_k=7)
+
+    assert len(results) == len(unknowns)
+    for fp, matches in zip(unknowns, results, strict=True):
+        expected = sorted(
+            (
+                (
+                    engine._calculate_signal_similarity(fp.signal_vector, p.signal_vector) * 0.7
+                    + engine._compare_linguistic_metrics(fp, p) * 0.3
+                )
+                * 100,
+                p.author_id,
+            )
+            for p in profiles
+        )[::-1][:7]
+        assert [m.author_id for m in matches] == [author for _, author in expected]
+        assert [m.confidence_score for m in matches] == pytest.approx(
+            [score for score, _ in expected], abs=1e-3
+        )
+    assert results[-1][0].author_id == "author_3"
+    assert results[-1][0].author_name == "Author_3"
+    assert results[-1][0].confidence_score == pytest.approx(100.0, abs=1e-3)
+    assert engine.compare_to_profiles(unknowns[-1], min_confidence=99.0)[0].author_id == "author_3"
+
+
+def test_profile_matrix_tracks_profile_changes(tmp_path):
+    db_path = tmp_path / "scribe.sqlite"
+    engine = ScribeEngine(db_path=str(db_path), centrifuge_path=str(tmp_path / "centrifuge.sqlite"))
+    rng = np.random.default_rng(3)
+    first = _random_fingerprint(rng, "first")
+    engine.save_author_profile(first, "First")
+
+    assert [m.author_id for m in engine.compare_to_profiles(first, min_confidence=0.0)] == ["first"]
+    matrix = engine._get_profile_matrix()
+    assert engine._get_profile_matrix() is matrix
+    assert matrix.signals.dtype == np.float32
+
+    # A second engine writing to the same database must be picked up as well
+    other = ScribeEngine(db_path=str(db_path), centrifuge_path=str(tmp_path / "centrifuge.sqlite"))
+    other.save_author_profile(_random_fingerprint(rng, "second"), "Second")
+
+    matches = engine.compare_to_profiles(first, min_confidence=0.0)
+    assert {m.author_id for m in matches} == {"first", "second"}
+    assert engine._get_profile_matrix() is not matrix
+    assert engine.compare_many([first], top_k=0) == [[]]
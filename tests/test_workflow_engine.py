@@ -0,0 +1,204 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from src.orchestration.workflow_engine import WorkflowEngine
+
+
+def _engine(tmp_path, **kwargs):
+    return WorkflowEngine(db_path=str(tmp_path / "workflows.sqlite"), **kwargs)
+
+
+def _square(value):
+    return {"result": value * value}
+
+
+@pytest.mark.asyncio
+async def test_parallel_workflow_starts_steps_as_soon_as_dependencies_finish(tmp_path):
+    engine = _engine(tmp_path)
+    started = {}
+
+    async def slow(label, delay):
+        started[label] = time.monotonic()
+        await asyncio.sleep(delay)
+        return {"result": label}
+
+    engine.register_step("slow", slow)
+    workflow = engine.create_workflow(
+        "dag",
+        steps=[
+            {
+                "id": "long",
+                "name": "long",
+                "handler": "slow",
+                "params": {"label": "long", "delay": 0.3},
+            },
+            {"id": "a", "name": "a", "handler": "slow", "params": {"label": "a", "delay": 0.05}},
+            {
+                "id": "b",
+                "name": "b",
+                "handler": "slow",
+                "params": {"label": "b", "delay": 0.05},
+                "depends_on": ["a"],
+            },
+        ],
+        parallel=True,
+    )
+
+    t0 = time.monotonic()
+    outcome = await engine.execute(workflow, {})
+
+    assert outcome["status"] == "completed"
+    assert set(outcome["result"]) == {"long", "a", "b"}
+    # "b" must not wait for the unrelated long-running step
+    assert started["b"] - t0 < 0.2
+
+
+@pytest.mark.asyncio
+async def test_global_and_step_type_concurrency_limits(tmp_path):
+    engine = _engine(tmp_path, max_concurrency=3, step_type_limits={"fetch": 1})
+    active = {"fetch": 0, "parse": 0}
+    peak = {"fetch": 0, "parse": 0, "total": 0}
+
+    def make(kind):
+        async def handler():
+            active[kind] += 1
+            peak[kind] = max(peak[kind], active[kind])
+            peak["total"] = max(peak["total"], sum(active.values()))
+            await asyncio.sleep(0.02)
+            active[kind] -= 1
+            return {"result": kind}
+
+        return handler
+
+    engine.register_step("fetch", make("fetch"))
+    engine.register_step("parse", make("parse"))
+    steps = [{"id": f"f{i}", "name": f"f{i}", "handler": "fetch"} for i in range(4)]
+    steps += [{"id": f"p{i}", "name": f"p{i}", "handler": "parse"} for i in range(6)]
+    workflow = engine.create_workflow("limits", steps=steps, parallel=True)
+
+    outcome = await engine.execute(workflow, {})
+
+    assert outcome["status"] == "completed"
+    assert peak["fetch"] == 1
+    assert peak["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_steps_run_on_the_cpu_executor(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cpu-test")
+    engine = _engine(tmp_path, cpu_executor=executor)
+    seen = []
+
+    def crunch():
+        import threading
+
+        seen.append(threading.current_thread().name)
+        return {"result": 42}
+
+    engine.register_step("crunch", crunch, cpu_bound=True)
+    workflow = engine.create_workflow(
+        "cpu", steps=[{"id": "c", "name": "c", "handler": "crunch"}], parallel=True
+    )
+
+    outcome = await engine.execute(workflow, {})
+    executor.shutdown()
+
+    assert outcome["result"]["c"] == {"result": 42}
+    assert seen[0].startswith("cpu-test")
+
+
+@pytest.mark.asyncio
+async def test_failed_run_resumes_from_checkpoints(tmp_path):
+    engine = _engine(tmp_path)
+    calls = {"square": 0, "flaky": 0}
+    broken = {"flag": True}
+
+    def square(value):
+        calls["square"] += 1
+        return _square(value)
+
+    def flaky(value):
+        calls["flaky"] += 1
+        if broken["flag"]:
+            raise RuntimeError("worker crashed")
+        return {"result": value + 1}
+
+    engine.register_step("square", square)
+    engine.register_step("flaky", flaky)
+    workflow = engine.create_workflow(
+        "resumable",
+        steps=[
+            {"id": "sq", "name": "sq", "handler": "square", "params": {"value": 3}},
+            {
+                "id": "inc",
+                "name": "inc",
+                "handler": "flaky",
+                "params": {"value": "$sq"},
+                "depends_on": ["sq"],
+                "retry": 2,
+            },
+        ],
+        parallel=True,
+    )
+
+    failed = await engine.execute(workflow, {"topic": "x"})
+    assert failed["status"] == "failed"
+    assert calls == {"square": 1, "flaky": 3}  # one try plus two retries
+
+    broken["flag"] = False
+    resumed = await engine.resume(failed["run_id"])
+
+    assert resumed["status"] == "completed"
+    assert resumed["run_id"] == failed["run_id"]
+    assert resumed["result"] == {"sq": {"result": 9}, "inc": {"result": 10}}
+    assert calls["square"] == 1  # restored from checkpoint, not re-run
+
+    with sqlite3.connect(tmp_path / "workflows.sqlite") as conn:
+        rows = conn.execute(
+            "SELECT step_id, status FROM workflow_steps WHERE run_id = ? ORDER BY step_order",
+            (failed["run_id"],),
+        ).fetchall()
+    assert rows == [
+        (f"{failed['run_id']}:sq", "completed"),
+        (f"{failed['run_id']}:inc", "completed"),
+    ]
+
+    again = await engine.resume(failed["run_id"])
+    assert again["status"] == "completed"
+    assert again["result"] == resumed["result"]
+
+
+@pytest.mark.asyncio
+async def test_blocked_parallel_workflow_fails(tmp_path):
+    engine = _engine(tmp_path)
+    engine.register_step("square", _square)
+    workflow = engine.create_workflow(
+        "cycle",
+        steps=[
+            {
+                "id": "a",
+                "name": "a",
+                "handler": "square",
+                "params": {"value": 1},
+                "depends_on": ["b"],
+            },
+            {
+                "id": "b",
+                "name": "b",
+                "handler": "square",
+                "params": {"value": 2},
+                "depends_on": ["a"],
+            },
+        ],
+        parallel=True,
+    )
+
+    outcome = await engine.execute(workflow, {})
+
+    assert outcome["status"] == "failed"
+    assert "Circular dependency" in outcome["error"]